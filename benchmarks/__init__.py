@@ -0,0 +1,3 @@
+"""
+Performans ölçüm betikleri
+"""
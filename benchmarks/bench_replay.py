@@ -0,0 +1,108 @@
+"""Deneyim hafızası örnekleme maliyetini kapasiteye göre ölçer.
+
+Kullanım (proje kök dizininden):
+    python -m benchmarks.bench_replay --capacities 10000 100000 1000000
+"""
+import argparse
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.ai_mode.replay_buffer import NStepAccumulator, ReplayBuffer, PrioritizedReplayBuffer
+
+def fill(buffer: ReplayBuffer, rng: np.random.Generator, chunk: int = 65536) -> None:
+    """Hafızayı rastgele deneyimlerle tamamen doldurur"""
+    remaining = buffer.capacity
+    while remaining > 0:
+        n = min(chunk, remaining)
+        buffer.add_batch(
+            rng.random((n, buffer.state_size), dtype=np.float32),
+            rng.integers(0, 4, n),
+            rng.choice(np.array([-10.0, -0.1, 0.1, 10.0], dtype=np.float32), n),
+            rng.random((n, buffer.state_size), dtype=np.float32),
+            rng.random(n) < 0.01,
+            0.95
+        )
+        remaining -= n
+
+def time_sampling(buffer: ReplayBuffer, batch_size: int, repeats: int,
+                  rng: np.random.Generator) -> float:
+    """Bir batch örnekleme (ve öncelikliyse öncelik güncelleme) süresini µs olarak döndürür"""
+    prioritized = isinstance(buffer, PrioritizedReplayBuffer)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        batch = buffer.sample(batch_size)
+        if prioritized:
+            buffer.update_priorities(batch[-1], rng.random(batch_size) * 10)
+    return (time.perf_counter() - start) / repeats * 1e6
+
+@contextmanager
+def sampling(cls, capacity: int, batch_size: int = 64, state_size: int = 12, seed: int = 0):
+    """Ölçüm paketi senaryosu: dolu hafızadan bir batch örnekleme"""
+    rng = np.random.default_rng(seed)
+    buffer = cls(capacity, state_size, seed=seed)
+    fill(buffer, rng)
+    prioritized = isinstance(buffer, PrioritizedReplayBuffer)
+
+    def step():
+        batch = buffer.sample(batch_size)
+        if prioritized:
+            buffer.update_priorities(batch[-1], rng.random(batch_size) * 10)
+
+    yield step
+
+@contextmanager
+def n_step_insert(n: int, num_envs: int = 64, state_size: int = 12, seed: int = 0):
+    """Ölçüm paketi senaryosu: bir vektör adımını n adımlık geçişlere çevirip hafızaya ekleme"""
+    rng = np.random.default_rng(seed)
+    buffer = ReplayBuffer(100000, state_size, seed=seed)
+    accumulator = NStepAccumulator(num_envs, n, 0.95, state_size)
+    states = rng.random((num_envs, state_size), dtype=np.float32)
+    actions = rng.integers(0, 4, num_envs)
+    rewards = rng.choice(np.array([-10.0, -0.1, 0.1, 10.0], dtype=np.float32), num_envs)
+    dones = rng.random((256, num_envs)) < 0.01  # Bölüm sonları adımdan adıma değişsin
+    counter = [0]
+
+    def step():
+        counter[0] += 1
+        buffer.add_batch(*accumulator.add(states, actions, rewards, states,
+                                          dones[counter[0] % len(dones)]))
+
+    yield step
+
+def cases() -> Dict:
+    """`benchmarks.run` paketine katılan senaryolar"""
+    cases = {
+        f'replay_sample/{name}/capacity={capacity}': partial(sampling, cls, capacity)
+        for capacity in (10000, 1000000)
+        for name, cls in (('uniform', ReplayBuffer), ('prioritized', PrioritizedReplayBuffer))
+    }
+    for n in (1, 3, 5):
+        cases[f'replay_insert/n_step={n}/envs=64'] = partial(n_step_insert, n)
+    return cases
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Deneyim hafızası örnekleme ölçümü")
+    parser.add_argument('--capacities', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--repeats', type=int, default=2000)
+    parser.add_argument('--state-size', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'kapasite':>10} | {'düzgün (µs)':>12} | {'öncelikli (µs)':>15}")
+    for capacity in args.capacities:
+        results = []
+        for cls in (ReplayBuffer, PrioritizedReplayBuffer):
+            rng = np.random.default_rng(args.seed)
+            buffer = cls(capacity, args.state_size, seed=args.seed)
+            fill(buffer, rng)
+            time_sampling(buffer, args.batch_size, 50, rng)  # Isınma
+            results.append(time_sampling(buffer, args.batch_size, args.repeats, rng))
+        print(f"{capacity:>10} | {results[0]:>12.1f} | {results[1]:>15.1f}")
+
+if __name__ == '__main__':
+    main()
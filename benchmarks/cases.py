@@ -0,0 +1,192 @@
+"""Oyun motoru, ajan ve çizim senaryoları.
+
+Uzun yılan senaryoları tahtayı dolaşan bir Hamilton döngüsü üzerinde
+kurulur: yılan döngüyü izlediği için hiç çarpışmadan istenen uzunlukta
+sonsuza kadar hareket edebilir.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .harness import Factory
+
+WIDTH, HEIGHT, BLOCK = 800, 600, 20
+
+def hamiltonian_cycle(cols: int, rows: int) -> List[Tuple[int, int]]:
+    """Tahtadaki tüm hücreleri dolaşan kapalı yol (hücre koordinatları, çift satır sayısı)"""
+    cycle = [(col, 0) for col in range(cols)]
+    for row in range(1, rows):
+        span = range(cols - 1, 0, -1) if row % 2 else range(1, cols)
+        cycle.extend((col, row) for col in span)
+    cycle.extend((0, row) for row in range(rows - 1, 0, -1))
+    return cycle
+
+def cycle_snake(length: int):
+    """Döngü üzerinde `length` uzunluğunda bir yılan ve döngüdeki sonraki yön haritası"""
+    from src.classic_mode.snake import Snake, SnakeBody
+
+    cols, rows = WIDTH // BLOCK, HEIGHT // BLOCK
+    cycle = [(col * BLOCK, row * BLOCK) for col, row in hamiltonian_cycle(cols, rows)]
+    next_direction = {}
+    for i, cell in enumerate(cycle):
+        nxt = cycle[(i + 1) % len(cycle)]
+        next_direction[cell] = [nxt[0] - cell[0], nxt[1] - cell[1]]
+
+    snake = Snake(cycle[length - 1], BLOCK)
+    snake.body = SnakeBody(reversed(cycle[:length]))  # Baş döngüde en ileride
+    snake.direction = next_direction[snake.body[0]]
+    return snake, next_direction
+
+def advance(snake, next_direction) -> None:
+    """Yılanı döngü boyunca bir adım ilerletir"""
+    snake.direction = next_direction[snake.body[0]]
+    snake.update()
+
+@contextmanager
+def snake_update(length: int):
+    """`Snake.update` + `check_collision` (çarpışmasız döngüde)"""
+    snake, next_direction = cycle_snake(length)
+
+    def step():
+        advance(snake, next_direction)
+        if snake.check_collision(WIDTH, HEIGHT):
+            raise RuntimeError("Döngüdeki yılan çarpışmamalı")
+
+    yield step
+
+@contextmanager
+def food_respawn(free: int, indexed: bool = True):
+    """Tahtada yalnızca `free` boş hücre varken `Food.respawn`"""
+    from src.classic_mode.food import Food
+
+    cells = (WIDTH // BLOCK) * (HEIGHT // BLOCK)
+    snake, _ = cycle_snake(cells - free)
+    if indexed:
+        food = Food(WIDTH, HEIGHT, BLOCK, snake.body)
+        body = snake.body
+    else:
+        food = Food(WIDTH, HEIGHT, BLOCK)
+        body = list(snake.body)
+
+    def step():
+        food.respawn(body)
+
+    yield step
+
+@contextmanager
+def agent_get_state(length: int):
+    """`StateEncoder.encode` (piksel koordinatlarından 12 özellik, oyundaki gibi önbellekli kodlayıcı)"""
+    from src.ai_mode.state_encoder import StateEncoder
+
+    encoder = StateEncoder(WIDTH, HEIGHT, BLOCK)
+    snake, _ = cycle_snake(length)
+    body = snake.body
+    food = (WIDTH // 2, HEIGHT // 2)
+
+    def step():
+        encoder.encode(body, food)
+
+    yield step
+
+@contextmanager
+def agent_act(batch: int = 0):
+    """Açgözlü aksiyon seçimi: `act` (batch=0) veya `act_batch`"""
+    from src.ai_mode.dqn_agent import DQNAgent
+
+    agent = DQNAgent(12, 4)
+    rng = np.random.default_rng(0)
+    if batch:
+        states = (rng.random((batch, 12)) < 0.5).astype(np.float32)
+        yield lambda: agent.act_batch(states, training=False)
+    else:
+        state = (rng.random(12) < 0.5).astype(np.float32)
+        yield lambda: agent.act(state, training=False)
+
+@contextmanager
+def agent_replay(batch_size: int):
+    """Tek `DQNAgent.replay` çağrısı (örnekleme + bir gradyan adımı)"""
+    from src.ai_mode.dqn_agent import DQNAgent
+
+    agent = DQNAgent(12, 4, memory_size=10000, batch_size=batch_size)
+    rng = np.random.default_rng(0)
+    n = 10000
+    agent.remember_batch(
+        (rng.random((n, 12)) < 0.5).astype(np.float32),
+        rng.integers(0, 4, n),
+        rng.choice(np.array([-10.0, -0.1, 0.1, 10.0], dtype=np.float32), n),
+        (rng.random((n, 12)) < 0.5).astype(np.float32),
+        rng.random(n) < 0.01
+    )
+    yield agent.replay
+
+@contextmanager
+def offscreen(directory: str):
+    """Ekransız sürücü ve geçici çalışma dizini (oyunların veri dosyaları için)"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+
+    cwd = os.getcwd()
+    os.chdir(directory)
+    pygame.init()
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+@contextmanager
+def game_draw(mode: str, length: int):
+    """Her karede yılanı bir adım ilerletip `Game.draw` / `AIGame.draw` çizimi"""
+    from src.classic_mode.food import Food
+
+    with tempfile.TemporaryDirectory() as directory, offscreen(directory):
+        if mode == 'ai':
+            from src.ai_mode.game import AIGame
+            game = AIGame(WIDTH, HEIGHT)
+            game.training = False
+        else:
+            from src.classic_mode.game import Game
+            game = Game(WIDTH, HEIGHT)
+            game.game_started = True
+        game.sound_enabled = False
+
+        game.snake, next_direction = cycle_snake(length)
+        game.food = Food(WIDTH, HEIGHT, BLOCK, game.snake.body)
+        game.renderer.track(game.snake, game.food)
+
+        def step():
+            advance(game.snake, next_direction)
+            game.draw()
+
+        yield step
+
+def engine_cases() -> Dict[str, Factory]:
+    return {
+        'snake_update/len=3': partial(snake_update, 3),
+        'snake_update/len=1000': partial(snake_update, 1000),
+        'food_respawn/free=5': partial(food_respawn, 5),
+        'food_respawn/free=5/list': partial(food_respawn, 5, False),
+    }
+
+def agent_cases() -> Dict[str, Factory]:
+    return {
+        'agent_get_state/len=3': partial(agent_get_state, 3),
+        'agent_get_state/len=1000': partial(agent_get_state, 1000),
+        'agent_act/single': partial(agent_act, 0),
+        'agent_act/batch=64': partial(agent_act, 64),
+        'agent_replay/batch=32': partial(agent_replay, 32),
+        'agent_replay/batch=64': partial(agent_replay, 64),
+        'agent_replay/batch=256': partial(agent_replay, 256),
+    }
+
+def render_cases() -> Dict[str, Factory]:
+    return {
+        'draw/classic/len=3': partial(game_draw, 'classic', 3),
+        'draw/classic/len=1000': partial(game_draw, 'classic', 1000),
+        'draw/ai/len=3': partial(game_draw, 'ai', 3),
+        'draw/ai/len=1000': partial(game_draw, 'ai', 1000),
+    }
@@ -0,0 +1,133 @@
+"""Ölçüm çekirdeği: zamanlama, yüzdelikler, JSON sonuçları ve taban çizgisi karşılaştırması.
+
+Her senaryo, ölçülecek tek adımı (argümansız bir fonksiyon) üreten bir
+bağlam yöneticisidir. Adım, bir örnek en az `min_sample_time` sürecek kadar
+art arda çağrılır; yüzdelikler bu örneklerin adım başına sürelerinden
+hesaplanır, böylece mikro saniyelik işlemlerde saat çözünürlüğü sonucu bozmaz.
+"""
+import json
+import platform
+import random
+import time
+from typing import Callable, ContextManager, Dict, List, Tuple
+
+import numpy as np
+
+Factory = Callable[[], ContextManager[Callable[[], None]]]
+
+def seed_everything(seed: int) -> None:
+    """Senaryoların tekrarlanabilir olması için tüm rastgele üreteçleri sabitler"""
+    random.seed(seed)
+    np.random.seed(seed)
+    try:
+        import torch
+        torch.manual_seed(seed)
+    except ImportError:
+        pass
+
+def calibrate(step: Callable[[], None], min_sample_time: float) -> int:
+    """Bir örneğin en az `min_sample_time` sürmesi için gereken tekrar sayısı"""
+    inner = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(inner):
+            step()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample_time or inner >= 1 << 20:
+            return inner
+        inner *= 2 if elapsed <= 0 else max(2, min(10, int(min_sample_time / elapsed) + 1))
+
+def measure(step: Callable[[], None], samples: int = 100, min_sample_time: float = 0.002,
+            max_time: float = 5.0, warmup: int = 3) -> Dict:
+    """Adımı ölçer; süreler µs cinsinden, yüzdelikler örnekler üzerinden"""
+    for _ in range(warmup):
+        step()
+    inner = calibrate(step, min_sample_time)
+
+    timings = []
+    deadline = time.perf_counter() + max_time
+    while len(timings) < samples:
+        start = time.perf_counter()
+        for _ in range(inner):
+            step()
+        end = time.perf_counter()
+        timings.append((end - start) / inner)
+        if end > deadline and len(timings) >= 5:
+            break
+
+    timings = np.array(timings) * 1e6
+    mean = float(timings.mean())
+    return {
+        'mean_us': mean,
+        'p50_us': float(np.percentile(timings, 50)),
+        'p90_us': float(np.percentile(timings, 90)),
+        'p99_us': float(np.percentile(timings, 99)),
+        'min_us': float(timings.min()),
+        'ops_per_sec': 1e6 / mean if mean > 0 else float('inf'),
+        'samples': len(timings),
+        'inner': inner
+    }
+
+def run_cases(cases: Dict[str, Factory], seed: int = 0, **options) -> Dict[str, Dict]:
+    """Senaryoları sırayla (her biri aynı seed ile) kurar, ölçer ve sonuçları yazdırır"""
+    results = {}
+    print(f"{'senaryo':<40} {'işlem/sn':>12} {'p50 (µs)':>10} {'p90 (µs)':>10} {'p99 (µs)':>10}")
+    for name, factory in cases.items():
+        seed_everything(seed)
+        with factory() as step:
+            result = measure(step, **options)
+        results[name] = result
+        print(f"{name:<40} {result['ops_per_sec']:>12.0f} {result['p50_us']:>10.1f} "
+              f"{result['p90_us']:>10.1f} {result['p99_us']:>10.1f}")
+    return results
+
+def environment() -> Dict:
+    """Sonuçların hangi ortamda alındığını belirten bilgiler"""
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'numpy': np.__version__
+    }
+    for module in ('torch', 'pygame'):
+        try:
+            info[module] = __import__(module).__version__
+        except ImportError:
+            info[module] = None
+    return info
+
+def save_results(path: str, results: Dict[str, Dict], seed: int) -> None:
+    """Sonuçları makine tarafından okunabilir JSON olarak yazar"""
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'seed': seed,
+        'environment': environment(),
+        'results': results
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+def load_results(path: str) -> Dict[str, Dict]:
+    """Kaydedilmiş bir sonuç dosyasının senaryo sonuçlarını okur"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['results']
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float = 0.1,
+            metric: str = 'p50_us') -> List[Tuple[str, float]]:
+    """Taban çizgisine göre `tolerance` oranından fazla yavaşlayan senaryoları döndürür"""
+    regressions = []
+    print(f"\n{'senaryo':<40} {'taban':>10} {'şimdi':>10} {'oran':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<40} {'-':>10} {result[metric]:>10.1f} {'yeni':>8}")
+            continue
+        base = baseline[name][metric]
+        ratio = result[metric] / base if base > 0 else float('inf')
+        flag = ''
+        if ratio > 1 + tolerance:
+            flag = '  YAVAŞLAMA'
+            regressions.append((name, ratio))
+        elif ratio < 1 - tolerance:
+            flag = '  hızlanma'
+        print(f"{name:<40} {base:>10.1f} {result[metric]:>10.1f} {ratio:>7.2f}x{flag}")
+    return regressions
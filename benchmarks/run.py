@@ -0,0 +1,79 @@
+"""Performans ölçüm paketi: motor, ajan, deneyim hafızası ve çizim senaryoları.
+
+Kullanım (proje kök dizininden):
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --only agent_ draw/ --baseline bench.json --tolerance 0.15
+
+Taban çizgisine göre `--tolerance` oranından fazla yavaşlayan (p50) bir
+senaryo varsa komut 1 koduyla çıkar.
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')  # Çizim senaryoları ekransız çalışır
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+from . import bench_replay
+from .cases import agent_cases, engine_cases, render_cases
+from .harness import Factory, compare, load_results, run_cases, save_results
+
+def all_cases() -> Dict[str, Factory]:
+    """Paketteki tüm senaryolar (isim -> senaryo kurucusu)"""
+    cases = {}
+    cases.update(engine_cases())
+    cases.update(agent_cases())
+    cases.update(bench_replay.cases())
+    cases.update(render_cases())
+    return cases
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Yılan oyunu performans ölçüm paketi")
+    parser.add_argument('--only', nargs='+', default=None,
+                        help="Yalnızca adı bu parçalardan birini içeren senaryoları çalıştır")
+    parser.add_argument('--list', action='store_true', help="Senaryoları listele ve çık")
+    parser.add_argument('--samples', type=int, default=100, help="Senaryo başına örnek sayısı")
+    parser.add_argument('--min-sample-time', type=float, default=0.002,
+                        help="Bir örneğin en kısa süresi (sn)")
+    parser.add_argument('--max-time', type=float, default=5.0,
+                        help="Senaryo başına en fazla ölçüm süresi (sn)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=str, default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--baseline', type=str, default=None,
+                        help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="Yavaşlama sayılmadan önce izin verilen p50 artışı (oran)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    cases = all_cases()
+    if args.only:
+        cases = {name: factory for name, factory in cases.items()
+                 if any(part in name for part in args.only)}
+    if args.list:
+        for name in cases:
+            print(name)
+        return 0
+
+    # Çizim senaryoları çalışma dizinini değiştirdiği için yolları önceden sabitle
+    output = os.path.abspath(args.output) if args.output else None
+    baseline = load_results(args.baseline) if args.baseline else None
+
+    results = run_cases(cases, seed=args.seed, samples=args.samples,
+                        min_sample_time=args.min_sample_time, max_time=args.max_time)
+    if output:
+        save_results(output, results, args.seed)
+        print(f"\nSonuçlar kaydedildi: {output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} senaryoda yavaşlama var")
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
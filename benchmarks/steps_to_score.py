@@ -0,0 +1,97 @@
+"""Öğrenme hızı ölçümü: hedef ortalama skora kaç ortam adımında ulaşıldığı.
+
+Her n adımlık getiri ayarı birkaç seed ile aynı bütçede sıfırdan eğitilir;
+son `--window` bölümün ortalama skoru `--target` değerine ilk ulaştığında
+toplam ortam adımı kaydedilir. Bütçe içinde ulaşamayan koşular `-` olarak
+gösterilir ve medyana bütçe değeriyle katılır.
+
+Kullanım (proje kök dizininden):
+    python -m benchmarks.steps_to_score --n-steps 1 3 5 --seeds 0 1 2 --target 15
+"""
+import argparse
+import json
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .harness import environment, seed_everything
+
+def steps_to_score(n_step: int, seed: int, target: float, window: int = 100,
+                   max_steps: int = 300000, num_envs: int = 16, width: int = 800,
+                   height: int = 600, block_size: int = 20) -> Dict:
+    """Bir eğitim koşusu; hedefe ulaşılan adım (ulaşılamadıysa None) ve özet"""
+    from src.ai_mode.dqn_agent import DQNAgent
+    from src.ai_mode.vec_env import VecSnakeEnv
+
+    seed_everything(seed)
+    env = VecSnakeEnv(num_envs, width, height, block_size, seed=seed)
+    agent = DQNAgent(env.state_size, env.action_size, train_every=num_envs, n_step=n_step)
+    recent = deque(maxlen=window)
+    reached = None
+    total_steps = 0
+    episodes = 0
+    start = time.perf_counter()
+
+    states = env.reset()
+    while total_steps < max_steps:
+        actions = agent.act_batch(states, True)
+        next_states, rewards, dones = env.step(actions)
+        agent.remember_batch(states, actions, rewards, next_states, dones)
+        agent.learn(num_envs)
+        total_steps += num_envs
+        states = next_states
+
+        for i in np.flatnonzero(dones):
+            recent.append(int(env.episode_scores[i]))
+            episodes += 1
+        if len(recent) == window and np.mean(recent) >= target:
+            reached = total_steps
+            break
+
+    return {
+        'n_step': n_step,
+        'seed': seed,
+        'steps': reached,
+        'episodes': episodes,
+        'final_mean': float(np.mean(recent)) if recent else 0.0,
+        'elapsed': time.perf_counter() - start
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Hedef skora ulaşana kadar geçen ortam adımı")
+    parser.add_argument('--n-steps', type=int, nargs='+', default=[1, 3, 5])
+    parser.add_argument('--seeds', type=int, nargs='+', default=[0, 1, 2])
+    parser.add_argument('--target', type=float, default=15.0,
+                        help="Son --window bölümün hedef ortalama skoru")
+    parser.add_argument('--window', type=int, default=100)
+    parser.add_argument('--max-steps', type=int, default=300000, help="Koşu başına adım bütçesi")
+    parser.add_argument('--num-envs', type=int, default=16)
+    parser.add_argument('--output', type=str, default=None, help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    runs = []
+    print(f"{'n':>3} | {'seed':>4} | {'adım':>8} | {'bölüm':>6} | {'son ort.':>8} | {'süre (sn)':>9}")
+    for n_step in args.n_steps:
+        for seed in args.seeds:
+            run = steps_to_score(n_step, seed, args.target, args.window, args.max_steps,
+                                 args.num_envs)
+            runs.append(run)
+            steps = run['steps'] if run['steps'] is not None else '-'
+            print(f"{n_step:>3} | {seed:>4} | {steps:>8} | {run['episodes']:>6} | "
+                  f"{run['final_mean']:>8.2f} | {run['elapsed']:>9.1f}")
+
+    print(f"\nHedef: son {args.window} bölüm ortalaması >= {args.target}")
+    for n_step in args.n_steps:
+        steps = [r['steps'] if r['steps'] is not None else args.max_steps
+                 for r in runs if r['n_step'] == n_step]
+        reached = sum(r['steps'] is not None for r in runs if r['n_step'] == n_step)
+        print(f"n={n_step}: medyan {np.median(steps):.0f} adım ({reached}/{len(steps)} koşu ulaştı)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'environment': environment(), 'args': vars(args), 'runs': runs}, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, BinaryIO, Callable, Dict, Tuple
+
+# Dosya yolu -> (yazma fonksiyonu, veri)
+SaveFn = Callable[[Any, BinaryIO], None]
+Jobs = Dict[str, Tuple[SaveFn, Any]]
+
+def write_json(data: Any, f: BinaryIO) -> None:
+    """Veriyi JSON olarak ikili dosyaya yazar"""
+    f.write(json.dumps(data).encode('utf-8'))
+
+def atomic_write(path: str, save_fn: SaveFn, data: Any) -> None:
+    """Veriyi aynı dizindeki geçici dosyaya yazıp yerine taşır.
+
+    Yazma yarıda kalırsa eski dosya bozulmadan kalır.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.',
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            save_fn(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class CheckpointWriter:
+    """Kayıtları oyun döngüsünü bekletmeden arka plan iş parçacığında yazar.
+
+    `episode_finished` her bölüm sonunda çağrılır; en az `min_interval`
+    saniye veya `every_episodes` bölüm geçtiyse anlık görüntü alınıp
+    kuyruğa konur. Henüz yazılmamış eski bir görüntü varsa yenisiyle
+    değiştirilir (patlamalar birleştirilir). Çıkışta bekleyenler yazılır.
+    """
+
+    def __init__(self, min_interval: float = 10.0, every_episodes: int = 50):
+        self.min_interval = min_interval
+        self.every_episodes = every_episodes
+        self.episodes_since_save = 0
+        self.last_save_time = time.monotonic()
+
+        self._pending: Jobs = {}
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def episode_finished(self, snapshot: Callable[[], Jobs]) -> bool:
+        """Bölüm sonunu bildirir; kayıt zamanı geldiyse görüntü alıp kuyruğa koyar"""
+        self.episodes_since_save += 1
+        if (self.episodes_since_save < self.every_episodes and
+                time.monotonic() - self.last_save_time < self.min_interval):
+            return False
+        self.submit(snapshot())
+        return True
+
+    def submit(self, jobs: Jobs) -> None:
+        """Yazılacak işleri kuyruğa koyar (aynı dosya için bekleyen işi değiştirir)"""
+        with self._condition:
+            self._pending.update(jobs)
+            self.episodes_since_save = 0
+            self.last_save_time = time.monotonic()
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Bekleyen tüm işler yazılana kadar bekler"""
+        with self._condition:
+            self._condition.wait_for(lambda: not (self._pending or self._busy) or
+                                     not self._thread.is_alive())
+
+    def close(self) -> None:
+        """Bekleyen işleri yazar ve iş parçacığını durdurur"""
+        if self._closed:
+            return
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                jobs, self._pending = self._pending, {}
+                self._busy = True
+
+            for path, (save_fn, data) in jobs.items():
+                try:
+                    atomic_write(path, save_fn, data)
+                except Exception as e:
+                    print(f"Kayıt yazılamadı ({path}): {e}")
+
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
@@ -0,0 +1,284 @@
+"""Çok süreçli aktör/öğrenen eğitim mimarisi.
+
+Her aktör süreci kendi `VecSnakeEnv` tahtalarını kendi ağ kopyasıyla oynar
+ve geçişleri paylaşımlı bellekteki tek üreticili/tek tüketicili bir halka
+kuyruğa yazar; n adımlık geçişler kuyruğa yazılmadan önce aktörde
+birleştirilir. Ana süreçteki öğrenen `DQNAgent.model`'in sahibidir:
+kuyrukları hafızasına boşaltır, eğitir ve ağırlıkları periyodik olarak
+paylaşımlı bir ağırlık tamponu üzerinden aktörlere yayınlar.
+"""
+import argparse
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+from torch.nn.utils import parameters_to_vector, vector_to_parameters
+
+from .dqn_agent import DQN, BatchActor
+from .replay_buffer import NStepAccumulator
+from .train import TrainingProgress, create_agent
+from .vec_env import VecSnakeEnv
+
+# Dizi adı -> (şekil, veri tipi)
+ArraySpecs = Dict[str, Tuple[Tuple[int, ...], type]]
+
+class SharedArrays:
+    """Tek bir paylaşımlı bellek bloğu üzerinde adlandırılmış NumPy dizileri.
+
+    `name` verilmezse blok oluşturulur ve sıfırlanır, verilirse var olan
+    bloğa bağlanılır. Dizilere yalnızca `arrays` üzerinden erişilmelidir ki
+    `close` tüm görünümleri bırakabilsin.
+    """
+
+    ALIGNMENT = 64
+
+    def __init__(self, specs: ArraySpecs, name: Optional[str] = None):
+        offsets = {}
+        total = 0
+        for key, (shape, dtype) in specs.items():
+            offsets[key] = total
+            nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            total += (nbytes + self.ALIGNMENT - 1) // self.ALIGNMENT * self.ALIGNMENT
+
+        create = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=max(total, 1))
+
+        self.arrays = {
+            key: np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offsets[key])
+            for key, (shape, dtype) in specs.items()
+        }
+        if create:
+            for array in self.arrays.values():
+                array.fill(0)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self) -> None:
+        """Görünümleri bırakır ve bloğu kapatır"""
+        self.arrays = {}
+        self.shm.close()
+
+    def unlink(self) -> None:
+        """Bloğu sistemden siler (yalnızca oluşturan süreç çağırmalı)"""
+        self.shm.unlink()
+
+# Kuyruk sayaçlarının indeksleri. Sayaçlar yalnızca kuyruğun kilidi tutulurken
+# okunur/yazılır: kilidin alınıp bırakılması bellek bariyeridir, böylece zayıf
+# sıralı işlemcilerde de (ör. ARM) yayınlanan sayaçtan önceki veri yazımları
+# okuyucuya görünür ve okuyucu bitirmeden yazıcı aynı yuvaların üzerine yazmaz.
+T_WRITE, T_READ, E_WRITE, E_READ = range(4)
+
+def queue_specs(capacity: int, episode_capacity: int, state_size: int) -> ArraySpecs:
+    """Bir aktörün geçiş kuyruğunun dizi tanımları"""
+    return {
+        'states': ((capacity, state_size), np.float32),
+        'actions': ((capacity,), np.int64),
+        'rewards': ((capacity,), np.float32),
+        'next_states': ((capacity, state_size), np.float32),
+        'dones': ((capacity,), np.float32),
+        'discounts': ((capacity,), np.float32),
+        'episodes': ((episode_capacity, 2), np.int64),  # (skor, adım)
+        'counters': ((4,), np.int64)
+    }
+
+def weight_specs(num_params: int) -> ArraySpecs:
+    """Ağırlık yayın tamponunun dizi tanımları"""
+    return {
+        'params': ((num_params,), np.float32),
+        'version': ((1,), np.int64)
+    }
+
+def actor_epsilons(num_actors: int, base: float = 0.4, alpha: float = 7.0) -> List[float]:
+    """Ape-X tarzı aktör başına sabit keşif oranları: base^(1 + alpha * i / (N - 1))"""
+    if num_actors == 1:
+        return [base]
+    return [base ** (1 + alpha * i / (num_actors - 1)) for i in range(num_actors)]
+
+def actor_worker(actor_id: int, config: dict, queue_name: str, queue_lock, weights_name: str,
+                 weights_lock, stop_event) -> None:
+    """Aktör süreci: tahtaları oynar ve geçişleri kuyruğa yazar"""
+    torch.set_num_threads(1)
+    env = VecSnakeEnv(config['num_envs'], config['width'], config['height'],
+                      config['block_size'], seed=config['seed'] + actor_id)
+    queue = SharedArrays(queue_specs(config['capacity'], config['episode_capacity'],
+                                     env.state_size), name=queue_name)
+    weights = SharedArrays(weight_specs(config['num_params']), name=weights_name)
+    model = DQN(env.state_size, 256, env.action_size)
+    model.eval()
+    actor = BatchActor(model, env.state_size, env.action_size, capacity=config['num_envs'],
+                       rng=np.random.default_rng(config['seed'] + actor_id))
+    epsilon = config['epsilons'][actor_id]
+    accumulator = NStepAccumulator(env.num_envs, config['n_step'], config['gamma'], env.state_size)
+    capacity = config['capacity']
+    episode_capacity = config['episode_capacity']
+    version = -1
+    step = 0
+    q = queue.arrays
+    counters = q['counters']
+
+    try:
+        states = env.reset()
+        while not stop_event.is_set():
+            # Öğrenenden yeni ağırlıkları çek
+            if step % config['sync_every'] == 0:
+                with weights_lock:
+                    latest = int(weights.arrays['version'][0])
+                    if latest != version:
+                        flat = torch.from_numpy(weights.arrays['params'].copy())
+                        version = latest
+                    else:
+                        flat = None
+                if flat is not None:
+                    vector_to_parameters(flat, model.parameters())
+
+            # Epsilon-greedy aksiyon seçimi (tek ileri geçiş)
+            actions = actor.select(states, epsilon)
+            next_states, rewards, dones = env.step(actions)
+            transitions = accumulator.add(states, actions, rewards, next_states, dones)
+            n = len(transitions[1])
+
+            # Kuyrukta yer açılana kadar bekle (okunmamış geçişlerin üzerine yazılmaz).
+            # Yazma sayaçlarını yalnızca bu süreç değiştirdiği için kilitsiz okunabilir.
+            t_write, e_write = int(counters[T_WRITE]), int(counters[E_WRITE])
+            while True:
+                with queue_lock:
+                    t_read, e_read = int(counters[T_READ]), int(counters[E_READ])
+                if t_write - t_read + n <= capacity:
+                    break
+                if stop_event.is_set():
+                    return
+                time.sleep(0.0005)
+            indices = (t_write + np.arange(n)) % capacity
+            for key, values in zip(('states', 'actions', 'rewards', 'next_states', 'dones',
+                                    'discounts'), transitions):
+                q[key][indices] = values
+
+            for i in np.flatnonzero(dones):
+                if e_write - e_read < episode_capacity:
+                    q['episodes'][e_write % episode_capacity] = (
+                        env.episode_scores[i], env.episode_steps[i])
+                    e_write += 1
+
+            with queue_lock:  # Veriler yazıldıktan sonra yayınla
+                counters[T_WRITE] = t_write + n
+                counters[E_WRITE] = e_write
+
+            states = next_states
+            step += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        q = counters = None  # Paylaşımlı bellek görünümlerini bırak
+        queue.close()
+        weights.close()
+
+def publish_weights(model: torch.nn.Module, weights: SharedArrays, weights_lock) -> None:
+    """Modelin ağırlıklarını aktörlere yayınlar"""
+    flat = parameters_to_vector(model.parameters()).detach().cpu().numpy()
+    with weights_lock:
+        weights.arrays['params'][:] = flat
+        weights.arrays['version'][0] += 1
+
+def drain_queue(queue: SharedArrays, queue_lock, agent, progress: TrainingProgress) -> int:
+    """Bir aktör kuyruğundaki yeni geçişleri ve bölümleri öğrenene aktarır"""
+    q = queue.arrays
+    counters = q['counters']
+    with queue_lock:
+        t_write, t_read, e_write, e_read = (int(c) for c in counters)
+    count = t_write - t_read
+    if count:
+        capacity = len(q['actions'])
+        indices = (t_read + np.arange(count)) % capacity
+        agent.remember_transitions(q['states'][indices], q['actions'][indices],
+                                   q['rewards'][indices], q['next_states'][indices],
+                                   q['dones'][indices], q['discounts'][indices])
+        progress.total_steps += count
+
+    episode_capacity = len(q['episodes'])
+    episodes = [q['episodes'][e % episode_capacity].copy() for e in range(e_read, e_write)]
+    with queue_lock:  # Okunan yuvaları ancak kopyalandıktan sonra yazıcıya geri ver
+        counters[T_READ] = t_write
+        counters[E_READ] = e_write
+    for score, steps in episodes:
+        progress.episode_finished(int(score), int(steps))
+    return count
+
+def train_distributed(args: argparse.Namespace) -> None:
+    """Aktör süreçlerini başlatır ve öğrenen döngüsünü ana süreçte çalıştırır"""
+    ctx = mp.get_context('spawn')
+    seed = args.seed if args.seed is not None else int(time.time())
+    torch.manual_seed(seed)
+
+    probe = VecSnakeEnv(1, args.width, args.height, args.block_size)
+    agent = create_agent(args, probe.state_size, probe.action_size)
+    epsilons = actor_epsilons(args.actors)
+    progress = TrainingProgress(args, agent, epsilons)
+    num_params = parameters_to_vector(agent.model.parameters()).numel()
+
+    config = {
+        'num_envs': args.num_envs,
+        'width': args.width,
+        'height': args.height,
+        'block_size': args.block_size,
+        'seed': seed,
+        'capacity': max(max(64, args.n_step) * args.num_envs, 4096),  # Bölüm sonunda n geçiş çıkabilir
+        'episode_capacity': 4096,
+        'num_params': num_params,
+        'sync_every': args.sync_every,
+        'n_step': args.n_step,
+        'gamma': agent.gamma,
+        'epsilons': epsilons
+    }
+
+    weights_lock = ctx.Lock()
+    stop_event = ctx.Event()
+    weights = SharedArrays(weight_specs(num_params))
+    publish_weights(agent.model, weights, weights_lock)
+    queues = [SharedArrays(queue_specs(config['capacity'], config['episode_capacity'],
+                                       probe.state_size))
+              for _ in range(args.actors)]
+    queue_locks = [ctx.Lock() for _ in range(args.actors)]
+    actors = [
+        ctx.Process(target=actor_worker, daemon=True,
+                    args=(i, config, queues[i].name, queue_locks[i], weights.name,
+                          weights_lock, stop_event))
+        for i in range(args.actors)
+    ]
+    for actor in actors:
+        actor.start()
+
+    updates = 0
+    next_broadcast = args.broadcast_every
+    try:
+        while progress.running():
+            received = sum(drain_queue(queue, lock, agent, progress)
+                           for queue, lock in zip(queues, queue_locks))
+            if not received:
+                time.sleep(0.001)
+                continue
+
+            # Güncellemeler gelen veriye bağlı: her `train_every` geçişte bir replay,
+            # böylece güncelleme/veri oranı makine ve aktör hızından bağımsızdır
+            train_steps = agent.train_steps
+            agent.learn(received)
+            updates += (agent.train_steps - train_steps) // agent.gradient_steps
+            if updates >= next_broadcast:
+                publish_weights(agent.model, weights, weights_lock)
+                next_broadcast = updates + args.broadcast_every
+    except KeyboardInterrupt:
+        print("Eğitim durduruldu")
+    finally:
+        stop_event.set()
+        for actor in actors:
+            actor.join(timeout=5)
+            if actor.is_alive():
+                actor.terminate()
+        progress.close()
+        for shared in queues + [weights]:
+            shared.close()
+            shared.unlink()
@@ -3,8 +3,11 @@ import torch.nn as nn
 import torch.optim as optim
 import numpy as np
 import random
-from collections import deque
-from typing import List, Tuple
+import copy
+from typing import Tuple
+from .replay_buffer import ReplayBuffer, PrioritizedReplayBuffer, NStepAccumulator, StateSize
+from .vec_env import VecSnakeEnv
+from .checkpoint import atomic_write
 
 class DQN(nn.Module):
     def __init__(self, input_size: int, hidden_size: int, output_size: int):
@@ -20,33 +23,208 @@ class DQN(nn.Module):
     def forward(self, x):
         return self.network(x)
 
+class ConvDQN(nn.Module):
+    """Izgara gözlemleri (C, rows, cols) için küçük evrişimli Q ağı.
+
+    Kanallar `VecSnakeEnv` ızgarasıyla aynı sıradadır. Yaş kanalı varsa
+    giriş adımlarından göreli yaş hesaplanır: baş 1, kuyruk 1/uzunluk.
+    Girdi uint8/uint16 (replay hafızası) veya float32 olabilir.
+    """
+
+    def __init__(self, input_shape: Tuple[int, int, int], hidden_size: int, output_size: int):
+        super(ConvDQN, self).__init__()
+        channels, rows, cols = input_shape
+        self.body_age = channels > VecSnakeEnv.AGE
+        self.features = nn.Sequential(
+            nn.Conv2d(channels, 32, 3, padding=1),
+            nn.ReLU(),
+            nn.Conv2d(32, 64, 3, stride=2, padding=1),
+            nn.ReLU(),
+            nn.Conv2d(64, 64, 3, stride=2, padding=1),
+            nn.ReLU()
+        )
+        feature_size = 64 * ((rows + 3) // 4) * ((cols + 3) // 4)
+        self.head = nn.Sequential(
+            nn.Linear(feature_size, hidden_size),
+            nn.ReLU(),
+            nn.Linear(hidden_size, output_size)
+        )
+
+    def relative_age(self, x: torch.Tensor) -> torch.Tensor:
+        """Yaş kanalındaki giriş adımlarını başa göre 0-1 aralığında göreli yaşa çevirir"""
+        body = x[:, VecSnakeEnv.BODY]
+        age = x[:, VecSnakeEnv.AGE]
+        head_step = (age * x[:, VecSnakeEnv.HEAD]).sum((1, 2), keepdim=True)
+        since = torch.remainder(head_step - age, VecSnakeEnv.AGE_PERIOD)
+        length = body.sum((1, 2), keepdim=True).clamp(min=1)
+        return torch.cat([x[:, :VecSnakeEnv.AGE], (body * (1 - since / length)).unsqueeze(1)], 1)
+
+    def forward(self, x):
+        x = x.float()
+        if self.body_age:
+            x = self.relative_age(x)
+        return self.head(self.features(x).flatten(1))
+
+def checkpoint_config(checkpoint: dict) -> dict:
+    """Kaydı üreten gözlem ayarları (bu bilgiyi taşımayan eski kayıtlar 12 özellikli vektördür)"""
+    state_size = checkpoint.get('state_size', 12)
+    return {
+        'observation': checkpoint.get('observation', 'vector'),
+        'body_age': checkpoint.get('body_age', False),
+        'state_size': tuple(state_size) if isinstance(state_size, (list, tuple)) else state_size
+    }
+
+def describe_config(config: dict) -> str:
+    """Gözlem ayarlarının okunabilir özeti (hata mesajları için)"""
+    age = ' + gövde yaşı' if config['body_age'] else ''
+    return f"{config['observation']}{age}, durum boyutu {config['state_size']}"
+
+def build_model(state_size: StateSize, action_size: int, hidden_size: int = 256) -> nn.Module:
+    """Vektör gözlemi için MLP, ızgara gözlemi (C, rows, cols) için evrişimli Q ağı"""
+    if isinstance(state_size, tuple):
+        return ConvDQN(state_size, hidden_size, action_size)
+    return DQN(state_size, hidden_size, action_size)
+
+class BatchActor:
+    """Birçok tahta için tek ileri geçişle epsilon-greedy aksiyon seçimi.
+
+    Girdi tensörü önceden ayrılır ve yalnızca daha büyük bir batch geldiğinde
+    büyütülür; keşif kararları ve rastgele aksiyonlar NumPy ile topluca üretilir.
+    Tüm batch keşif yapıyorsa ileri geçiş hiç çalıştırılmaz. CPU'da bitişik
+    float32 durumlar (ör. ızgara gözlemleri) kopyalanmadan doğrudan verilir.
+    """
+
+    def __init__(self, model: nn.Module, state_size: StateSize, action_size: int,
+                 device: torch.device = torch.device("cpu"), capacity: int = 1,
+                 rng: np.random.Generator = None):
+        self.model = model
+        self.state_shape = tuple(np.atleast_1d(state_size))
+        self.action_size = action_size
+        self.device = device
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.inputs = torch.empty((capacity,) + self.state_shape, dtype=torch.float32, device=device)
+
+    def greedy(self, states: np.ndarray) -> np.ndarray:
+        """(N, *state_shape) durumlar için en yüksek Q değerli aksiyonlar"""
+        states = np.asarray(states)
+        n = len(states)
+        if (self.device.type == 'cpu' and states.dtype == np.float32 and
+                states.flags.c_contiguous):
+            inputs = torch.from_numpy(states)  # Kopyasız görünüm
+        else:
+            if n > len(self.inputs):
+                self.inputs = torch.empty((n,) + self.state_shape, dtype=torch.float32,
+                                          device=self.device)
+            inputs = self.inputs[:n]
+            inputs.copy_(torch.from_numpy(states))
+        with torch.inference_mode():
+            return self.model(inputs).argmax(1).cpu().numpy()
+
+    def select(self, states: np.ndarray, epsilon: float = 0.0) -> np.ndarray:
+        """(N, state_size) durumlar için N aksiyon (epsilon-greedy)"""
+        n = len(states)
+        if epsilon <= 0:
+            return self.greedy(states)
+        explore = self.rng.random(n) < epsilon
+        actions = self.rng.integers(0, self.action_size, n)
+        if not explore.all():
+            exploit = ~explore
+            actions[exploit] = self.greedy(states[exploit])
+        return actions
+
 class DQNAgent:
-    def __init__(self, state_size: int, action_size: int):
+    def __init__(self, state_size: StateSize, action_size: int, memory_size: int = 10000,
+                 prioritized: bool = False, batch_size: int = 64, train_every: int = 1,
+                 gradient_steps: int = 1, target_update_every: int = 1000, tau: float = 0.0,
+                 compile_model: bool = False, state_dtype=np.float32, n_step: int = 1):
         self.state_size = state_size
+        self.state_dtype = state_dtype
+        # Kayda yazılan gözlem ayarları (durum boyutundan türetilir)
+        self.observation = 'grid' if isinstance(state_size, tuple) else 'vector'
+        self.body_age = self.observation == 'grid' and state_size[0] > VecSnakeEnv.AGE
         self.action_size = action_size
-        self.memory = deque(maxlen=10000)
+        self.prioritized = prioritized  # Öncelikli deneyim tekrarı
+        if prioritized:
+            self.memory = PrioritizedReplayBuffer(memory_size, state_size, state_dtype=state_dtype)
+        else:
+            self.memory = ReplayBuffer(memory_size, state_size, state_dtype=state_dtype)
         self.gamma = 0.95  # İndirim faktörü
+        self.n_step = n_step  # Getirinin kaç adım sonra hedef ağdan tamamlandığı
+        self.accumulator = None  # n > 1 iken tahta sayısı belli olunca kurulur
         self.epsilon = 1.0  # Keşif oranı
         self.epsilon_min = 0.01
         self.epsilon_decay = 0.995
         self.learning_rate = 0.001
-        self.batch_size = 64
+        self.batch_size = batch_size
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
-        # DQN ağları
-        self.model = DQN(state_size, 256, action_size).to(self.device)
-        self.target_model = DQN(state_size, 256, action_size).to(self.device)
+        # Öğrenme takvimi
+        self.train_every = train_every  # Kaç ortam adımında bir güncelleme yapılacağı
+        self.gradient_steps = gradient_steps  # Güncelleme başına gradyan adımı
+        self.target_update_every = target_update_every  # Sert hedef senkronu (gradyan adımı)
+        self.tau = tau  # > 0 ise her gradyan adımında Polyak (yumuşak) senkron
+        self.env_steps = 0
+        self.train_steps = 0
+
+        # DQN ağları (ızgara gözleminde evrişimli)
+        self.model = build_model(state_size, action_size).to(self.device)
+        self.target_model = build_model(state_size, action_size).to(self.device)
         self.optimizer = optim.Adam(self.model.parameters(), lr=self.learning_rate)
+        self.loss_fn = nn.MSELoss()
         self.update_target_model()
 
+        # İsteğe bağlı derlenmiş ileri geçişler (parametreler modellerle ortaktır)
+        self.model_fn = self.model
+        self.target_fn = self.target_model
+        if compile_model:
+            if hasattr(torch, 'compile'):
+                self.model_fn = torch.compile(self.model)
+                self.target_fn = torch.compile(self.target_model)
+            else:
+                print("torch.compile bu PyTorch sürümünde yok, derlenmeden devam ediliyor")
+
+        # Toplu aksiyon seçimi (seed'lenmiş `random` modülünden türetilen üreteçle)
+        self.batch_actor = BatchActor(self.model_fn, state_size, action_size, self.device,
+                                      rng=np.random.default_rng(random.getrandbits(64)))
+
     def update_target_model(self):
         """Hedef modeli güncelle"""
         self.target_model.load_state_dict(self.model.state_dict())
 
+    def sync_target(self) -> None:
+        """Gradyan adımından sonra hedef ağı takvime göre (Polyak veya sert) günceller"""
+        if self.tau > 0:
+            with torch.no_grad():
+                for target, online in zip(self.target_model.parameters(), self.model.parameters()):
+                    target.lerp_(online, self.tau)
+        elif self.target_update_every and self.train_steps % self.target_update_every == 0:
+            self.update_target_model()
+
     def remember(self, state: np.ndarray, action: int, reward: float, 
                 next_state: np.ndarray, done: bool):
         """Deneyimi hafızaya ekle"""
-        self.memory.append((state, action, reward, next_state, done))
+        if self.n_step == 1:
+            self.memory.add(state, action, reward, next_state, done, self.gamma)
+        else:
+            self.remember_batch(np.asarray(state)[None], np.array([action]),
+                                np.array([reward], dtype=np.float32),
+                                np.asarray(next_state)[None], np.array([done]))
+
+    def remember_batch(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                       next_states: np.ndarray, dones: np.ndarray):
+        """Paralel tahtaların bir adımını (tahta sırası her çağrıda aynı) hafızaya ekle"""
+        if self.n_step == 1:
+            self.memory.add_batch(states, actions, rewards, next_states, dones, self.gamma)
+            return
+        if self.accumulator is None or self.accumulator.num_envs != len(actions):
+            self.accumulator = NStepAccumulator(len(actions), self.n_step, self.gamma,
+                                                self.state_size, self.state_dtype)
+        self.memory.add_batch(*self.accumulator.add(states, actions, rewards, next_states, dones))
+
+    def remember_transitions(self, states: np.ndarray, actions: np.ndarray, returns: np.ndarray,
+                             next_states: np.ndarray, dones: np.ndarray, discounts: np.ndarray):
+        """Başka yerde (ör. aktör süreçlerinde) birleştirilmiş n adımlık geçişleri ekle"""
+        self.memory.add_batch(states, actions, returns, next_states, dones, discounts)
 
     def act(self, state: np.ndarray, training: bool = True) -> int:
         """Duruma göre aksiyon seç"""
@@ -54,100 +232,96 @@ class DQNAgent:
             return random.randrange(self.action_size)
         
         state = torch.FloatTensor(state).unsqueeze(0).to(self.device)
-        with torch.no_grad():
-            action_values = self.model(state)
+        with torch.inference_mode():
+            action_values = self.model_fn(state)
         return torch.argmax(action_values).item()
 
+    def act_batch(self, states: np.ndarray, training: bool = True) -> np.ndarray:
+        """(N, state_size) durum dizisi için tek ileri geçişle N aksiyon seç"""
+        return self.batch_actor.select(states, self.epsilon if training else 0.0)
+
+    def learn(self, env_steps: int = 1) -> float:
+        """Ortam adımlarını sayar; her `train_every` adımda bir `replay` çalıştırır"""
+        updates = (self.env_steps + env_steps) // self.train_every - self.env_steps // self.train_every
+        self.env_steps += env_steps
+        loss = 0.0
+        for _ in range(updates):
+            loss = self.replay()
+        return loss
+
     def replay(self) -> float:
-        """Hafızadan örnek alıp eğitim yap"""
+        """Hafızadan örnek alıp `gradient_steps` gradyan adımı eğitim yap"""
         if len(self.memory) < self.batch_size:
             return 0.0
 
-        minibatch = random.sample(self.memory, self.batch_size)
-        states = torch.FloatTensor([x[0] for x in minibatch]).to(self.device)
-        actions = torch.LongTensor([x[1] for x in minibatch]).to(self.device)
-        rewards = torch.FloatTensor([x[2] for x in minibatch]).to(self.device)
-        next_states = torch.FloatTensor([x[3] for x in minibatch]).to(self.device)
-        dones = torch.FloatTensor([x[4] for x in minibatch]).to(self.device)
+        total_loss = 0.0
+        for _ in range(self.gradient_steps):
+            total_loss += self.gradient_step()
 
-        # Mevcut Q değerleri
-        current_q_values = self.model(states).gather(1, actions.unsqueeze(1))
+        # Epsilon değerini güncelle
+        if self.epsilon > self.epsilon_min:
+            self.epsilon *= self.epsilon_decay
+
+        return total_loss / self.gradient_steps
+
+    def gradient_step(self) -> float:
+        """Tek bir mini-batch üzerinde bir optimizasyon adımı"""
+        batch = self.memory.sample(self.batch_size)
+        if self.prioritized:
+            batch, weights, indices = batch[:6], batch[6].to(self.device), batch[7]
+        states, actions, rewards, next_states, dones, discounts = (t.to(self.device) for t in batch)
 
-        # Hedef Q değerleri
-        with torch.no_grad():
-            next_q_values = self.target_model(next_states).max(1)[0]
-        target_q_values = rewards + (1 - dones) * self.gamma * next_q_values
+        # Hedef Q değerleri (gradyan gerekmez): R_n + gamma^n * max Q(s_{t+n})
+        with torch.inference_mode():
+            next_q_values = self.target_fn(next_states).max(1)[0]
+            target_q_values = rewards + (1 - dones) * discounts * next_q_values
+        target_q_values = target_q_values.clone()  # Geri yayılımda kullanılabilsin
+
+        # Mevcut Q değerleri
+        current_q_values = self.model_fn(states).gather(1, actions.unsqueeze(1)).squeeze(1)
 
         # Kayıp hesapla ve optimize et
-        loss = nn.MSELoss()(current_q_values.squeeze(), target_q_values)
-        self.optimizer.zero_grad()
+        if self.prioritized:
+            # Önem örneklemesi ağırlıklı kayıp ve yeni öncelikler
+            td_errors = target_q_values - current_q_values
+            loss = (weights * td_errors.pow(2)).mean()
+            self.memory.update_priorities(indices, td_errors.detach().abs().cpu().numpy())
+        else:
+            loss = self.loss_fn(current_q_values, target_q_values)
+        self.optimizer.zero_grad(set_to_none=True)
         loss.backward()
         self.optimizer.step()
 
-        # Epsilon değerini güncelle
-        if self.epsilon > self.epsilon_min:
-            self.epsilon *= self.epsilon_decay
-
+        self.train_steps += 1
+        self.sync_target()
         return loss.item()
 
-    def get_state(self, snake_head: Tuple[int, int], snake_body: List[Tuple[int, int]], 
-                 food_pos: Tuple[int, int], width: int, height: int) -> np.ndarray:
-        """Oyun durumunu AI'nin anlayabileceği formata dönüştür"""
-        state = []
-        
-        # Yılanın yönelimleri (4 yön)
-        head_x, head_y = snake_head
-        if len(snake_body) >= 2:
-            # Yılanın mevcut yönünü belirle
-            dx = snake_body[0][0] - snake_body[1][0]
-            dy = snake_body[0][1] - snake_body[1][1]
-            state.extend([
-                1 if dx == 20 and dy == 0 else 0,  # Sağ
-                1 if dx == -20 and dy == 0 else 0,  # Sol
-                1 if dx == 0 and dy == -20 else 0,  # Yukarı
-                1 if dx == 0 and dy == 20 else 0   # Aşağı
-            ])
-        else:
-            # Başlangıç durumu için varsayılan yön (sağ)
-            state.extend([1, 0, 0, 0])
-        
-        # Yemeğin yılan başına göre konumu
-        food_x, food_y = food_pos
-        state.extend([
-            food_x < head_x,  # Yemek solda mı
-            food_x > head_x,  # Yemek sağda mı
-            food_y < head_y,  # Yemek yukarıda mı
-            food_y > head_y   # Yemek aşağıda mı
-        ])
-        
-        # Tehlike algılama (her yön için)
-        for dx, dy in [(20,0), (-20,0), (0,-20), (0,20)]:  # Sağ, Sol, Yukarı, Aşağı
-            next_x = head_x + dx
-            next_y = head_y + dy
-            
-            # Duvar veya vücut parçası var mı kontrol et
-            danger = (
-                next_x < 0 or
-                next_x >= width or
-                next_y < 0 or
-                next_y >= height or
-                (next_x, next_y) in snake_body[:-1]
-            )
-            state.append(1 if danger else 0)
-
-        return np.array(state, dtype=np.float32)
+    def checkpoint_state(self) -> dict:
+        """Kaydedilecek durumun CPU'ya kopyalanmış anlık görüntüsü"""
+        return {
+            'model_state_dict': {k: v.detach().to('cpu', copy=True)
+                                 for k, v in self.model.state_dict().items()},
+            'optimizer_state_dict': copy.deepcopy(self.optimizer.state_dict()),
+            'epsilon': self.epsilon,
+            **self.config()
+        }
+
+    def config(self) -> dict:
+        """Ağın hangi gözlem için kurulduğu (kayıtlarla karşılaştırılır)"""
+        return {'observation': self.observation, 'body_age': self.body_age,
+                'state_size': self.state_size}
 
     def save(self, filepath: str):
-        """Modeli kaydet"""
-        torch.save({
-            'model_state_dict': self.model.state_dict(),
-            'optimizer_state_dict': self.optimizer.state_dict(),
-            'epsilon': self.epsilon
-        }, filepath)
+        """Modeli kaydet (geçici dosya + yeniden adlandırma ile atomik)"""
+        atomic_write(filepath, torch.save, self.checkpoint_state())
 
     def load(self, filepath: str):
-        """Modeli yükle"""
+        """Modeli yükle (kayıt başka bir gözlemle eğitildiyse ValueError)"""
         checkpoint = torch.load(filepath)
+        saved = checkpoint_config(checkpoint)
+        if saved != self.config():
+            raise ValueError(f"{filepath} farklı bir gözlemle eğitilmiş ({describe_config(saved)}); "
+                             f"bu ajan {describe_config(self.config())} bekliyor")
         self.model.load_state_dict(checkpoint['model_state_dict'])
         self.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
         self.epsilon = checkpoint['epsilon']
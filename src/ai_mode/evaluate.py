@@ -0,0 +1,224 @@
+"""Kayıtlı modelin açgözlü (epsilon=0) politikasını ekransız ve öğrenmeden değerlendirir.
+
+Bölümler süreç havuzundaki işçilere farklı seed'lerle paylaştırılır; her
+işçi birçok tahtayı `VecSnakeEnv` ile aynı anda yürütür ve aksiyonları tek
+ileri geçişle seçer. Kendini tekrar eden politikalar sonsuza kadar
+sürmesin diye bölümler `max_steps` adımda kesilir.
+
+Kullanım (proje kök dizininden):
+    python -m src.ai_mode.evaluate models/snake_ai_model.pth --episodes 5000 --workers 4
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from .dqn_agent import BatchActor, build_model, checkpoint_config, describe_config
+from .vec_env import VecSnakeEnv
+
+# Bölüm sonucu: skor, adım sayısı ve adım sınırında kesilip kesilmediği
+RECORD = np.dtype([('score', '<i8'), ('steps', '<i8'), ('truncated', '?')])
+
+def load_model_state(path: str) -> Tuple[Dict[str, torch.Tensor], Dict]:
+    """Kayıt dosyasından model ağırlıklarını (CPU'ya) ve kaydı üreten gözlem ayarlarını okur"""
+    checkpoint = torch.load(path, map_location='cpu')
+    return checkpoint['model_state_dict'], checkpoint_config(checkpoint)
+
+def play_greedy(model_state: Dict[str, torch.Tensor], episodes: int, seed: int,
+                num_envs: int = 64, max_steps: int = 5000, width: int = 800,
+                height: int = 600, block_size: int = 20, observation: str = 'vector',
+                body_age: bool = False) -> np.ndarray:
+    """İşçi: `episodes` bölümü açgözlü oynar ve RECORD dizisi döndürür.
+
+    Her tahtaya sabit sayıda bölüm düşer; kısa bölümler erken biten tahtalarda
+    fazla temsil edilmesin diye kotasını dolduran tahtaların sonuçları atılır.
+    """
+    torch.set_num_threads(1)
+    env = VecSnakeEnv(max(1, min(num_envs, episodes)), width, height, block_size, seed=seed,
+                      observation=observation, body_age=body_age)
+    n = env.num_envs
+    model = build_model(env.state_size, env.action_size)
+    model.load_state_dict(model_state)
+    model.eval()
+    actor = BatchActor(model, env.state_size, env.action_size, capacity=n)
+
+    quota = np.full(n, episodes // n)
+    quota[:episodes % n] += 1
+    records = np.zeros(episodes, dtype=RECORD)
+    count = 0
+
+    env.reset()
+    while count < episodes:
+        _, _, dones = env.step(actor.greedy(env.observe()), copy=False)
+        capped = ~dones & (env.steps >= max_steps) if max_steps else np.zeros(n, dtype=np.bool_)
+
+        for i in np.flatnonzero((dones | capped) & (quota > 0)):
+            if dones[i]:
+                records[count] = (env.episode_scores[i], env.episode_steps[i], False)
+            else:
+                records[count] = (env.scores[i], env.steps[i], True)
+            count += 1
+            quota[i] -= 1
+
+        cap_idx = np.flatnonzero(capped)
+        if len(cap_idx):
+            env.reset(cap_idx)
+    return records
+
+def split_episodes(episodes: int, chunks: int) -> List[int]:
+    """Bölümleri olabildiğince eşit parçalara böler"""
+    chunks = max(1, min(chunks, episodes))
+    return [episodes // chunks + (i < episodes % chunks) for i in range(chunks)]
+
+def distribution(values: np.ndarray) -> Dict[str, float]:
+    """Ortalama, yüzdelikler ve uç değerler"""
+    if len(values) == 0:
+        return {}
+    percentiles = np.percentile(values, [10, 25, 50, 75, 90, 99])
+    return {
+        'mean': float(values.mean()),
+        'std': float(values.std()),
+        'min': float(values.min()),
+        'p10': float(percentiles[0]),
+        'p25': float(percentiles[1]),
+        'median': float(percentiles[2]),
+        'p75': float(percentiles[3]),
+        'p90': float(percentiles[4]),
+        'p99': float(percentiles[5]),
+        'max': float(values.max())
+    }
+
+def summarize(records: np.ndarray, elapsed: float) -> Dict:
+    """Bölüm sonuçlarının istatistikleri ve değerlendirme hızı"""
+    total_steps = int(records['steps'].sum())
+    return {
+        'episodes': len(records),
+        'truncated': int(records['truncated'].sum()),
+        'score': distribution(records['score']),
+        'steps': distribution(records['steps']),
+        'elapsed': elapsed,
+        'episodes_per_sec': len(records) / max(elapsed, 1e-9),
+        'steps_per_sec': total_steps / max(elapsed, 1e-9)
+    }
+
+def create_executor(workers: int) -> ProcessPoolExecutor:
+    """Değerlendirme işçileri için (torch ile güvenli) spawn tabanlı süreç havuzu"""
+    return ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('spawn'))
+
+def submit_evaluation(executor: ProcessPoolExecutor, model_state: Dict[str, torch.Tensor],
+                      episodes: int, chunks: int, seed: int, **options) -> List[Future]:
+    """Bölümleri parçalara bölüp her parçayı farklı seed'le havuza gönderir"""
+    return [executor.submit(play_greedy, model_state, count, seed + i, **options)
+            for i, count in enumerate(split_episodes(episodes, chunks))]
+
+def evaluate(model_state: Dict[str, torch.Tensor], episodes: int = 1000, workers: int = 1,
+             seed: int = 0, **options) -> Dict:
+    """Bölümleri (workers > 1 ise süreç havuzunda) oynatır ve istatistikleri döndürür"""
+    start = time.perf_counter()
+    if workers <= 1:
+        records = play_greedy(model_state, episodes, seed, **options)
+    else:
+        with create_executor(workers) as executor:
+            # İşçi başına birkaç parça: uzun bölümler tek işçide birikmesin
+            futures = submit_evaluation(executor, model_state, episodes, workers * 4, seed, **options)
+            records = np.concatenate([future.result() for future in futures])
+    return summarize(records, time.perf_counter() - start)
+
+def format_summary(summary: Dict) -> str:
+    """İstatistikleri okunabilir satırlara dönüştürür"""
+    score, steps = summary['score'], summary['steps']
+    return (f"{summary['episodes']} bölüm ({summary['truncated']} adım sınırında kesildi), "
+            f"{summary['elapsed']:.1f} sn, {summary['episodes_per_sec']:.0f} bölüm/sn, "
+            f"{summary['steps_per_sec']:.0f} adım/sn\n"
+            f"  Skor: ort {score['mean']:.2f} ± {score['std']:.2f} | medyan {score['median']:.0f} | "
+            f"p10 {score['p10']:.0f} | p90 {score['p90']:.0f} | p99 {score['p99']:.0f} | "
+            f"en iyi {score['max']:.0f}\n"
+            f"  Uzunluk: ort {steps['mean']:.0f} | medyan {steps['median']:.0f} | "
+            f"p90 {steps['p90']:.0f} | en uzun {steps['max']:.0f}")
+
+class BackgroundEvaluator:
+    """Eğitim sırasında kayıtları ayrı süreçlerde değerlendirir.
+
+    `submit` modelin CPU kopyasını havuza gönderir ve hemen döner; önceki
+    değerlendirme bitmediyse yenisi atlanır, böylece eğitim hiç beklemez.
+    Biten sonuçlar `poll` ile toplanır.
+    """
+
+    def __init__(self, episodes: int, workers: int = 1, seed: int = 0, **options):
+        self.episodes = episodes
+        self.workers = workers
+        self.seed = seed
+        self.options = options
+        self.executor = create_executor(workers)
+        self.pending: Optional[List[Future]] = None
+        self.label = None
+        self.start = 0.0
+
+    def submit(self, model: torch.nn.Module, label) -> bool:
+        """Modelin anlık kopyasını değerlendirmeye gönderir (meşgulse False)"""
+        if self.pending is not None:
+            return False
+        model_state = {k: v.detach().to('cpu', copy=True) for k, v in model.state_dict().items()}
+        self.pending = submit_evaluation(self.executor, model_state, self.episodes,
+                                         self.workers, self.seed, **self.options)
+        self.label = label
+        self.start = time.perf_counter()
+        return True
+
+    def poll(self, wait: bool = False) -> Optional[Dict]:
+        """Değerlendirme bittiyse istatistikleri döndürür"""
+        if self.pending is None or not (wait or all(f.done() for f in self.pending)):
+            return None
+        records = np.concatenate([future.result() for future in self.pending])
+        self.pending = None
+        summary = summarize(records, time.perf_counter() - self.start)
+        summary['label'] = self.label
+        return summary
+
+    def close(self) -> Optional[Dict]:
+        """Bekleyen değerlendirmeyi bitirir ve havuzu kapatır"""
+        summary = self.poll(wait=True)
+        self.executor.shutdown()
+        return summary
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Kayıtlı modelin açgözlü politikasını değerlendirir")
+    parser.add_argument('checkpoint', nargs='?', default=os.path.join("models", "snake_ai_model.pth"))
+    parser.add_argument('--episodes', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Süreç sayısı (1: aynı süreçte)")
+    parser.add_argument('--num-envs', type=int, default=64, help="İşçi başına aynı anki tahta sayısı")
+    parser.add_argument('--max-steps', type=int, default=5000,
+                        help="Bölüm başına adım sınırı (0: sınırsız)")
+    parser.add_argument('--width', type=int, default=800)
+    parser.add_argument('--height', type=int, default=600)
+    parser.add_argument('--block-size', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="İstatistiklerin yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    # Gözlem türü kayıttan okunur; ızgara modeli yalnızca eğitildiği tahta boyutunda çalışır
+    model_state, config = load_model_state(args.checkpoint)
+    probe = VecSnakeEnv(1, args.width, args.height, args.block_size,
+                        observation=config['observation'], body_age=config['body_age'])
+    if probe.state_size != config['state_size']:
+        parser.error(f"{args.checkpoint} ({describe_config(config)}) bu tahta boyutuyla "
+                     f"değerlendirilemez (durum boyutu {probe.state_size})")
+
+    summary = evaluate(model_state, args.episodes, args.workers, args.seed,
+                       num_envs=args.num_envs, max_steps=args.max_steps, width=args.width,
+                       height=args.height, block_size=args.block_size,
+                       observation=config['observation'], body_age=config['body_age'])
+    print(format_summary(summary))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+if __name__ == '__main__':
+    main()
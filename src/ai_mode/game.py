@@ -1,46 +1,49 @@
 import pygame
+import torch
 import sys
 import time
 import os
-import json
 from typing import Tuple, Dict
 from src.classic_mode.snake import Snake
 from src.classic_mode.food import Food
+from src.classic_mode.settings_store import SettingsStore
+from src.classic_mode.sound_bank import SoundBank
+from src.classic_mode.renderer import DirtyRenderer
+from src.classic_mode.text_cache import render_text, overlay_surface
+from src.classic_mode.recording import EpisodeRecorder, MODE_AI
 from .dqn_agent import DQNAgent
+from .state_encoder import StateEncoder
+from .checkpoint import CheckpointWriter, write_json
+from .metrics_log import EpisodeLog
+from .profiler import PhaseTimer
 
 class AIGame:
-    def __init__(self, width: int = 800, height: int = 600):
-        pygame.mixer.init()  # Ses sistemini başlat
+    def __init__(self, width: int = 800, height: int = 600, settings_store: SettingsStore = None,
+                 sound_bank: SoundBank = None):
         self.width = width
         self.height = height
         self.block_size = 20
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Yılan Oyunu - AI Modu")
         
-        # Oyun hızı ayarları
+        # Oyun hızı ayarları (saniyedeki simülasyon adımı)
         self.speed = 10  # Başlangıç hızı
         self.min_speed = 5  # Minimum hız
-        self.max_speed = 120  # Maksimum hız
+        self.max_speed = 5000  # Maksimum hız
+        self.turbo = False  # Açıkken her karede zaman bütçesi kadar adım atılır
+        self.render_fps = 30  # Hedef ekran yenileme hızı
+        self.max_steps_per_frame = 1000  # Geride kalınca biriken adımların üst sınırı
+        self.step_accumulator = 0.0  # Henüz işlenmemiş kesirli adımlar
         self.current_fps = self.speed  # Mevcut FPS
         
-        # Ses efektlerini yükle
-        self.sounds_dir = "assets/sounds"
-        os.makedirs(self.sounds_dir, exist_ok=True)
+        # Paylaşılan ses bankasından bu moda ait seviyelerle oynatıcı al
+        self.sound_bank = sound_bank or SoundBank()
+        self.sounds = self.sound_bank.player()
         
-        # Varsayılan ses dosyaları oluştur
-        self.create_default_sounds()
-        
-        # Ses efektlerini yükle
-        self.eat_sound = pygame.mixer.Sound(os.path.join(self.sounds_dir, "eat.wav"))
-        self.crash_sound = pygame.mixer.Sound(os.path.join(self.sounds_dir, "crash.wav"))
-        self.move_sound = pygame.mixer.Sound(os.path.join(self.sounds_dir, "move.wav"))
-        
-        # Ayarları yükle
+        # Ayarları yükle ve değişikliklere abone ol
+        self.settings_store = settings_store or SettingsStore()
         self.settings = self.load_settings()
-        self.sound_enabled = self.settings.get('ai_sound_enabled', True)
-        self.eat_sound.set_volume(self.settings.get('eat_sound_volume', 0.5))
-        self.crash_sound.set_volume(self.settings.get('crash_sound_volume', 0.3))
-        self.move_sound.set_volume(self.settings.get('move_sound_volume', 0.1))
+        self.settings_store.subscribe(self.load_settings)
         
         # Modern renk paleti (klasik mod ile aynı)
         self.BACKGROUND_COLOR = (17, 24, 39)  # Koyu lacivert
@@ -54,24 +57,48 @@ class AIGame:
         self.FOOD_COLOR = (248, 113, 113)  # Açık kırmızı
         self.BORDER_COLOR = (75, 85, 99)  # Gri
         
+        # Yalnızca değişen bölgeleri çizen ekran güncelleyici
+        self.renderer = DirtyRenderer(self.screen, self.block_size, self.BACKGROUND_COLOR,
+                                      self.TEXT_COLOR, self.SNAKE_COLOR, self.FOOD_COLOR)
+        
         # AI ajanını oluştur
         self.state_size = 12  # 4 yön + 4 yemek konumu + 4 tehlike
         self.action_size = 4  # Yukarı, Aşağı, Sol, Sağ
         self.agent = DQNAgent(self.state_size, self.action_size)
+        self.encoder = StateEncoder(self.width, self.height, self.block_size)
         
         # Model ve eğitim verilerinin yolları
         self.models_dir = "models"
         os.makedirs(self.models_dir, exist_ok=True)
         self.model_path = os.path.join(self.models_dir, "snake_ai_model.pth")
-        self.training_data_path = os.path.join(self.models_dir, "training_data.json")
+        self.training_data_path = os.path.join(self.models_dir, "training_data.json")  # Eski biçim
+        self.episode_log_path = os.path.join(self.models_dir, "episodes.bin")
+        self.training_summary_path = os.path.join(self.models_dir, "training_summary.json")
+        
+        # Kayıtlar arka planda, en fazla 10 saniyede veya 50 bölümde bir yazılır
+        self.checkpointer = CheckpointWriter(min_interval=10.0, every_episodes=50)
+        
+        # Her bölüm seed + adım başına bir yön baytı olarak kaydedilir
+        self.recorder = EpisodeRecorder(os.path.join(self.models_dir, "recordings.bin"), MODE_AI)
+        
+        # Sıcak yol aşamalarının süre ölçümü (P ile açılır, açıkken periyodik olarak dosyaya eklenir)
+        self.profiler = PhaseTimer(dump_path=os.path.join(self.models_dir, "profile.jsonl"))
+        self.profiler_phases = ['settings', 'get_state', 'act', 'snake_update', 'replay',
+                                'checkpoint', 'draw']
+        self.profiler_rates = {'steps': 'Adım/sn', 'replay_calls': 'Replay/sn', 'frames': 'Kare/sn'}
         
         # Eğitim verilerini yükle
-        self.training_data = self.load_training_data()
-        self.best_score = self.training_data['best_score']  # En iyi skoru yükle
+        self.episode_log = EpisodeLog(self.episode_log_path, self.training_summary_path,
+                                      legacy_path=self.training_data_path)
+        self.best_score = self.episode_log.best_score  # En iyi skoru yükle
         
         # Model dosyası varsa yükle
         if os.path.exists(self.model_path):
-            self.agent.load(self.model_path)
+            try:
+                self.agent.load(self.model_path)
+            except ValueError as e:
+                # Ör. ızgara gözlemiyle eğitilmiş bir kayıt: oyun 12 özellikli vektörle oynar
+                print(f"Model yüklenmedi, sıfırdan başlanıyor: {e}")
         
         self.reset_game()
         
@@ -87,7 +114,9 @@ class AIGame:
         """Oyunu başlangıç durumuna getirir"""
         start_pos = (self.width // 2, self.height // 2)
         self.snake = Snake(start_pos, self.block_size)
-        self.food = Food(self.width, self.height, self.block_size)
+        rng = self.recorder.begin(self.width, self.height, self.block_size, start_pos)
+        self.food = Food(self.width, self.height, self.block_size, self.snake.body, rng=rng)
+        self.renderer.track(self.snake, self.food)
         
         self.score = 0
         self.paused = False
@@ -95,91 +124,33 @@ class AIGame:
         self.clock = pygame.time.Clock()
         self.start_time = time.time()
         self.elapsed_time = 0
+        self.episode_steps = 0
         self.episode_rewards = 0
         self.total_episodes = 0  # Bu sayaç her oyun başladığında sıfırlanacak
+        self.state = self.encoder.encode(self.snake.body, self.food.position)
 
-    def load_training_data(self) -> Dict:
-        """Eğitim verilerini yükle"""
-        if os.path.exists(self.training_data_path):
-            try:
-                with open(self.training_data_path, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
+    def checkpoint_snapshot(self) -> Dict:
+        """Model ve eğitim verilerinin arka planda yazılacak anlık görüntüsü"""
         return {
-            'total_episodes': 0,
-            'best_score': 0,
-            'average_scores': [],
-            'training_time': 0
+            self.model_path: (torch.save, self.agent.checkpoint_state()),
+            self.training_summary_path: (write_json, self.episode_log.summary())
         }
 
-    def save_training_data(self) -> None:
-        """Eğitim verilerini kaydet"""
-        current_data = {
-            'total_episodes': self.training_data['total_episodes'] + self.total_episodes,
-            'best_score': max(self.training_data['best_score'], self.best_score),
-            'average_scores': self.training_data['average_scores'] + [self.score],
-            'training_time': self.training_data['training_time'] + self.elapsed_time
-        }
-        
-        with open(self.training_data_path, 'w') as f:
-            json.dump(current_data, f)
-
-    def create_default_sounds(self):
-        """Varsayılan ses dosyalarını oluştur"""
-        import wave
-        import struct
-        import numpy as np
-        
-        # Yem yeme sesi (yüksek tonlu bip)
-        if not os.path.exists(os.path.join(self.sounds_dir, "eat.wav")):
-            samplerate = 44100
-            duration = 0.1  # saniye
-            frequency = 1000  # Hz
-            t = np.linspace(0, duration, int(samplerate * duration))
-            data = np.sin(2 * np.pi * frequency * t) * 32767
-            data = data.astype(np.int16)
-            
-            with wave.open(os.path.join(self.sounds_dir, "eat.wav"), 'wb') as f:
-                f.setnchannels(1)
-                f.setsampwidth(2)
-                f.setframerate(samplerate)
-                f.writeframes(data.tobytes())
-        
-        # Çarpışma sesi (düşük tonlu bip)
-        if not os.path.exists(os.path.join(self.sounds_dir, "crash.wav")):
-            samplerate = 44100
-            duration = 0.2  # saniye
-            frequency = 500  # Hz
-            t = np.linspace(0, duration, int(samplerate * duration))
-            data = np.sin(2 * np.pi * frequency * t) * 32767
-            data = data.astype(np.int16)
-            
-            with wave.open(os.path.join(self.sounds_dir, "crash.wav"), 'wb') as f:
-                f.setnchannels(1)
-                f.setsampwidth(2)
-                f.setframerate(samplerate)
-                f.writeframes(data.tobytes())
-        
-        # Hareket sesi (çok kısa bip)
-        if not os.path.exists(os.path.join(self.sounds_dir, "move.wav")):
-            samplerate = 44100
-            duration = 0.05  # saniye
-            frequency = 800  # Hz
-            t = np.linspace(0, duration, int(samplerate * duration))
-            data = np.sin(2 * np.pi * frequency * t) * 16383  # Daha düşük ses seviyesi
-            data = data.astype(np.int16)
-            
-            with wave.open(os.path.join(self.sounds_dir, "move.wav"), 'wb') as f:
-                f.setnchannels(1)
-                f.setsampwidth(2)
-                f.setframerate(samplerate)
-                f.writeframes(data.tobytes())
+    def finish_episode(self) -> None:
+        """Bölümü bitirir, gerekirse kaydı kuyruğa koyar ve oyunu yeniden başlatır"""
+        self.total_episodes += 1
+        self.recorder.finish(self.score)
+        if self.training:
+            self.episode_log.append(self.score, self.episode_steps,
+                                    time.time() - self.start_time, self.agent.epsilon)
+            with self.profiler.measure('checkpoint'):
+                self.checkpointer.episode_finished(self.checkpoint_snapshot)
+        self.reset_game()
 
-    def play_sound(self, sound: pygame.mixer.Sound) -> None:
-        """Ses efektini çal"""
+    def play_sound(self, name: str) -> None:
+        """Ses efektini çal ('eat', 'crash' veya 'move')"""
         if self.sound_enabled:
-            sound.play()
+            self.sounds.play(name)
 
     def handle_input(self) -> str:
         """Kullanıcı girdilerini işler"""
@@ -187,6 +158,9 @@ class AIGame:
             if event.type == pygame.QUIT:
                 return 'QUIT'
             
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                self.renderer.invalidate()  # Pencere yeniden çizilmeli
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return 'MENU'
@@ -197,9 +171,13 @@ class AIGame:
                 elif event.key == pygame.K_m:  # Ses açma/kapama
                     self.sound_enabled = not self.sound_enabled
                 elif event.key == pygame.K_UP:  # Hızı artır
-                    self.speed = min(self.speed + 5, self.max_speed)
+                    self.change_speed(1)
                 elif event.key == pygame.K_DOWN:  # Hızı azalt
-                    self.speed = max(self.speed - 5, self.min_speed)
+                    self.change_speed(-1)
+                elif event.key == pygame.K_t:  # Turbo modu aç/kapat
+                    self.turbo = not self.turbo
+                elif event.key == pygame.K_p:  # Performans panelini aç/kapat
+                    self.profiler.set_enabled(not self.profiler.enabled)
         
         return None
 
@@ -208,32 +186,31 @@ class AIGame:
         if self.paused:
             return
 
-        # Mevcut durumu al
-        state = self.agent.get_state(
-            self.snake.body[0],
-            self.snake.body,
-            self.food.position,
-            self.width,
-            self.height
-        )
+        # Mevcut durum bir önceki adımın sonraki durumudur
+        state = self.state
         
         # AI'nin aksiyonunu al
-        action = self.agent.act(state, self.training)
+        with self.profiler.measure('act'):
+            action = self.agent.act(state, self.training)
         
         # Yılanın yönünü değiştir
         old_direction = self.snake.direction
         self.snake.direction = self.action_map[action]
+        self.recorder.record(action)
         
         # Yön değiştiyse hareket sesi çal
         if old_direction != self.snake.direction:
-            self.play_sound(self.move_sound)
+            self.play_sound('move')
         
         # Önceki pozisyonu kaydet
         old_distance = ((self.snake.body[0][0] - self.food.position[0])**2 + 
                        (self.snake.body[0][1] - self.food.position[1])**2)**0.5
         
         # Yılanı güncelle
-        self.snake.update()
+        with self.profiler.measure('snake_update'):
+            self.snake.update()
+            collided = self.snake.check_collision(self.width, self.height)
+        self.episode_steps += 1
         
         # Yeni pozisyonu al
         new_distance = ((self.snake.body[0][0] - self.food.position[0])**2 + 
@@ -244,27 +221,25 @@ class AIGame:
         done = False
         
         # Çarpışma kontrolü
-        if self.snake.check_collision(self.width, self.height):
-            self.play_sound(self.crash_sound)
+        if collided:
+            self.play_sound('crash')
             reward = -10
             done = True
-            self.total_episodes += 1
-            # Modeli ve verileri kaydet
-            if self.training:
-                self.agent.save(self.model_path)
-                self.save_training_data()
-            # Oyunu otomatik olarak yeniden başlat
-            self.reset_game()
+            # Oyunu otomatik olarak yeniden başlat (kayıt arka planda yapılır)
+            self.finish_episode()
         
         # Yem yeme kontrolü
         elif self.snake.body[0] == self.food.position:
-            self.play_sound(self.eat_sound)
+            self.play_sound('eat')
             reward = 10
             self.score += 1
             if self.score > self.best_score:
                 self.best_score = self.score
             self.snake.grow_snake()
-            self.food.respawn(self.snake.body)
+            if not self.food.respawn(self.snake.body):
+                # Tahta doldu: oyun kazanıldı, bölümü bitir
+                done = True
+                self.finish_episode()
         
         # Yeme yaklaşma/uzaklaşma kontrolü
         else:
@@ -272,34 +247,31 @@ class AIGame:
         
         self.episode_rewards += reward
         
-        # Yeni durumu al
-        next_state = self.agent.get_state(
-            self.snake.body[0],
-            self.snake.body,
-            self.food.position,
-            self.width,
-            self.height
-        )
+        # Yeni durumu al (bölüm bittiyse reset_game yeni oyunun durumunu hesapladı)
+        if not done:
+            with self.profiler.measure('get_state'):
+                self.state = self.encoder.encode(self.snake.body, self.food.position)
+        next_state = self.state
         
         # Deneyimi hafızaya ekle ve eğit
         if self.training:
             self.agent.remember(state, action, reward, next_state, done)
-            self.agent.replay()
+            with self.profiler.measure('replay'):
+                self.agent.learn()
         
         # Zamanı güncelle
         self.elapsed_time = int(time.time() - self.start_time)
 
-    def draw(self) -> None:
-        """Oyunu ekrana çizer"""
-        self.screen.fill(self.BACKGROUND_COLOR)
-        
-        # Yılan ve yemi çiz
-        self.snake.draw(self.screen, self.SNAKE_COLOR)
-        self.food.draw(self.screen, self.FOOD_COLOR)
-        
-        # Font ayarla
-        font = pygame.font.Font(None, 36)
+    def draw_pause_overlay(self) -> None:
+        """Duraklatma katmanını çizer"""
+        self.screen.blit(overlay_surface((self.width, self.height), 128), (0, 0))
         
+        pause_text = render_text('DURAKLATILDI - SPACE ile Devam Et', 36, self.PAUSE_COLOR)
+        text_rect = pause_text.get_rect(center=(self.width/2, self.height/2))
+        self.screen.blit(pause_text, text_rect)
+
+    def draw(self) -> None:
+        """Oyunu ekrana çizer (duraklatılmadıysa yalnızca değişen bölgeler güncellenir)"""
         # Bilgileri göster
         info_texts = [
             f'Skor: {self.score}',
@@ -307,64 +279,97 @@ class AIGame:
             f'Süre: {self.elapsed_time}s',
             f'Episode: {self.total_episodes}',
             f'Eğitim: {"Açık" if self.training else "Kapalı"}',
-            f'Hız: {self.speed} FPS',
+            f'Hız: {"Turbo" if self.turbo else f"{self.speed} adım/sn"}',
             f'Ses: {"Açık" if self.sound_enabled else "Kapalı"}'
         ]
+        hud_items = [(text, {'topleft': (20, 20 + i * 30)}) for i, text in enumerate(info_texts)]
         
-        for i, text in enumerate(info_texts):
-            text_surface = font.render(text, True, self.TEXT_COLOR)
-            self.screen.blit(text_surface, (20, 20 + i * 30))
+        # Performans paneli sağ üstte (metin yalnızca rapor aralığında değişir)
+        if self.profiler.enabled:
+            lines = self.profiler.lines(self.profiler_phases, self.profiler_rates)
+            hud_items += [(text, {'topright': (self.width - 20, 20 + i * 26)})
+                          for i, text in enumerate(lines)]
         
-        # Duraklatma mesajı
+        self.renderer.present(hud_items, self.draw_pause_overlay if self.paused else None)
+
+    def change_speed(self, direction: int) -> None:
+        """Hızı değiştirir: 100 adım/sn'ye kadar 5'er, üstünde ikişer kat"""
+        if direction > 0:
+            self.speed = self.speed + 5 if self.speed < 100 else self.speed * 2
+            self.speed = min(self.speed, self.max_speed)
+        else:
+            self.speed = self.speed - 5 if self.speed <= 100 else self.speed // 2
+            self.speed = max(self.speed, self.min_speed)
+
+    def simulate(self, elapsed: float, deadline: float) -> int:
+        """Geçen süreye düşen sayıda adımı (turboda süre bitene kadar) işler"""
         if self.paused:
-            s = pygame.Surface((self.width, self.height))
-            s.set_alpha(128)
-            s.fill((0, 0, 0))
-            self.screen.blit(s, (0, 0))
-            
-            pause_text = font.render('DURAKLATILDI - SPACE ile Devam Et', True, self.PAUSE_COLOR)
-            text_rect = pause_text.get_rect(center=(self.width/2, self.height/2))
-            self.screen.blit(pause_text, text_rect)
-        
-        pygame.display.flip()
+            self.step_accumulator = 0.0
+            return 0
+        
+        if self.turbo:
+            steps = 0
+            while time.perf_counter() < deadline:
+                self.update()
+                steps += 1
+            self.step_accumulator = 0.0
+            return steps
+        
+        # Sabit zaman adımı: biriken süre kadar adım at, yetişemezsen birikmişi at
+        self.step_accumulator += elapsed * self.speed
+        steps = min(int(self.step_accumulator), self.max_steps_per_frame)
+        self.step_accumulator -= steps
+        for done in range(steps):
+            self.update()
+            if time.perf_counter() >= deadline and done + 1 < steps:
+                self.step_accumulator = 0.0
+                return done + 1
+        if steps == self.max_steps_per_frame:
+            self.step_accumulator = 0.0
+        return steps
 
     def run(self) -> str:
-        """Ana oyun döngüsü"""
+        """Ana oyun döngüsü: simülasyon `speed` adım/sn, ekran `render_fps` ile çalışır"""
+        self.renderer.invalidate()  # Ekranı başka bir ekrandan devral
+        self.step_accumulator = 0.0
+        last_time = time.perf_counter()
         while True:
-            # Ayarları yeniden yükle
-            settings_file = "data/settings.json"
-            try:
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                    self.sound_enabled = settings.get('ai_sound_enabled', True)
-                    self.eat_sound.set_volume(settings.get('eat_sound_volume', 0.5))
-                    self.crash_sound.set_volume(settings.get('crash_sound_volume', 0.3))
-                    self.move_sound.set_volume(settings.get('move_sound_volume', 0.1))
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
+            # Ayar dosyası dışarıdan değiştiyse (düşük frekansta) yeniden yükle
+            with self.profiler.measure('settings'):
+                self.settings_store.poll()
             
             action = self.handle_input()
             if action:
+                # Çıkmadan önce modeli kaydet ve bekleyen yazmaları bitir
+                if self.training:
+                    self.checkpointer.submit(self.checkpoint_snapshot())
+                self.checkpointer.flush()
                 return action
             
-            self.update()
-            self.draw()
-            self.clock.tick(self.speed)  # Hız ayarına göre FPS'i güncelle
+            now = time.perf_counter()
+            # Karenin %90'ı simülasyona, kalanı çizime ayrılır
+            train_steps = self.agent.train_steps
+            steps = self.simulate(now - last_time, now + 0.9 / self.render_fps)
+            last_time = now
+            
+            with self.profiler.measure('draw'):
+                self.draw()
+            if self.profiler.enabled:
+                self.profiler.count('steps', steps)
+                self.profiler.count('replay_calls',
+                                    (self.agent.train_steps - train_steps) // self.agent.gradient_steps)
+                self.profiler.count('frames')
+                self.profiler.tick()
+            self.current_fps = self.clock.get_fps()
+            self.clock.tick(self.render_fps)
 
     def load_settings(self, settings: dict = None) -> dict:
-        """Ayarları yükler"""
-        if settings is not None:
-            return settings
-            
-        # Ayarlar verilmediyse dosyadan oku
-        settings_file = "data/settings.json"
-        try:
-            with open(settings_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {
-                'ai_sound_enabled': True,
-                'eat_sound_volume': 0.5,
-                'crash_sound_volume': 0.3,
-                'move_sound_volume': 0.1
-            } 
\ No newline at end of file
+        """Ayarları yükler ve uygular"""
+        if settings is None:
+            settings = self.settings_store.all()
+        self.sound_enabled = settings.get('ai_sound_enabled', True)
+        self.sounds.set_volume('eat', settings.get('eat_sound_volume', 0.5))
+        self.sounds.set_volume('crash', settings.get('crash_sound_volume', 0.3))
+        self.sounds.set_volume('move', settings.get('move_sound_volume', 0.1))
+        self.settings = settings
+        return settings
@@ -0,0 +1,139 @@
+import json
+import os
+from collections import deque
+from typing import Dict, Optional
+
+import numpy as np
+
+class EpisodeLog:
+    """Yalnızca ekleme yapılan, sabit boyutlu ikili bölüm kayıtları.
+
+    Her bölüm `RECORD` biçiminde 16 baytlık bir kayıttır. Toplam bölüm, en
+    iyi skor, toplam süre gibi birikimli değerler bellekte artımlı tutulur
+    ve küçük bir özet JSON dosyasına yazılır; açılışta tüm geçmiş değil
+    yalnızca özet, özetten sonra eklenmiş kayıtlar ve kayan ortalama için
+    son `window` kayıt okunur.
+    """
+
+    RECORD = np.dtype([
+        ('score', '<u4'),
+        ('steps', '<u4'),
+        ('duration', '<f4'),  # saniye
+        ('epsilon', '<f4')
+    ])
+
+    def __init__(self, log_path: str, summary_path: str, window: int = 100,
+                 legacy_path: Optional[str] = None):
+        self.log_path = log_path
+        self.summary_path = summary_path
+        self.recent_scores = deque(maxlen=window)
+
+        self.records = 0  # Günlükteki kayıt sayısı
+        self.base_episodes = 0  # Eski training_data.json'dan gelen bölümler
+        self.total_episodes = 0
+        self.best_score = 0
+        self.training_time = 0.0
+        self.total_steps = 0
+        self.score_sum = 0
+
+        directory = os.path.dirname(log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._load(legacy_path)
+        self._file = open(log_path, 'ab')
+
+    def _load(self, legacy_path: Optional[str]) -> None:
+        """Özeti ve günlüğün yalnızca gereken kısımlarını okur"""
+        log_records = 0
+        if os.path.exists(self.log_path):
+            size = os.path.getsize(self.log_path)
+            log_records = size // self.RECORD.itemsize
+            if size % self.RECORD.itemsize:
+                # Yarım kalmış son kaydı at
+                os.truncate(self.log_path, log_records * self.RECORD.itemsize)
+
+        summary = None
+        if os.path.exists(self.summary_path):
+            try:
+                with open(self.summary_path, 'r') as f:
+                    summary = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                summary = None
+
+        if summary is not None and summary.get('records', 0) <= log_records:
+            self.records = summary['records']
+            self.base_episodes = summary.get('base_episodes', 0)
+            self.total_episodes = summary['total_episodes']
+            self.best_score = summary['best_score']
+            self.training_time = summary['training_time']
+            self.total_steps = summary['total_steps']
+            self.score_sum = summary['score_sum']
+        elif legacy_path and os.path.exists(legacy_path):
+            # Eski biçimden yalnızca birikimli değerleri devral
+            try:
+                with open(legacy_path, 'r') as f:
+                    legacy = json.load(f)
+                self.base_episodes = int(legacy.get('total_episodes', 0))
+                self.total_episodes = self.base_episodes
+                self.best_score = int(legacy.get('best_score', 0))
+                self.training_time = float(legacy.get('training_time', 0))
+            except (OSError, ValueError, json.JSONDecodeError):
+                pass
+
+        # Özetten sonra eklenmiş (veya özet yoksa tüm) kayıtları işle
+        if log_records > self.records:
+            self._accumulate(self.read_records(self.records, log_records - self.records))
+
+        tail = self.read_records(max(0, log_records - self.recent_scores.maxlen))
+        self.recent_scores.extend(int(score) for score in tail['score'])
+
+    def _accumulate(self, records: np.ndarray) -> None:
+        """Kayıtları birikimli değerlere ekler"""
+        if len(records) == 0:
+            return
+        self.records += len(records)
+        self.total_episodes += len(records)
+        self.best_score = max(self.best_score, int(records['score'].max()))
+        self.training_time += float(records['duration'].sum(dtype=np.float64))
+        self.total_steps += int(records['steps'].sum(dtype=np.int64))
+        self.score_sum += int(records['score'].sum(dtype=np.int64))
+
+    def read_records(self, start: int = 0, count: int = -1) -> np.ndarray:
+        """Günlükten `start` kaydından itibaren `count` (-1: tümü) kaydı okur"""
+        if getattr(self, '_file', None) is not None:
+            self._file.flush()
+        if not os.path.exists(self.log_path):
+            return np.zeros(0, dtype=self.RECORD)
+        return np.fromfile(self.log_path, dtype=self.RECORD, count=count,
+                           offset=start * self.RECORD.itemsize)
+
+    def append(self, score: int, steps: int, duration: float, epsilon: float = 0.0) -> None:
+        """Bir bölüm kaydı ekler ve birikimli değerleri günceller"""
+        record = np.array([(score, steps, duration, epsilon)], dtype=self.RECORD)
+        self._file.write(record.tobytes())
+        self._accumulate(record)
+        self.recent_scores.append(score)
+
+    @property
+    def average_score(self) -> float:
+        """Son `window` bölümün ortalama skoru"""
+        if not self.recent_scores:
+            return 0.0
+        return sum(self.recent_scores) / len(self.recent_scores)
+
+    def summary(self) -> Dict:
+        """Özet dosyasına yazılacak birikimli değerler (önce günlüğü diske aktarır)"""
+        self._file.flush()
+        return {
+            'records': self.records,
+            'base_episodes': self.base_episodes,
+            'total_episodes': self.total_episodes,
+            'best_score': self.best_score,
+            'training_time': self.training_time,
+            'total_steps': self.total_steps,
+            'score_sum': self.score_sum,
+            'average_score': self.average_score
+        }
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,136 @@
+import json
+import os
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+import numpy as np
+
+_DISABLED = nullcontext()  # Kapalıyken her ölçümde dönen paylaşılan boş bağlam
+
+class PhaseTimer:
+    """Sıcak yoldaki aşamalar için düşük maliyetli süre ölçümü.
+
+    Her aşamanın son `window` süresi sabit boyutlu bir halka dizide tutulur;
+    ortalama, p95 ve saniyedeki çağrı sayısı her `report_interval` saniyede
+    bir (`tick` içinde) hesaplanır, böylece HUD metni her karede değişmez.
+    `dump_path` verilirse aynı anlık görüntü `dump_interval` saniyede bir
+    JSON satırı olarak dosyaya eklenir. Kapalıyken `measure` paylaşılan boş
+    bir bağlam döndürür ve `count` hemen döner.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 256, report_interval: float = 0.5,
+                 dump_path: Optional[str] = None, dump_interval: float = 10.0):
+        self.enabled = enabled
+        self.window = window
+        self.report_interval = report_interval
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self.reset()
+
+    def reset(self) -> None:
+        """Tüm istatistikleri sıfırlar"""
+        self.samples: Dict[str, np.ndarray] = {}  # Aşama -> son süreler (sn)
+        self.calls: Dict[str, int] = {}  # Aşama/sayaç -> toplam çağrı
+        self.report_calls: Dict[str, int] = {}  # Son rapordaki toplam çağrı
+        self.stats: Dict[str, Dict[str, float]] = {}
+        now = time.perf_counter()
+        self.report_time = now
+        self.dump_time = now
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Ölçümü açar/kapatır; açılışta eski istatistikler atılır"""
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+
+    def measure(self, name: str):
+        """`with timer.measure('act'):` bloğunun süresini kaydeder"""
+        if not self.enabled:
+            return _DISABLED
+        return _Measurement(self, name)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Bir aşama süresini kaydeder"""
+        calls = self.calls.get(name, 0)
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = np.zeros(self.window)
+        samples[calls % self.window] = seconds
+        self.calls[name] = calls + 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Süresi ölçülmeyen bir olayı sayar (ör. simülasyon adımları)"""
+        if self.enabled:
+            self.calls[name] = self.calls.get(name, 0) + n
+
+    def tick(self) -> bool:
+        """Her karede çağrılır; rapor zamanı geldiyse istatistikleri yeniler"""
+        if not self.enabled:
+            return False
+        now = time.perf_counter()
+        elapsed = now - self.report_time
+        if elapsed < self.report_interval:
+            return False
+
+        stats = {}
+        for name, calls in self.calls.items():
+            entry = {'per_sec': (calls - self.report_calls.get(name, 0)) / elapsed, 'calls': calls}
+            samples = self.samples.get(name)
+            if samples is not None:
+                recent = samples[:min(calls, self.window)]
+                entry['mean_ms'] = float(recent.mean()) * 1000
+                entry['p95_ms'] = float(np.percentile(recent, 95)) * 1000
+            stats[name] = entry
+        self.stats = stats
+        self.report_calls = dict(self.calls)
+        self.report_time = now
+
+        if self.dump_path and now - self.dump_time >= self.dump_interval:
+            self.dump()
+            self.dump_time = now
+        return True
+
+    def snapshot(self) -> Dict:
+        """Son raporun JSON'a yazılabilir kopyası"""
+        return {'time': time.time(), 'phases': self.stats}
+
+    def dump(self, path: Optional[str] = None) -> None:
+        """Son raporu dosyaya bir JSON satırı olarak ekler"""
+        path = path or self.dump_path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.snapshot()) + '\n')
+
+    def lines(self, phases: List[str], rates: Dict[str, str]) -> List[str]:
+        """HUD paneli satırları: aşama başına ms ve istenen sayaçların saniyelik hızları"""
+        lines = []
+        for name in phases:
+            entry = self.stats.get(name)
+            if entry is not None and 'mean_ms' in entry:
+                lines.append(f"{name}: {entry['mean_ms']:.3f} ms (p95 {entry['p95_ms']:.3f})")
+            else:
+                lines.append(f"{name}: -")
+        for name, label in rates.items():
+            entry = self.stats.get(name)
+            lines.append(f"{label}: {entry['per_sec'] if entry else 0:.0f}")
+        return lines
+
+class _Measurement:
+    """`PhaseTimer.measure` tarafından döndürülen bağlam"""
+
+    __slots__ = ('timer', 'name', 'start')
+
+    def __init__(self, timer: PhaseTimer, name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.add(self.name, time.perf_counter() - self.start)
+        return False
@@ -0,0 +1,279 @@
+import numpy as np
+import torch
+from typing import Optional, Tuple, Union
+
+StateSize = Union[int, Tuple[int, ...]]  # Vektör uzunluğu veya ızgara şekli (C, H, W)
+
+class ReplayBuffer:
+    """Önceden ayrılmış NumPy dizileri üzerinde halka tampon deneyim hafızası.
+
+    Ekleme O(1), örnekleme vektörel indeks seçimidir. `sample` sonuçları
+    yeniden kullanılan batch dizileri üzerindeki `torch.from_numpy`
+    görünümleridir; bir sonraki `sample` çağrısında üzerine yazılırlar.
+    Durumlar `state_dtype` ile saklanır (ızgara gözlemleri için ör. uint8);
+    ağ girdiyi kendisi float'a çevirir. Her deneyim hedefte `next_state`
+    değerinin çarpılacağı indirimi (`discount`, n adımlık geçişte gamma^n)
+    da saklar.
+    """
+
+    def __init__(self, capacity: int, state_size: StateSize, seed: Optional[int] = None,
+                 state_dtype=np.float32):
+        self.capacity = capacity
+        self.state_size = state_size
+        self.state_shape = tuple(np.atleast_1d(state_size))
+        self.state_dtype = np.dtype(state_dtype)
+        self.rng = np.random.default_rng(seed)
+
+        self.states = np.zeros((capacity,) + self.state_shape, dtype=self.state_dtype)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity,) + self.state_shape, dtype=self.state_dtype)
+        self.dones = np.zeros(capacity, dtype=np.float32)
+        self.discounts = np.zeros(capacity, dtype=np.float32)
+
+        self.position = 0  # Bir sonraki yazılacak indeks
+        self.size = 0
+        self._batch_size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, state: np.ndarray, action: int, reward: float,
+            next_state: np.ndarray, done: bool, discount: float) -> None:
+        """Tek bir deneyimi ekler (`discount`: tek adımda gamma, n adımda gamma^n)"""
+        i = self.position
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self.discounts[i] = discount
+        self.position = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def add_batch(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                  next_states: np.ndarray, dones: np.ndarray,
+                  discounts: Union[float, np.ndarray]) -> np.ndarray:
+        """Birden fazla deneyimi tek seferde ekler ve yazılan indeksleri döndürür"""
+        n = len(actions)
+        discounts = np.broadcast_to(np.asarray(discounts, dtype=np.float32), (n,))
+        if n > self.capacity:
+            # Sadece son `capacity` kadar deneyim saklanabilir
+            states, actions, rewards = states[-self.capacity:], actions[-self.capacity:], rewards[-self.capacity:]
+            next_states, dones = next_states[-self.capacity:], dones[-self.capacity:]
+            discounts = discounts[-self.capacity:]
+            n = self.capacity
+        indices = (self.position + np.arange(n)) % self.capacity
+        self.states[indices] = states
+        self.actions[indices] = actions
+        self.rewards[indices] = rewards
+        self.next_states[indices] = next_states
+        self.dones[indices] = dones
+        self.discounts[indices] = discounts
+        self.position = (self.position + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+        return indices
+
+    def _ensure_batch(self, batch_size: int) -> None:
+        """Batch dizilerini ve tensör görünümlerini (gerekirse) yeniden ayırır"""
+        if batch_size == self._batch_size:
+            return
+        self._batch_size = batch_size
+        self._b_states = np.zeros((batch_size,) + self.state_shape, dtype=self.state_dtype)
+        self._b_actions = np.zeros(batch_size, dtype=np.int64)
+        self._b_rewards = np.zeros(batch_size, dtype=np.float32)
+        self._b_next_states = np.zeros((batch_size,) + self.state_shape, dtype=self.state_dtype)
+        self._b_dones = np.zeros(batch_size, dtype=np.float32)
+        self._b_discounts = np.zeros(batch_size, dtype=np.float32)
+        self._batch_tensors = tuple(torch.from_numpy(a) for a in (
+            self._b_states, self._b_actions, self._b_rewards, self._b_next_states, self._b_dones,
+            self._b_discounts))
+
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        """Rastgele (iadeli) indeksler seçer"""
+        return self.rng.integers(0, self.size, batch_size)
+
+    def gather(self, indices: np.ndarray) -> Tuple[torch.Tensor, ...]:
+        """Verilen indekslerdeki deneyimleri batch tensörleri olarak döndürür"""
+        self._ensure_batch(len(indices))
+        np.take(self.states, indices, axis=0, out=self._b_states)
+        np.take(self.actions, indices, out=self._b_actions)
+        np.take(self.rewards, indices, out=self._b_rewards)
+        np.take(self.next_states, indices, axis=0, out=self._b_next_states)
+        np.take(self.dones, indices, out=self._b_dones)
+        np.take(self.discounts, indices, out=self._b_discounts)
+        return self._batch_tensors
+
+    def sample(self, batch_size: int) -> Tuple[torch.Tensor, ...]:
+        """(states, actions, rewards, next_states, dones, discounts) tensörlerini döndürür"""
+        return self.gather(self.sample_indices(batch_size))
+
+class SumTree:
+    """Öncelikli örnekleme için dizi tabanlı toplam ağacı.
+
+    Yapraklar `tree[leaf_offset:]` içindedir; her iç düğüm iki çocuğunun
+    toplamını tutar. Güncelleme ve arama batch halinde, seviye seviye
+    vektörel olarak O(log n) sürede yapılır.
+    """
+
+    def __init__(self, capacity: int):
+        self.leaf_offset = 1
+        while self.leaf_offset < capacity:
+            self.leaf_offset *= 2
+        self.depth = self.leaf_offset.bit_length() - 1
+        self.tree = np.zeros(2 * self.leaf_offset, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        return float(self.tree[1])
+
+    def get(self, indices: np.ndarray) -> np.ndarray:
+        """Yaprak değerlerini döndürür"""
+        return self.tree[indices + self.leaf_offset]
+
+    def update(self, indices: np.ndarray, values: np.ndarray) -> None:
+        """Yaprakları günceller ve toplamları köke kadar yeniden hesaplar"""
+        nodes = np.asarray(indices, dtype=np.int64) + self.leaf_offset
+        self.tree[nodes] = values
+        # Ebeveynler çocuklarından yeniden toplanır (fark eklenmez), böylece
+        # aynı indeks birden fazla gelse de sonuç doğru kalır
+        for _ in range(self.depth):
+            nodes //= 2
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """Kümülatif toplamı `values` olan yaprakların indekslerini döndürür"""
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = values > left_sum
+            values -= np.where(go_right, left_sum, 0.0)
+            nodes = left + go_right
+        return nodes - self.leaf_offset
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """TD hatasıyla orantılı örnekleyen deneyim hafızası (Schaul ve ark., 2016).
+
+    `sample` normal batch tensörlerine ek olarak önem örneklemesi
+    ağırlıklarını ve örneklenen indeksleri döndürür; indeksler
+    `update_priorities` ile yeni TD hatalarıyla birlikte geri verilir.
+    """
+
+    def __init__(self, capacity: int, state_size: StateSize, alpha: float = 0.6,
+                 beta: float = 0.4, beta_increment: float = 1e-5,
+                 epsilon: float = 1e-3, seed: Optional[int] = None,
+                 state_dtype=np.float32):
+        super().__init__(capacity, state_size, seed, state_dtype)
+        self.alpha = alpha
+        self.beta = beta
+        self.beta_increment = beta_increment
+        self.epsilon = epsilon
+        self.max_priority = 1.0
+        self.tree = SumTree(capacity)
+        self._weights = np.zeros(0, dtype=np.float32)
+
+    def add(self, state: np.ndarray, action: int, reward: float,
+            next_state: np.ndarray, done: bool, discount: float) -> None:
+        """Yeni deneyimi en yüksek öncelikle ekler"""
+        index = self.position
+        super().add(state, action, reward, next_state, done, discount)
+        self.tree.update(np.array([index]), np.array([self.max_priority ** self.alpha]))
+
+    def add_batch(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                  next_states: np.ndarray, dones: np.ndarray,
+                  discounts: Union[float, np.ndarray]) -> np.ndarray:
+        """Yeni deneyimleri en yüksek öncelikle ekler"""
+        indices = super().add_batch(states, actions, rewards, next_states, dones, discounts)
+        self.tree.update(indices, np.full(len(indices), self.max_priority ** self.alpha))
+        return indices
+
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        """Öncelik toplamını eşit dilimlere bölüp her dilimden bir indeks seçer"""
+        segment = self.tree.total / batch_size
+        values = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        indices = self.tree.find(values)
+        # Kayan nokta hatası boş bir yaprağa düşürürse doldurulmuş alana çek
+        return np.minimum(indices, self.size - 1)
+
+    def sample(self, batch_size: int) -> Tuple[torch.Tensor, ...]:
+        """(states, actions, rewards, next_states, dones, discounts, weights, indices) döndürür"""
+        indices = self.sample_indices(batch_size)
+        batch = self.gather(indices)
+
+        if len(self._weights) != batch_size:
+            self._weights = np.zeros(batch_size, dtype=np.float32)
+            self._weights_tensor = torch.from_numpy(self._weights)
+
+        # Önem örneklemesi ağırlıkları: (N * P(i))^-beta, en büyüğe göre normalize
+        probs = self.tree.get(indices) / self.tree.total
+        weights = (self.size * probs) ** -self.beta
+        self._weights[:] = weights / weights.max()
+        self.beta = min(1.0, self.beta + self.beta_increment)
+        return batch + (self._weights_tensor, indices)
+
+    def update_priorities(self, indices: np.ndarray, td_errors: np.ndarray) -> None:
+        """Örneklenen deneyimlerin önceliklerini yeni TD hatalarıyla günceller"""
+        priorities = np.abs(td_errors) + self.epsilon
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self.tree.update(indices, priorities ** self.alpha)
+
+class NStepAccumulator:
+    """Paralel tahtaların adımlarını n adımlık geçişlere dönüştürür.
+
+    Her tahtanın son `n` adımı (durum, aksiyon, birikmiş getiri) bir halka
+    dizide tutulur; her yeni ödül açık getirilere yaşlarına göre gamma^yaş
+    ağırlığıyla eklenir. Penceresi dolan başlangıçlar
+    (s_t, a_t, R_n, s_{t+n}, done, gamma^n) olarak, bölüm biten tahtaların
+    tüm açık başlangıçları ise kısaltılmış getiriyle ve done=1 olarak
+    tek seferde döndürülür. n=1 olağan tek adımlık geçişleri verir.
+    """
+
+    def __init__(self, num_envs: int, n: int, gamma: float, state_size: StateSize,
+                 state_dtype=np.float32):
+        self.num_envs = num_envs
+        self.n = n
+        self.gamma = gamma
+        state_shape = tuple(np.atleast_1d(state_size))
+        self.states = np.zeros((n, num_envs) + state_shape, dtype=state_dtype)
+        self.actions = np.zeros((n, num_envs), dtype=np.int64)
+        self.returns = np.zeros((n, num_envs), dtype=np.float32)
+        self.pending = np.zeros(num_envs, dtype=np.int64)  # Tahta başına açık başlangıç
+        self.t = 0  # Halka dizideki adım sayacı
+        self.powers = gamma ** np.arange(n + 1, dtype=np.float32)  # gamma^0..gamma^n
+        self.ages = np.arange(n)[:, None]
+
+    def add(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+            next_states: np.ndarray, dones: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Bir vektör adımını ekler ve tamamlanan geçişleri döndürür.
+
+        Dönen değer (states, actions, returns, next_states, dones, discounts)
+        dizileridir; adım başına ortalama bir geçiş çıkar.
+        """
+        n = self.n
+        slot = self.t % n
+        self.states[slot] = states
+        self.actions[slot] = actions
+        self.returns[slot] = 0.0
+        self.pending = np.minimum(self.pending + 1, n)
+
+        # Yuvaların yaşı: şimdiki adım 0, en eski n-1
+        slot_ages = (self.t - np.arange(n)) % n
+        self.returns += self.powers[slot_ages][:, None] * rewards
+        self.t += 1
+
+        # Yaş x tahta: bölüm bittiyse tüm açık yaşlar, yoksa yalnızca pencere dolduysa en eski
+        dones = np.asarray(dones, dtype=np.bool_)
+        emit = np.where(dones, self.ages < self.pending,
+                        (self.ages == n - 1) & (self.pending == n))
+        ages, envs = np.nonzero(emit)
+        slots = (slot - ages) % n
+        self.pending[dones] = 0
+        self.pending[~dones & (self.pending == n)] = n - 1
+        return (self.states[slots, envs], self.actions[slots, envs], self.returns[slots, envs],
+                next_states[envs], dones[envs].astype(np.float32), self.powers[ages + 1])
+
+    def reset(self) -> None:
+        """Açık başlangıçları atar (ör. tahtalar dışarıdan sıfırlandığında)"""
+        self.pending[:] = 0
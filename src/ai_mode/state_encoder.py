@@ -0,0 +1,99 @@
+import numpy as np
+from typing import Optional, Tuple
+
+class StateEncoder:
+    """Oyun durumunu AI'nin 12 özellikli gözlem vektörüne dönüştürür.
+
+    Özellikler: 4 yön (sağ, sol, yukarı, aşağı), yemeğin başa göre konumu
+    (solda, sağda, yukarıda, aşağıda) ve 4 yönde tehlike (duvar veya kuyruk
+    hariç gövde). `encode` tek bir oyunu piksel koordinatlarıyla,
+    `encode_batch` ise birçok tahtayı hücre koordinatları ve doluluk
+    ızgarası üzerinden NumPy işlemleriyle kodlar.
+    """
+
+    state_size = 12
+
+    # Tehlike kontrolü yönleri hücre cinsinden (Sağ, Sol, Yukarı, Aşağı)
+    DANGER_DIRS = ((1, 0), (-1, 0), (0, -1), (0, 1))
+
+    def __init__(self, width: int, height: int, block_size: int = 20):
+        self.width = width
+        self.height = height
+        self.block_size = block_size
+        self.cols = len(range(0, width, block_size))
+        self.rows = len(range(0, height, block_size))
+
+    def encode(self, snake_body, food_pos: Tuple[int, int]) -> np.ndarray:
+        """Tek bir oyunun durumunu piksel koordinatlarından kodlar"""
+        b = self.block_size
+        head_x, head_y = snake_body[0]
+
+        # Yılanın yönü: body[0] - body[1], tek parçaysa varsayılan sağ
+        if len(snake_body) >= 2:
+            dx = head_x - snake_body[1][0]
+            dy = head_y - snake_body[1][1]
+            direction = (dx == b and dy == 0, dx == -b and dy == 0,
+                         dx == 0 and dy == -b, dx == 0 and dy == b)
+        else:
+            direction = (True, False, False, False)
+
+        # Yemeğin yılan başına göre konumu
+        food_x, food_y = food_pos
+        food = (food_x < head_x, food_x > head_x, food_y < head_y, food_y > head_y)
+
+        # Tehlike: duvar veya kuyruk hariç vücut (gövde O(1) üyelik destekler)
+        tail = snake_body[-1]
+        danger = []
+        for dx, dy in self.DANGER_DIRS:
+            cell = (head_x + dx * b, head_y + dy * b)
+            danger.append(
+                cell[0] < 0 or cell[0] >= self.width or
+                cell[1] < 0 or cell[1] >= self.height or
+                (cell in snake_body and cell != tail)
+            )
+
+        return np.array(direction + food + tuple(danger), dtype=np.float32)
+
+    def encode_batch(self, heads: np.ndarray, necks: np.ndarray, lengths: np.ndarray,
+                     tails: np.ndarray, foods: np.ndarray, occupancy: np.ndarray,
+                     boards: Optional[np.ndarray] = None,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Birçok tahtayı hücre koordinatlarından kodlar.
+
+        `heads`, `necks`, `tails`, `foods` (n, 2) hücre konumları, `occupancy`
+        ise (N, rows, cols) doluluk ızgarasıdır; `boards` verilirse her satırın
+        ızgaradaki tahta indeksidir (kopyalamamak için).
+        """
+        n = len(heads)
+        if out is None:
+            out = np.empty((n, self.state_size), dtype=np.float32)
+        hx, hy = heads[:, 0], heads[:, 1]
+
+        # Yön
+        has_neck = lengths >= 2
+        dx = hx - necks[:, 0]
+        dy = hy - necks[:, 1]
+        out[:, 0] = ~has_neck | ((dx == 1) & (dy == 0))
+        out[:, 1] = has_neck & (dx == -1) & (dy == 0)
+        out[:, 2] = has_neck & (dx == 0) & (dy == -1)
+        out[:, 3] = has_neck & (dx == 0) & (dy == 1)
+
+        # Yemeğin başa göre konumu
+        out[:, 4] = foods[:, 0] < hx
+        out[:, 5] = foods[:, 0] > hx
+        out[:, 6] = foods[:, 1] < hy
+        out[:, 7] = foods[:, 1] > hy
+
+        # Tehlike: duvar veya kuyruk hariç gövde
+        if boards is None:
+            boards = np.arange(n)
+        for k, (ddx, ddy) in enumerate(self.DANGER_DIRS):
+            nx = hx + ddx
+            ny = hy + ddy
+            wall = (nx < 0) | (nx >= self.cols) | (ny < 0) | (ny >= self.rows)
+            cx = np.clip(nx, 0, self.cols - 1)
+            cy = np.clip(ny, 0, self.rows - 1)
+            body = occupancy[boards, cy, cx] & ~((cx == tails[:, 0]) & (cy == tails[:, 1]))
+            out[:, 8 + k] = wall | body
+
+        return out
@@ -0,0 +1,256 @@
+"""Ekransız ve sessiz eğitim giriş noktası.
+
+Kullanım (proje kök dizininden):
+    python -m src.ai_mode.train --episodes 5000 --checkpoint models/snake_ai_model.pth
+    python -m src.ai_mode.train --steps 10000000 --actors 30 --num-envs 64
+"""
+import argparse
+import json
+import os
+import time
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+
+from .dqn_agent import DQNAgent
+from .vec_env import VecSnakeEnv
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Komut satırı argümanlarını çözümler"""
+    parser = argparse.ArgumentParser(description="Yılan AI'sini ekran ve ses olmadan eğitir")
+    parser.add_argument('--episodes', type=int, default=None,
+                        help="Eğitilecek toplam bölüm sayısı")
+    parser.add_argument('--steps', type=int, default=None,
+                        help="Toplam ortam adımı bütçesi")
+    parser.add_argument('--num-envs', type=int, default=1,
+                        help="Aynı anda yürütülecek tahta sayısı (aktör başına)")
+    parser.add_argument('--actors', type=int, default=0,
+                        help="Aktör süreç sayısı (0: tek süreçte eğit)")
+    parser.add_argument('--sync-every', type=int, default=100,
+                        help="Aktörlerin kaç adımda bir ağırlıkları çektiği")
+    parser.add_argument('--broadcast-every', type=int, default=50,
+                        help="Öğrenenin kaç güncellemede bir ağırlık yayınladığı")
+    parser.add_argument('--width', type=int, default=800)
+    parser.add_argument('--height', type=int, default=600)
+    parser.add_argument('--block-size', type=int, default=20)
+    parser.add_argument('--observation', choices=['vector', 'grid'], default='vector',
+                        help="Gözlem türü: 12 özellik veya tüm tahta (evrişimli ağ ile)")
+    parser.add_argument('--body-age', action='store_true',
+                        help="Izgara gözlemine gövde yaşı kanalı ekle")
+    parser.add_argument('--memory-size', type=int, default=10000,
+                        help="Deneyim hafızası kapasitesi")
+    parser.add_argument('--checkpoint', default=None,
+                        help="Model kayıt dosyası (varsa buradan devam edilir; varsayılan "
+                             "vektör gözleminde AI modunun yüklediği models/snake_ai_model.pth, "
+                             "ızgara gözleminde ayrı bir dosya)")
+    parser.add_argument('--no-resume', action='store_true',
+                        help="Mevcut kayıt dosyasını yüklemeden sıfırdan başla")
+    parser.add_argument('--save-every', type=int, default=100,
+                        help="Kaç bölümde bir model kaydedileceği")
+    parser.add_argument('--prioritized', action='store_true',
+                        help="Öncelikli deneyim tekrarı (sum-tree) kullan")
+    parser.add_argument('--batch-size', type=int, default=64,
+                        help="Mini-batch boyutu")
+    parser.add_argument('--train-every', type=int, default=None,
+                        help="Kaç ortam adımında bir güncelleme yapılacağı "
+                             "(varsayılan: her vektör adımında bir, yani --num-envs; "
+                             "aktör modunda öğrenenin aldığı geçiş sayısına göre)")
+    parser.add_argument('--n-step', type=int, default=1,
+                        help="n adımlık getiri: ödüller n adım toplanıp gamma^n ile önyüklenir")
+    parser.add_argument('--gradient-steps', type=int, default=1,
+                        help="Güncelleme başına gradyan adımı")
+    parser.add_argument('--target-update', type=int, default=1000,
+                        help="Hedef ağın kaç gradyan adımında bir kopyalanacağı")
+    parser.add_argument('--tau', type=float, default=0.0,
+                        help="Polyak hedef güncelleme katsayısı (> 0 ise --target-update yerine)")
+    parser.add_argument('--compile', action='store_true',
+                        help="Ağları torch.compile ile derle")
+    parser.add_argument('--eval-episodes', type=int, default=0,
+                        help="Her kayıttan sonra arka planda açgözlü değerlendirilecek bölüm sayısı")
+    parser.add_argument('--eval-workers', type=int, default=1,
+                        help="Değerlendirme süreç sayısı")
+    parser.add_argument('--eval-max-steps', type=int, default=5000,
+                        help="Değerlendirmede bölüm başına adım sınırı")
+    parser.add_argument('--metrics', default=None,
+                        help="Bölüm metriklerinin yazılacağı JSON Lines dosyası")
+    parser.add_argument('--log-every', type=int, default=10,
+                        help="Kaç bölümde bir ilerleme yazdırılacağı")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+    if args.episodes is None and args.steps is None:
+        parser.error("--episodes veya --steps belirtilmelidir")
+    if args.n_step < 1:
+        parser.error("--n-step en az 1 olmalıdır")
+    if args.observation == 'grid' and args.actors > 0:
+        parser.error("Izgara gözlemi şimdilik yalnızca tek süreçli eğitimde destekleniyor")
+    if args.checkpoint is None:
+        args.checkpoint = default_checkpoint(args.observation, args.body_age)
+    return args
+
+def default_checkpoint(observation: str, body_age: bool) -> str:
+    """Gözlem türüne göre varsayılan kayıt dosyası; ızgara modelleri AI modunun
+    yüklediği vektör modelinin üzerine yazılmasın diye ayrı dosyalara gider"""
+    if observation == 'grid':
+        name = "snake_ai_grid_age_model.pth" if body_age else "snake_ai_grid_model.pth"
+    else:
+        name = "snake_ai_model.pth"
+    return os.path.join("models", name)
+
+def create_agent(args: argparse.Namespace, state_size, action_size: int,
+                 state_dtype=np.float32) -> DQNAgent:
+    """Ajanı oluşturur ve varsa kayıtlı modeli yükler"""
+    agent = DQNAgent(state_size, action_size, memory_size=args.memory_size, state_dtype=state_dtype,
+                     prioritized=args.prioritized, batch_size=args.batch_size,
+                     train_every=args.train_every or args.num_envs,
+                     gradient_steps=args.gradient_steps, target_update_every=args.target_update,
+                     tau=args.tau, compile_model=args.compile, n_step=args.n_step)
+    checkpoint_dir = os.path.dirname(args.checkpoint)
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    if not args.no_resume and os.path.exists(args.checkpoint):
+        try:
+            agent.load(args.checkpoint)
+        except ValueError as e:
+            raise SystemExit(f"{e}\n--no-resume veya başka bir --checkpoint kullanın")
+        print(f"Model yüklendi: {args.checkpoint}")
+    return agent
+
+class TrainingProgress:
+    """Bölüm sayaçlarını, metrik dosyasını, periyodik kaydı ve ilerleme çıktısını yönetir"""
+
+    def __init__(self, args: argparse.Namespace, agent: DQNAgent,
+                 actor_epsilons: Optional[List[float]] = None):
+        self.args = args
+        self.agent = agent
+        # Aktör modunda keşif aktörlerin sabit epsilonlarıyla yapılır; öğrenenin
+        # azalan epsilonu kullanılmadığı için yerine bu aralık raporlanır
+        self.actor_epsilons = actor_epsilons
+        self.episodes = 0
+        self.total_steps = 0
+        self.best_score = 0
+        self.recent_scores = deque(maxlen=100)
+        self.start_time = time.time()
+
+        self.metrics_file = None
+        if args.metrics:
+            metrics_dir = os.path.dirname(args.metrics)
+            if metrics_dir:
+                os.makedirs(metrics_dir, exist_ok=True)
+            self.metrics_file = open(args.metrics, 'a')
+
+        # Kayıtların arka plan değerlendirmesi (eğitimi bekletmez)
+        self.evaluator = None
+        if args.eval_episodes > 0:
+            from .evaluate import BackgroundEvaluator
+            self.evaluator = BackgroundEvaluator(
+                args.eval_episodes, args.eval_workers, seed=args.seed or 0,
+                max_steps=args.eval_max_steps, width=args.width, height=args.height,
+                block_size=args.block_size, observation=args.observation, body_age=args.body_age)
+
+    def running(self) -> bool:
+        """Bölüm ve adım bütçeleri dolmadıysa True döndürür"""
+        return ((self.args.episodes is None or self.episodes < self.args.episodes) and
+                (self.args.steps is None or self.total_steps < self.args.steps))
+
+    def steps_per_second(self) -> float:
+        return self.total_steps / max(time.time() - self.start_time, 1e-9)
+
+    def episode_finished(self, score: int, steps: int) -> None:
+        """Biten bir bölümü kaydeder"""
+        self.episodes += 1
+        self.best_score = max(self.best_score, score)
+        self.recent_scores.append(score)
+
+        if self.metrics_file:
+            record = {
+                'episode': self.episodes,
+                'score': score,
+                'steps': steps,
+                'total_steps': self.total_steps,
+                'time': round(time.time() - self.start_time, 3)
+            }
+            if self.actor_epsilons is None:
+                record['epsilon'] = self.agent.epsilon
+            self.metrics_file.write(json.dumps(record) + "\n")
+
+        if self.args.save_every and self.episodes % self.args.save_every == 0:
+            self.agent.save(self.args.checkpoint)
+            if self.evaluator:
+                self.evaluator.submit(self.agent.model, self.episodes)
+
+        if self.evaluator:
+            self.report_evaluation(self.evaluator.poll())
+
+        if self.args.log_every and self.episodes % self.args.log_every == 0:
+            print(f"Bölüm {self.episodes} | Skor {score} | En iyi {self.best_score} | "
+                  f"Ort(100) {np.mean(self.recent_scores):.2f} | {self.epsilon_label()} | "
+                  f"{self.steps_per_second():.0f} adım/sn")
+
+    def epsilon_label(self) -> str:
+        """İlerleme satırındaki keşif oranı: öğrenenin epsilonu veya aktörlerin aralığı"""
+        if self.actor_epsilons is None:
+            return f"Epsilon {self.agent.epsilon:.3f}"
+        return f"Aktör epsilon {min(self.actor_epsilons):.4f}-{max(self.actor_epsilons):.3f}"
+
+    def report_evaluation(self, summary: Optional[dict]) -> None:
+        """Biten arka plan değerlendirmesini yazdırır"""
+        if summary:
+            from .evaluate import format_summary
+            print(f"Değerlendirme (bölüm {summary['label']}): {format_summary(summary)}")
+
+    def close(self) -> None:
+        """Modeli kaydeder ve özet yazdırır"""
+        self.agent.save(self.args.checkpoint)
+        if self.evaluator:
+            self.report_evaluation(self.evaluator.close())
+        if self.metrics_file:
+            self.metrics_file.close()
+        elapsed = time.time() - self.start_time
+        print(f"Toplam {self.episodes} bölüm, {self.total_steps} adım, {elapsed:.1f} sn "
+              f"({self.steps_per_second():.0f} adım/sn), en iyi skor {self.best_score}")
+
+def train(args: argparse.Namespace) -> None:
+    """Eğitim döngüsünü tek süreçte çalıştırır"""
+    if args.seed is not None:
+        import random
+        import torch
+        random.seed(args.seed)
+        torch.manual_seed(args.seed)
+
+    env = VecSnakeEnv(args.num_envs, args.width, args.height, args.block_size, seed=args.seed,
+                      observation=args.observation, body_age=args.body_age)
+    agent = create_agent(args, env.state_size, env.action_size, env.state_dtype)
+    progress = TrainingProgress(args, agent)
+    # Hafızaya yazılacak önceki gözlem, hafızanın veri tipinde tek bir tamponda tutulur;
+    # aksiyonlar ortamın kopyasız float32 görünümünden seçilir
+    states = env.reset().astype(env.state_dtype)
+
+    try:
+        while progress.running():
+            actions = agent.act_batch(env.observe(), True)
+            next_states, rewards, dones = env.step(actions, copy=False)
+
+            agent.remember_batch(states, actions, rewards, next_states, dones)
+            agent.learn(env.num_envs)
+
+            progress.total_steps += env.num_envs
+            np.copyto(states, next_states, casting='unsafe')
+
+            for i in np.flatnonzero(dones):
+                progress.episode_finished(int(env.episode_scores[i]), int(env.episode_steps[i]))
+    except KeyboardInterrupt:
+        print("Eğitim durduruldu")
+    finally:
+        progress.close()
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.actors > 0:
+        from .distributed import train_distributed
+        train_distributed(args)
+    else:
+        train(args)
+
+if __name__ == '__main__':
+    main()
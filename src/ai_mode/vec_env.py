@@ -0,0 +1,233 @@
+import numpy as np
+from typing import Optional, Tuple
+from .state_encoder import StateEncoder
+
+class VecSnakeEnv:
+    """N bağımsız yılan tahtasını NumPy dizileriyle aynı anda yürüten ortam.
+
+    Kurallar ve ödüller `AIGame.update` ile birebir aynıdır; koordinatlar
+    piksel yerine hücre cinsinden tutulur. Biten tahtalar otomatik olarak
+    sıfırlanır ve döndürülen durum yeni oyunun ilk durumudur. `reset` ve
+    `step` gözlemlerin kopyasını döndürür; kopyasız erişim `observe` ve
+    `step(copy=False)` iledir.
+
+    `observation='grid'` ile gözlem, 12 özellik yerine tüm tahtayı gösteren
+    (N, C, rows, cols) float32 bir tensördür: gövde, baş, yem ve istenirse
+    gövde yaşı kanalları. Izgara önceden ayrılır ve her adımda yalnızca
+    değişen hücreler (yeni baş, eski baş, kuyruk, yem) yazılır; tam yeniden
+    kurulum yalnızca biten tahtalar sıfırlanırken yapılır. Yaş kanalı
+    hücreye girilen adımı (65536 modunda) tutar, göreli yaşı ağ hesaplar.
+    """
+
+    # Izgara gözlem kanalları
+    BODY, HEAD, FOOD, AGE = range(4)
+    AGE_PERIOD = 1 << 16
+
+    # Aksiyon -> (dx, dy) hücre cinsinden (AIGame.action_map ile aynı sıra)
+    ACTIONS = np.array([
+        [0, -1],  # Yukarı
+        [0, 1],   # Aşağı
+        [-1, 0],  # Sol
+        [1, 0]    # Sağ
+    ], dtype=np.int64)
+
+    def __init__(self, num_envs: int, width: int = 800, height: int = 600,
+                 block_size: int = 20, seed: Optional[int] = None,
+                 observation: str = 'vector', body_age: bool = False):
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.block_size = block_size
+        # Food.generate_position ile aynı ızgara: range(0, width, block_size)
+        self.cols = len(range(0, width, block_size))
+        self.rows = len(range(0, height, block_size))
+        self.num_cells = self.cols * self.rows
+        self.start_cell = (width // 2 // block_size, height // 2 // block_size)
+        self.encoder = StateEncoder(width, height, block_size)
+        self.observation = observation
+        self.body_age = body_age
+        if observation == 'grid':
+            channels = 4 if body_age else 3
+            self.state_size = (channels, self.rows, self.cols)
+            # Replay hafızasında saklama tipi (ikili kanallar bayta, yaş 16 bite sığar)
+            self.state_dtype = np.uint16 if body_age else np.uint8
+        elif observation == 'vector':
+            self.state_size = self.encoder.state_size
+            self.state_dtype = np.float32
+        else:
+            raise ValueError(f"Bilinmeyen gözlem türü: {observation}")
+        self.action_size = 4
+        self.rng = np.random.default_rng(seed)
+
+        n = num_envs
+        # Doluluk ızgarası ve halka tampon şeklinde yılan gövdesi
+        self.occupancy = np.zeros((n, self.rows, self.cols), dtype=np.bool_)
+        self.body = np.zeros((n, self.num_cells, 2), dtype=np.int64)
+        self.head_idx = np.zeros(n, dtype=np.int64)
+        self.length = np.ones(n, dtype=np.int64)
+        self.grow = np.zeros(n, dtype=np.bool_)
+        self.food = np.zeros((n, 2), dtype=np.int64)
+        self.scores = np.zeros(n, dtype=np.int64)
+        self.steps = np.zeros(n, dtype=np.int64)
+
+        # Biten tahtaların son skorları ve adım sayıları (done olan indekslerde geçerli)
+        self.episode_scores = np.zeros(n, dtype=np.int64)
+        self.episode_steps = np.zeros(n, dtype=np.int64)
+
+        self._arange = np.arange(n)
+        self._states = np.zeros((n, self.encoder.state_size), dtype=np.float32)
+        self.grid = None
+        if observation == 'grid':
+            self.grid = np.zeros((n,) + self.state_size, dtype=np.float32)
+        self._reset(self._arange)
+
+    def reset(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Verilen (veya tüm) tahtaları sıfırlar; tüm gözlemlerin kopyasını döndürür"""
+        if indices is None:
+            indices = self._arange
+        self._reset(np.asarray(indices, dtype=np.int64))
+        return self.observe().copy()
+
+    def _reset(self, indices: np.ndarray) -> None:
+        """Tahtaları sıfırlar ve gözlemlerini yerinde günceller"""
+        if len(indices) == 0:
+            return
+
+        self.occupancy[indices] = False
+        self.head_idx[indices] = 0
+        self.length[indices] = 1
+        self.grow[indices] = False
+        self.scores[indices] = 0
+        self.steps[indices] = 0
+        self.body[indices, 0] = self.start_cell
+        self.occupancy[indices, self.start_cell[1], self.start_cell[0]] = True
+
+        # Food() gibi: ilk yem yılanın olmadığı rastgele bir hücreye konur
+        start = self.start_cell[1] * self.cols + self.start_cell[0]
+        cells = self.rng.integers(0, self.num_cells - 1, len(indices))
+        cells += cells >= start
+        self.food[indices, 0] = cells % self.cols
+        self.food[indices, 1] = cells // self.cols
+
+        if self.grid is not None:
+            # Biten tahtaların ızgarası baştan kurulur (yaş kanalında başlangıç hücresi 0)
+            grid = self.grid
+            grid[indices] = 0
+            x, y = self.start_cell
+            grid[indices, self.BODY, y, x] = 1
+            grid[indices, self.HEAD, y, x] = 1
+            grid[indices, self.FOOD, self.food[indices, 1], self.food[indices, 0]] = 1
+        else:
+            self._compute_states(indices)
+
+    def step(self, actions: np.ndarray,
+             copy: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Tüm tahtaları bir adım ilerletir ve (durum, ödül, bitti) döndürür.
+
+        `copy=False` ise durum `observe()` görünümüdür; büyük ızgara gözleminde
+        her adımdaki tam kopyayı önler, sonraki adımda üzerine yazılır.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        idx = self._arange
+        cap = self.num_cells
+
+        heads = self.body[idx, self.head_idx]
+        new_heads = heads + self.ACTIONS[actions]
+        food = self.food
+
+        old_dist = np.hypot(*(heads - food).T)
+        new_dist = np.hypot(*(new_heads - food).T)
+
+        # Snake.update: büyümüyorsa kuyruk çarpışma kontrolünden önce çıkarılır
+        shrink = ~self.grow
+        tail_idx = (self.head_idx - self.length + 1) % cap
+        tails = self.body[idx, tail_idx]
+        s = idx[shrink]
+        self.occupancy[s, tails[shrink, 1], tails[shrink, 0]] = False
+        if self.grid is not None:
+            self.grid[s, self.BODY, tails[shrink, 1], tails[shrink, 0]] = 0
+            if self.body_age:
+                self.grid[s, self.AGE, tails[shrink, 1], tails[shrink, 0]] = 0
+        self.length += self.grow
+        self.grow[:] = False
+
+        # Snake.check_collision: duvar veya gövde
+        x, y = new_heads[:, 0], new_heads[:, 1]
+        out = (x < 0) | (x >= self.cols) | (y < 0) | (y >= self.rows)
+        inside = ~out
+        hit_body = np.zeros(self.num_envs, dtype=np.bool_)
+        hit_body[inside] = self.occupancy[idx[inside], y[inside], x[inside]]
+        dones = out | hit_body
+
+        # Yaşayan tahtalarda yeni başı yaz
+        alive = ~dones
+        a = idx[alive]
+        self.head_idx[a] = (self.head_idx[a] + 1) % cap
+        self.body[a, self.head_idx[a]] = new_heads[alive]
+        self.occupancy[a, y[alive], x[alive]] = True
+        self.steps += 1
+        if self.grid is not None:
+            # Artımlı ızgara: eski başı sil, yeni başı yaz (kuyruk yukarıda silindi)
+            grid = self.grid
+            ya, xa = y[alive], x[alive]
+            grid[a, self.HEAD, heads[alive, 1], heads[alive, 0]] = 0
+            grid[a, self.HEAD, ya, xa] = 1
+            grid[a, self.BODY, ya, xa] = 1
+            if self.body_age:
+                grid[a, self.AGE, ya, xa] = self.steps[a] % self.AGE_PERIOD
+
+        # Ödüller: çarpışma -10, yem +10, aksi halde yaklaşma +0.1 / uzaklaşma -0.1
+        ate = alive & (x == food[:, 0]) & (y == food[:, 1])
+        rewards = np.where(new_dist < old_dist, 0.1, -0.1).astype(np.float32)
+        rewards[ate] = 10.0
+        rewards[dones] = -10.0
+
+        for i in np.flatnonzero(ate):
+            self.scores[i] += 1
+            self.grow[i] = True
+            if not self._respawn_food(i):
+                # Tahta doldu: oyun kazanıldı, yeniden başlat
+                dones[i] = True
+
+        done_idx = np.flatnonzero(dones)
+        self.episode_scores[done_idx] = self.scores[done_idx]
+        self.episode_steps[done_idx] = self.steps[done_idx]
+        self._reset(done_idx)
+
+        if self.grid is None:
+            self._compute_states(np.flatnonzero(~dones))
+        states = self.observe()
+        return (states.copy() if copy else states), rewards, dones
+
+    def observe(self) -> np.ndarray:
+        """Güncel gözlemlerin kopyasız görünümü (bir sonraki adımda üzerine yazılır)"""
+        return self.grid if self.grid is not None else self._states
+
+    def _respawn_food(self, i: int) -> bool:
+        """Food.respawn gibi yemi yılanın olmadığı rastgele bir hücreye taşır"""
+        free = np.flatnonzero(~self.occupancy[i].ravel())
+        if len(free) == 0:
+            return False
+        cell = free[self.rng.integers(len(free))]
+        if self.grid is not None:
+            self.grid[i, self.FOOD, self.food[i, 1], self.food[i, 0]] = 0
+            self.grid[i, self.FOOD, cell // self.cols, cell % self.cols] = 1
+        self.food[i] = (cell % self.cols, cell // self.cols)
+        return True
+
+    def _compute_states(self, indices: np.ndarray) -> None:
+        """Verilen tahtaların gözlem vektörlerini StateEncoder ile hesaplar"""
+        if len(indices) == 0:
+            return
+        cap = self.num_cells
+        head_idx = self.head_idx[indices]
+        lengths = self.length[indices]
+        self._states[indices] = self.encoder.encode_batch(
+            self.body[indices, head_idx],
+            self.body[indices, (head_idx - 1) % cap],
+            lengths,
+            self.body[indices, (head_idx - lengths + 1) % cap],
+            self.food[indices],
+            self.occupancy,
+            boards=indices
+        )
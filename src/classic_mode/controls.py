@@ -1,4 +1,5 @@
 import pygame
+from typing import Tuple
 
 class Controls:
     def __init__(self, width: int = 800, height: int = 600):
@@ -66,6 +67,8 @@ class Controls:
                 'SPACE': 'Oyunu başlat/durdur',
                 'Yukarı Ok': 'Hızı artır',
                 'Aşağı Ok': 'Hızı azalt',
+                'T': 'Turbo modu aç/kapat',
+                'P': 'Performans panelini aç/kapat',
                 'M': 'Sesi aç/kapat',
                 'ESC': 'Ana menüye dön',
                 'Q': 'Oyundan çık'
@@ -86,6 +89,10 @@ class Controls:
             button_width,
             button_height
         )
+        
+        # Önceden çizilmiş katmanlar; yalnızca hover/scroll değişince yeniden birleştirilir
+        self.build_layers()
+        self.last_frame = None
 
     def update_scroll_bar(self):
         """Scroll bar pozisyonunu güncelle"""
@@ -105,6 +112,9 @@ class Controls:
             if event.type == pygame.QUIT:
                 return 'QUIT'
             
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                self.last_frame = None  # Pencere yeniden çizilmeli
+            
             # Mouse wheel olaylarını yakala
             if event.type == pygame.MOUSEWHEEL:
                 if self.viewport.collidepoint(pygame.mouse.get_pos()):
@@ -122,9 +132,11 @@ class Controls:
         
         return None
 
-    def draw(self) -> None:
-        """Kontroller menüsünü çizer"""
-        self.screen.fill(self.BACKGROUND_COLOR)
+    def build_layers(self) -> None:
+        """Sabit arka planı, kaydırılabilir kontrol listesini ve buton varyantlarını çizer"""
+        # Sabit arka plan: başlık, viewport çerçevesi ve scroll bar zemini
+        self.background = pygame.Surface((self.width, self.height))
+        self.background.fill(self.BACKGROUND_COLOR)
         
         # Başlık (scroll etkilemez)
         title = self.title_font.render('KONTROLLER', True, self.TITLE_COLOR)
@@ -132,104 +144,124 @@ class Controls:
         
         # Başlık arka planı
         padding = 40
-        title_bg = pygame.Surface((title.get_width() + padding * 2, title.get_height() + padding))
-        title_bg.fill(self.TITLE_BG_COLOR)
-        title_bg_rect = title_bg.get_rect(center=(self.width//2, 60))
+        title_bg_rect = pygame.Rect(0, 0, title.get_width() + padding * 2, title.get_height() + padding)
+        title_bg_rect.center = (self.width//2, 60)
         
         # Başlık arka planını çiz
-        pygame.draw.rect(self.screen, self.TITLE_BG_COLOR, title_bg_rect, border_radius=15)
-        pygame.draw.rect(self.screen, self.BORDER_COLOR, title_bg_rect, 3, border_radius=15)
+        pygame.draw.rect(self.background, self.TITLE_BG_COLOR, title_bg_rect, border_radius=15)
+        pygame.draw.rect(self.background, self.BORDER_COLOR, title_bg_rect, 3, border_radius=15)
         
         # Başlığı çiz
-        self.screen.blit(title, title_rect)
+        self.background.blit(title, title_rect)
         
         # Viewport alanını çiz
-        pygame.draw.rect(self.screen, self.TITLE_BG_COLOR, self.viewport, border_radius=10)
-        pygame.draw.rect(self.screen, self.BORDER_COLOR, self.viewport, 2, border_radius=10)
+        pygame.draw.rect(self.background, self.TITLE_BG_COLOR, self.viewport, border_radius=10)
+        pygame.draw.rect(self.background, self.BORDER_COLOR, self.viewport, 2, border_radius=10)
         
         # Scroll bar arka planını çiz
-        pygame.draw.rect(self.screen, self.SCROLL_BG_COLOR, self.scroll_bar_bg, border_radius=5)
-        
-        # Viewport için surface oluştur
-        viewport_surface = pygame.Surface((self.viewport.width, self.viewport.height))
-        viewport_surface.fill(self.TITLE_BG_COLOR)
+        pygame.draw.rect(self.background, self.SCROLL_BG_COLOR, self.scroll_bar_bg, border_radius=5)
         
-        # İçeriği viewport surface'ine çiz
-        y_offset = self.scroll_y
+        # İçerik yüksekliğini ve maksimum scroll değerini hesapla
         max_y = 0
+        y_offset = 0
+        for items in self.controls.values():
+            y_offset += 60 + 40 * len(items)
+            max_y = max(max_y, y_offset)
+            y_offset += 30
+        self.max_scroll = max(0, max_y - self.viewport.height)
         
+        # Tüm kontrol listesini içeren kaydırılabilir içerik yüzeyi
+        self.content = pygame.Surface((self.viewport.width, max(max_y, self.viewport.height)))
+        self.content.fill(self.TITLE_BG_COLOR)
+        y_offset = 0
         for section, items in self.controls.items():
-            # Alt başlık pozisyonu
-            subtitle_pos = y_offset
-            
-            # Sadece görünür alanda ise çiz
-            if subtitle_pos + 30 > 0 and subtitle_pos < self.viewport.height:
-                # Alt başlık
-                subtitle = self.subtitle_font.render(section, True, self.TEXT_COLOR)
-                subtitle_rect = subtitle.get_rect(x=30, y=subtitle_pos)
-                viewport_surface.blit(subtitle, subtitle_rect)
+            # Alt başlık
+            subtitle = self.subtitle_font.render(section, True, self.TEXT_COLOR)
+            subtitle_rect = subtitle.get_rect(x=30, y=y_offset)
+            self.content.blit(subtitle, subtitle_rect)
             
             y_offset += 60
             
             # Kontrol tuşları ve açıklamaları
             for key, description in items.items():
-                # Sadece görünür alanda ise çiz
-                if y_offset + 30 > 0 and y_offset < self.viewport.height:
-                    # Tuş
-                    key_text = self.font.render(key, True, self.BUTTON_COLOR)
-                    key_rect = key_text.get_rect(x=60, y=y_offset)
-                    viewport_surface.blit(key_text, key_rect)
-                    
-                    # İki nokta
-                    colon_text = self.font.render(':', True, self.TEXT_COLOR)
-                    colon_rect = colon_text.get_rect(x=key_rect.right + 10, y=y_offset)
-                    viewport_surface.blit(colon_text, colon_rect)
-                    
-                    # Açıklama
-                    desc_text = self.font.render(description, True, self.TEXT_COLOR)
-                    desc_rect = desc_text.get_rect(x=colon_rect.right + 10, y=y_offset)
-                    viewport_surface.blit(desc_text, desc_rect)
+                # Tuş
+                key_text = self.font.render(key, True, self.BUTTON_COLOR)
+                key_rect = key_text.get_rect(x=60, y=y_offset)
+                self.content.blit(key_text, key_rect)
+                
+                # İki nokta
+                colon_text = self.font.render(':', True, self.TEXT_COLOR)
+                colon_rect = colon_text.get_rect(x=key_rect.right + 10, y=y_offset)
+                self.content.blit(colon_text, colon_rect)
+                
+                # Açıklama
+                desc_text = self.font.render(description, True, self.TEXT_COLOR)
+                desc_rect = desc_text.get_rect(x=colon_rect.right + 10, y=y_offset)
+                self.content.blit(desc_text, desc_rect)
                 
                 y_offset += 40
-                max_y = max(max_y, y_offset)
             
             y_offset += 30
         
-        # Maksimum scroll değerini hesapla
-        self.max_scroll = max(0, max_y - self.viewport.height)
-        
-        # Viewport surface'ini ekrana çiz
-        self.screen.blit(viewport_surface, self.viewport)
-        
-        # Scroll bar'ı güncelle ve çiz
-        self.update_scroll_bar()
-        pygame.draw.rect(self.screen, self.SCROLL_FG_COLOR, self.scroll_bar, border_radius=5)
-        
-        # Geri dön butonu
-        mouse_pos = pygame.mouse.get_pos()
-        button_color = self.BUTTON_HOVER_COLOR if self.back_button.collidepoint(mouse_pos) else self.BUTTON_COLOR
+        # Geri dön butonunun normal/hover görünümleri
+        self.back_button_layers = (self.render_back_button(self.BUTTON_COLOR),
+                                   self.render_back_button(self.BUTTON_HOVER_COLOR))
+
+    def render_back_button(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Geri dön butonunu gölgesiyle birlikte ayrı bir yüzeye çizer"""
+        # Buton viewport'un üzerine taştığı için köşeler saydam bırakılır
+        surface = pygame.Surface((self.back_button.width, self.back_button.height + 3))
+        surface.fill((255, 0, 255))
+        surface.set_colorkey((255, 0, 255))
+        button = pygame.Rect(0, 0, self.back_button.width, self.back_button.height)
         
         # Buton gölgesi
-        shadow_rect = self.back_button.copy()
+        shadow_rect = button.copy()
         shadow_rect.y += 3
-        pygame.draw.rect(self.screen, (0, 0, 0, 50), shadow_rect, border_radius=10)
+        pygame.draw.rect(surface, (0, 0, 0, 50), shadow_rect, border_radius=10)
         
         # Butonu çiz
-        pygame.draw.rect(self.screen, button_color, self.back_button, border_radius=10)
-        pygame.draw.rect(self.screen, self.BORDER_COLOR, self.back_button, 2, border_radius=10)
+        pygame.draw.rect(surface, color, button, border_radius=10)
+        pygame.draw.rect(surface, self.BORDER_COLOR, button, 2, border_radius=10)
         
         # Buton metni
         text = self.font.render('Geri Dön', True, self.TEXT_COLOR)
-        text_rect = text.get_rect(center=self.back_button.center)
-        self.screen.blit(text, text_rect)
+        text_rect = text.get_rect(center=button.center)
+        surface.blit(text, text_rect)
+        return surface
+
+    def draw(self) -> None:
+        """Kontroller menüsünü katmanlardan birleştirir; hover ve scroll değişmediyse hiçbir şey yapmaz"""
+        hovered = self.back_button.collidepoint(pygame.mouse.get_pos())
+        frame = (hovered, self.scroll_y)
+        if frame == self.last_frame:
+            return
+        self.last_frame = frame
+        
+        self.screen.blit(self.background, (0, 0))
+        
+        # İçeriği scroll ofsetiyle viewport'a çiz
+        self.screen.blit(self.content, self.viewport,
+                         pygame.Rect(0, -self.scroll_y, self.viewport.width, self.viewport.height))
+        
+        # Scroll bar'ı güncelle ve çiz
+        self.update_scroll_bar()
+        pygame.draw.rect(self.screen, self.SCROLL_FG_COLOR, self.scroll_bar, border_radius=5)
+        
+        # Geri dön butonu
+        self.screen.blit(self.back_button_layers[hovered], self.back_button)
         
         pygame.display.flip()
 
     def run(self) -> str:
         """Kontroller menüsünü çalıştırır"""
+        clock = pygame.time.Clock()
+        self.last_frame = None  # Ekranı başka bir ekrandan devral
         while True:
             self.draw()
             action = self.handle_input()
             
             if action:
-                return action 
\ No newline at end of file
+                return action
+            
+            clock.tick(60)
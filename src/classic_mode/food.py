@@ -1,27 +1,131 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import pygame
 import random
 
+class FreeCells:
+    """Boş hücre indeksleri kümesi: dizi + konum haritası.
+
+    Ekleme, çıkarma (son elemanla yer değiştirerek) ve düzgün rastgele
+    seçim O(1)'dir.
+    """
+
+    def __init__(self, num_cells: int):
+        self.cells = list(range(num_cells))  # Boş hücreler
+        self.positions = list(range(num_cells))  # Hücre -> cells içindeki konum (-1: dolu)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __contains__(self, cell: int) -> bool:
+        return self.positions[cell] >= 0
+
+    def remove(self, cell: int) -> None:
+        """Hücreyi boş hücrelerden çıkarır"""
+        pos = self.positions[cell]
+        if pos < 0:
+            return
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[pos] = last
+            self.positions[last] = pos
+        self.positions[cell] = -1
+
+    def add(self, cell: int) -> None:
+        """Hücreyi boş hücrelere ekler"""
+        if self.positions[cell] >= 0:
+            return
+        self.positions[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def sample(self, rng: random.Random) -> int:
+        """Rastgele bir boş hücre döndürür"""
+        return self.cells[rng.randrange(len(self.cells))]
+
 class Food:
-    def __init__(self, width: int, height: int, block_size: int = 20):
+    def __init__(self, width: int, height: int, block_size: int = 20,
+                 snake_body=None, rng: random.Random = None):
         self.block_size = block_size
+        self.rng = rng or random  # Seed'lenmiş üreteç verilirse yem konumları tekrarlanabilir
         self.width = width
         self.height = height
-        self.position = self.generate_position()
+        self.cols = len(range(0, width, block_size))
+        self.rows = len(range(0, height, block_size))
+        self.board_full = False  # Boş hücre kalmadı (oyun kazanıldı)
+
+        # Yılan gövdesi verildiyse boş hücre indeksi gövdeyi dinleyerek güncellenir
+        self.snake_body = snake_body
+        self.free_cells = None
+        if snake_body is not None:
+            self.free_cells = FreeCells(self.cols * self.rows)
+            for position in snake_body:
+                self.cell_occupied(position)
+            snake_body.add_listener(self)
+            self.position = self.sample_free_position()
+        else:
+            self.position = self.generate_position()
+
+    def cell_index(self, position: Tuple[int, int]) -> Optional[int]:
+        """Piksel konumunu hücre indeksine çevirir (ızgara dışındaysa None)"""
+        x, y = position
+        if x < 0 or y < 0 or x % self.block_size or y % self.block_size:
+            return None
+        col, row = x // self.block_size, y // self.block_size
+        if col >= self.cols or row >= self.rows:
+            return None
+        return row * self.cols + col
+
+    def cell_occupied(self, position: Tuple[int, int]) -> None:
+        """Yılan bir hücreye girdiğinde çağrılır"""
+        index = self.cell_index(position)
+        if index is not None:
+            self.free_cells.remove(index)
+
+    def cell_vacated(self, position: Tuple[int, int]) -> None:
+        """Yılan bir hücreyi boşalttığında çağrılır"""
+        index = self.cell_index(position)
+        if index is not None:
+            self.free_cells.add(index)
 
     def generate_position(self) -> Tuple[int, int]:
         """Yem için random pozisyon oluşturur"""
-        x = random.randrange(0, self.width, self.block_size)
-        y = random.randrange(0, self.height, self.block_size)
+        x = self.rng.randrange(0, self.width, self.block_size)
+        y = self.rng.randrange(0, self.height, self.block_size)
         return (x, y)
 
-    def respawn(self, snake_body: List[Tuple[int, int]]) -> None:
-        """Yemi yeni bir konuma taşır (yılanın üzerine gelmeyecek şekilde)"""
-        while True:
-            new_pos = self.generate_position()
-            if new_pos not in snake_body:
-                self.position = new_pos
-                break
+    def sample_free_position(self) -> Optional[Tuple[int, int]]:
+        """Boş hücrelerden O(1) sürede rastgele birini seçer (yoksa None)"""
+        if len(self.free_cells) == 0:
+            return None
+        index = self.free_cells.sample(self.rng)
+        return ((index % self.cols) * self.block_size, (index // self.cols) * self.block_size)
+
+    def respawn(self, snake_body: List[Tuple[int, int]]) -> bool:
+        """Yemi yeni bir konuma taşır (yılanın üzerine gelmeyecek şekilde).
+
+        Boş hücre kalmadıysa `board_full` işaretlenir ve False döner.
+        """
+        if snake_body is self.snake_body:
+            new_pos = self.sample_free_position()
+        else:
+            # İndekslenmemiş gövde: birkaç rastgele deneme, sonra tam tarama
+            new_pos = None
+            for _ in range(8):
+                candidate = self.generate_position()
+                if candidate not in snake_body:
+                    new_pos = candidate
+                    break
+            if new_pos is None:
+                occupied = set(snake_body)
+                free = [(x, y) for y in range(0, self.height, self.block_size)
+                        for x in range(0, self.width, self.block_size)
+                        if (x, y) not in occupied]
+                new_pos = self.rng.choice(free) if free else None
+
+        if new_pos is None:
+            self.board_full = True
+            return False
+        self.position = new_pos
+        return True
 
     def draw(self, screen: pygame.Surface, color: Tuple[int, int, int] = (255, 0, 0)) -> None:
         """Yemi ekrana çizer"""
@@ -4,12 +4,17 @@ import time
 from typing import Tuple, Dict
 from .snake import Snake
 from .food import Food
+from .settings_store import SettingsStore
+from .sound_bank import SoundBank
+from .renderer import DirtyRenderer
+from .text_cache import render_text, overlay_surface
+from .recording import EpisodeRecorder, MODE_CLASSIC
 import os
 import json
 
 class Game:
-    def __init__(self, width: int = 800, height: int = 600):
-        pygame.mixer.init()  # Ses sistemini başlat
+    def __init__(self, width: int = 800, height: int = 600, settings_store: SettingsStore = None,
+                 sound_bank: SoundBank = None):
         self.width = width
         self.height = height
         self.block_size = 20
@@ -23,22 +28,12 @@ class Game:
         # En yüksek skoru yükle
         self.best_score = self.load_best_score()
         
-        # Ses efektlerini yükle
-        self.sounds_dir = "assets/sounds"
-        os.makedirs(self.sounds_dir, exist_ok=True)
+        # Her oyun seed + adım başına bir yön baytı olarak kaydedilir
+        self.recorder = EpisodeRecorder("data/recordings.bin", MODE_CLASSIC)
         
-        # Varsayılan ses dosyalarını oluştur
-        self.create_default_sounds()
-        
-        # Ses efektlerini yükle
-        self.eat_sound = pygame.mixer.Sound(os.path.join(self.sounds_dir, "eat.wav"))
-        self.crash_sound = pygame.mixer.Sound(os.path.join(self.sounds_dir, "crash.wav"))
-        self.move_sound = pygame.mixer.Sound(os.path.join(self.sounds_dir, "move.wav"))
-        
-        # Ses seviyelerini ayarla
-        self.eat_sound.set_volume(0.5)
-        self.crash_sound.set_volume(0.3)
-        self.move_sound.set_volume(0.1)
+        # Paylaşılan ses bankasından bu moda ait seviyelerle oynatıcı al
+        self.sound_bank = sound_bank or SoundBank()
+        self.sounds = self.sound_bank.player()
         
         # Ses durumu
         self.sound_enabled = True
@@ -71,116 +66,55 @@ class Game:
         # Oyun değişkenleri
         self.clock = pygame.time.Clock()
         
-        # Ayarları yükle
+        # Yalnızca değişen bölgeleri çizen ekran güncelleyici
+        self.renderer = DirtyRenderer(self.screen, self.block_size, self.BACKGROUND_COLOR,
+                                      self.TEXT_COLOR, self.SNAKE_COLOR, self.FOOD_COLOR)
+        
+        # Ayarları yükle ve değişikliklere abone ol
+        self.settings_store = settings_store or SettingsStore()
         self.settings = self.load_settings()
-        self.fps = self.settings.get('classic_fps', 10)  # Varsayılan 10 FPS
+        self.settings_store.subscribe(self.load_settings)
         
         # Oyunu başlat
         self.reset_game()
 
-    def create_default_sounds(self):
-        """Varsayılan ses dosyalarını oluştur"""
-        import wave
-        import struct
-        import numpy as np
-        
-        # Yem yeme sesi (yüksek tonlu bip)
-        if not os.path.exists(os.path.join(self.sounds_dir, "eat.wav")):
-            samplerate = 44100
-            duration = 0.1  # saniye
-            frequency = 1000  # Hz
-            t = np.linspace(0, duration, int(samplerate * duration))
-            data = np.sin(2 * np.pi * frequency * t) * 32767
-            data = data.astype(np.int16)
-            
-            with wave.open(os.path.join(self.sounds_dir, "eat.wav"), 'wb') as f:
-                f.setnchannels(1)
-                f.setsampwidth(2)
-                f.setframerate(samplerate)
-                f.writeframes(data.tobytes())
-        
-        # Çarpışma sesi (düşük tonlu bip)
-        if not os.path.exists(os.path.join(self.sounds_dir, "crash.wav")):
-            samplerate = 44100
-            duration = 0.2  # saniye
-            frequency = 500  # Hz
-            t = np.linspace(0, duration, int(samplerate * duration))
-            data = np.sin(2 * np.pi * frequency * t) * 32767
-            data = data.astype(np.int16)
-            
-            with wave.open(os.path.join(self.sounds_dir, "crash.wav"), 'wb') as f:
-                f.setnchannels(1)
-                f.setsampwidth(2)
-                f.setframerate(samplerate)
-                f.writeframes(data.tobytes())
-        
-        # Hareket sesi (çok kısa bip)
-        if not os.path.exists(os.path.join(self.sounds_dir, "move.wav")):
-            samplerate = 44100
-            duration = 0.05  # saniye
-            frequency = 800  # Hz
-            t = np.linspace(0, duration, int(samplerate * duration))
-            data = np.sin(2 * np.pi * frequency * t) * 16383  # Daha düşük ses seviyesi
-            data = data.astype(np.int16)
-            
-            with wave.open(os.path.join(self.sounds_dir, "move.wav"), 'wb') as f:
-                f.setnchannels(1)
-                f.setsampwidth(2)
-                f.setframerate(samplerate)
-                f.writeframes(data.tobytes())
-
     def reset_game(self) -> None:
         """Oyunu başlangıç durumuna getirir"""
         # Oyun nesnelerini oluştur
         start_pos = (self.width // 2, self.height // 2)
         self.snake = Snake(start_pos, self.block_size)
         self.snake.direction = [0, 0]  # Başlangıçta hareket etmesin
-        self.food = Food(self.width, self.height, self.block_size)
+        rng = self.recorder.begin(self.width, self.height, self.block_size, start_pos)
+        self.food = Food(self.width, self.height, self.block_size, self.snake.body, rng=rng)
+        self.renderer.track(self.snake, self.food)
         
         # Oyun değişkenleri
         self.score = 0
         self.game_over = False
+        self.won = False  # Tahta tamamen dolduysa oyun kazanılmıştır
         self.paused = False
         self.start_time = None
         self.elapsed_time = 0
         self.game_started = False
 
     def load_settings(self, settings: dict = None) -> dict:
-        """Ayarları yükler"""
-        if settings is not None:
-            # Ses ayarlarını güncelle
-            self.sound_enabled = settings.get('classic_sound_enabled', True)
-            self.eat_sound.set_volume(settings.get('eat_sound_volume', 0.5))
-            self.crash_sound.set_volume(settings.get('crash_sound_volume', 0.3))
-            self.move_sound.set_volume(settings.get('move_sound_volume', 0.1))
-            # FPS ayarını güncelle
-            self.fps = settings.get('classic_fps', 10)
-            return settings
-            
-        # Ayarlar verilmediyse dosyadan oku
-        settings_file = "data/settings.json"
-        try:
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-                self.sound_enabled = settings.get('classic_sound_enabled', True)
-                self.eat_sound.set_volume(settings.get('eat_sound_volume', 0.5))
-                self.crash_sound.set_volume(settings.get('crash_sound_volume', 0.3))
-                self.move_sound.set_volume(settings.get('move_sound_volume', 0.1))
-                self.fps = settings.get('classic_fps', 10)
-                return settings
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {
-                'classic_fps': 10,  # Varsayılan FPS
-                'classic_sound_enabled': True,
-                'eat_sound_volume': 0.5,
-                'crash_sound_volume': 0.3,
-                'move_sound_volume': 0.1
-            }
+        """Ayarları yükler ve uygular"""
+        if settings is None:
+            settings = self.settings_store.all()
+        # Ses ayarlarını güncelle
+        self.sound_enabled = settings.get('classic_sound_enabled', True)
+        self.sounds.set_volume('eat', settings.get('eat_sound_volume', 0.5))
+        self.sounds.set_volume('crash', settings.get('crash_sound_volume', 0.3))
+        self.sounds.set_volume('move', settings.get('move_sound_volume', 0.1))
+        # FPS ayarını güncelle
+        self.fps = settings.get('classic_fps', 10)
+        self.settings = settings
+        return settings
 
-    def play_sound(self, sound: pygame.mixer.Sound) -> None:
-        """Ses efektini çal"""
+    def play_sound(self, name: str) -> None:
+        """Ses efektini çal ('eat', 'crash' veya 'move')"""
         if self.sound_enabled:
-            sound.play()
+            self.sounds.play(name)
 
     def handle_input(self) -> str:
         """Kullanıcı girdilerini işler"""
@@ -189,6 +123,9 @@ class Game:
                 self.save_best_score()  # Çıkmadan önce skoru kaydet
                 return 'QUIT'
             
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                self.renderer.invalidate()  # Pencere yeniden çizilmeli
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.save_best_score()  # Menüye dönmeden önce skoru kaydet
@@ -223,7 +160,7 @@ class Game:
                     
                     # Yön değiştiyse hareket sesi çal
                     if old_direction != self.snake.direction:
-                        self.play_sound(self.move_sound)
+                        self.play_sound('move')
             
             # Oyun sonu ekranındaki butonlar için tıklama olayları
             if event.type == pygame.MOUSEBUTTONDOWN and self.game_over:
@@ -268,23 +205,30 @@ class Game:
         if self.game_over or self.paused:
             return
         
-        # Yılanı güncelle
+        # Yılanı güncelle (ilk yön tuşuna kadar yılan yerinde durur, adım kaydedilmez)
+        if self.snake.direction != [0, 0]:
+            self.recorder.record_direction(self.snake.direction)
         self.snake.update()
         
         # Çarpışma kontrolü
         if self.snake.check_collision(self.width, self.height):
-            self.play_sound(self.crash_sound)
+            self.play_sound('crash')
             self.game_over = True
+            self.recorder.finish(self.score)
             return
         
         # Yem yeme kontrolü
         if self.snake.body[0] == self.food.position:
-            self.play_sound(self.eat_sound)
+            self.play_sound('eat')
             self.score += 1
             if self.score > self.best_score:
                 self.best_score = self.score
             self.snake.grow_snake()
-            self.food.respawn(self.snake.body)
+            if not self.food.respawn(self.snake.body):
+                # Yem için boş hücre kalmadı: oyun kazanıldı
+                self.won = True
+                self.game_over = True
+                self.recorder.finish(self.score)
         
         # Zamanı güncelle
         if not self.start_time:
@@ -294,10 +238,7 @@ class Game:
     def draw_game_over_window(self) -> None:
         """Oyun sonu penceresini çizer"""
         # Yarı saydam siyah arka plan
-        s = pygame.Surface((self.width, self.height))
-        s.set_alpha(160)
-        s.fill((0, 0, 0))
-        self.screen.blit(s, (0, 0))
+        self.screen.blit(overlay_surface((self.width, self.height), 160), (0, 0))
         
         # Pencere boyutları
         window_width = 400
@@ -318,20 +259,19 @@ class Game:
         content_width = window_width - (padding * 2)
         
         # Başlık
-        title_font = pygame.font.Font(None, 64)
-        title = title_font.render('OYUN BİTTİ!', True, self.GAME_OVER_COLOR)
+        title = render_text('KAZANDINIZ!' if self.won else 'OYUN BİTTİ!', 64,
+                            self.BUTTON_COLOR if self.won else self.GAME_OVER_COLOR)
         title_rect = title.get_rect(center=(self.width//2, window_y + 60))
         self.screen.blit(title, title_rect)
         
         # Skor ve süre
-        font = pygame.font.Font(None, 48)
         messages = [
             f'Skor: {self.score}',
             f'Süre: {self.elapsed_time} saniye'
         ]
         
         for i, message in enumerate(messages):
-            text = font.render(message, True, self.TEXT_COLOR)
+            text = render_text(message, 48, self.TEXT_COLOR)
             text_rect = text.get_rect(center=(self.width//2, window_y + 140 + i * 50))
             self.screen.blit(text, text_rect)
         
@@ -361,40 +301,15 @@ class Game:
             pygame.draw.rect(self.screen, self.BORDER_COLOR, button_rect, 2, border_radius=5)
             
             # Buton metni
-            text_surface = font.render(text, True, self.TEXT_COLOR)
+            text_surface = render_text(text, 48, self.TEXT_COLOR)
             text_rect = text_surface.get_rect(center=button_rect.center)
             self.screen.blit(text_surface, text_rect)
 
-    def draw(self) -> None:
-        """Oyunu ekrana çizer"""
-        # Arka planı temizle
-        self.screen.fill(self.BACKGROUND_COLOR)
-        
-        # Yılan ve yemi çiz
-        self.snake.draw(self.screen, self.SNAKE_COLOR)  # Yılan rengini geçir
-        self.food.draw(self.screen, self.FOOD_COLOR)    # Yem rengini geçir
-        
-        # Font ayarla
-        font = pygame.font.Font(None, 36)
-        
-        # En yüksek skoru sol üstte göster
-        best_score_text = font.render(f'En Yüksek Skor: {self.best_score}', True, self.TEXT_COLOR)
-        self.screen.blit(best_score_text, (20, 20))
-        
-        # Mevcut skoru en yüksek skorun altında göster
-        score_text = font.render(f'Skor: {self.score}', True, self.TEXT_COLOR)
-        self.screen.blit(score_text, (20, 60))
-        
-        # Sağ üstte süreyi göster
-        time_text = font.render(f'Süre: {self.elapsed_time}s', True, self.TEXT_COLOR)
-        time_rect = time_text.get_rect()
-        time_rect.right = self.width - 20
-        time_rect.top = 20
-        self.screen.blit(time_text, time_rect)
-        
+    def draw_overlays(self) -> None:
+        """Başlangıç mesajını ve duraklatma/oyun sonu katmanlarını çizer"""
         # Başlangıç mesajını sadece oyun başlamadan önce göster
         if not self.game_started and self.snake.direction == [0, 0]:
-            start_text = font.render('Başlamak için bir yön tuşuna basın', True, self.TEXT_COLOR)
+            start_text = render_text('Başlamak için bir yön tuşuna basın', 36, self.TEXT_COLOR)
             start_rect = start_text.get_rect(center=(self.width//2, self.height//2))
             self.screen.blit(start_text, start_rect)
         
@@ -402,32 +317,31 @@ class Game:
         if self.game_over:
             self.draw_game_over_window()
         elif self.paused:
-            s = pygame.Surface((self.width, self.height))
-            s.set_alpha(128)
-            s.fill((0, 0, 0))
-            self.screen.blit(s, (0, 0))
+            self.screen.blit(overlay_surface((self.width, self.height), 128), (0, 0))
             
-            pause_text = font.render('OYUN DURAKLATILDI - SPACE ile Devam Et', True, self.PAUSE_COLOR)
+            pause_text = render_text('OYUN DURAKLATILDI - SPACE ile Devam Et', 36, self.PAUSE_COLOR)
             text_rect = pause_text.get_rect(center=(self.width/2, self.height/2))
             self.screen.blit(pause_text, text_rect)
+
+    def draw(self) -> None:
+        """Oyunu ekrana çizer (katman yoksa yalnızca değişen bölgeler güncellenir)"""
+        hud_items = [
+            # En yüksek skor sol üstte, mevcut skor altında, süre sağ üstte
+            (f'En Yüksek Skor: {self.best_score}', {'topleft': (20, 20)}),
+            (f'Skor: {self.score}', {'topleft': (20, 60)}),
+            (f'Süre: {self.elapsed_time}s', {'topright': (self.width - 20, 20)})
+        ]
         
-        pygame.display.flip()
+        has_overlay = (self.game_over or self.paused or
+                       (not self.game_started and self.snake.direction == [0, 0]))
+        self.renderer.present(hud_items, self.draw_overlays if has_overlay else None)
 
     def run(self) -> str:
         """Oyun döngüsünü çalıştırır"""
+        self.renderer.invalidate()  # Ekranı başka bir ekrandan devral
         while True:
-            # Ayarları yeniden yükle
-            settings_file = "data/settings.json"
-            try:
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                    self.fps = settings.get('classic_fps', 10)
-                    self.sound_enabled = settings.get('classic_sound_enabled', True)
-                    self.eat_sound.set_volume(settings.get('eat_sound_volume', 0.5))
-                    self.crash_sound.set_volume(settings.get('crash_sound_volume', 0.3))
-                    self.move_sound.set_volume(settings.get('move_sound_volume', 0.1))
-            except (FileNotFoundError, json.JSONDecodeError):
-                pass
+            # Ayar dosyası dışarıdan değiştiyse (düşük frekansta) yeniden yükle
+            self.settings_store.poll()
             
             if not self.paused:
                 self.update()
@@ -1,5 +1,5 @@
 import pygame
-from typing import List, Tuple, Dict
+from typing import Dict, List, Optional, Tuple
 
 class Menu:
     def __init__(self, width: int, height: int):
@@ -64,6 +64,10 @@ class Menu:
         
         self.font = pygame.font.Font(None, 48)
         self.title_font = pygame.font.Font(None, 82)
+        
+        # Önceden çizilmiş katmanlar; yalnızca hover/scroll değişince yeniden birleştirilir
+        self.build_layers()
+        self.last_frame = None
 
     def create_buttons(self):
         """Butonları oluştur"""
@@ -90,6 +94,9 @@ class Menu:
             if event.type == pygame.QUIT:
                 return 'QUIT'
             
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                self.last_frame = None  # Pencere yeniden çizilmeli
+            
             # Mouse wheel olaylarını yakala
             if event.type == pygame.MOUSEWHEEL:
                 if self.viewport.collidepoint(pygame.mouse.get_pos()):
@@ -130,9 +137,11 @@ class Menu:
             max_scroll_bar_y = self.scroll_bar_bg.bottom - self.scroll_bar.height
             self.scroll_bar.y = self.scroll_bar_bg.top + (max_scroll_bar_y - self.scroll_bar_bg.top) * scroll_ratio
 
-    def draw(self) -> None:
-        """Menüyü ekrana çizer"""
-        self.screen.fill(self.BACKGROUND_COLOR)
+    def build_layers(self) -> None:
+        """Sabit arka planı, kaydırılabilir buton içeriğini ve hover varyantlarını çizer"""
+        # Sabit arka plan: başlık, viewport çerçevesi ve scroll bar zemini
+        self.background = pygame.Surface((self.width, self.height))
+        self.background.fill(self.BACKGROUND_COLOR)
         
         # Başlık için gölge efekti
         title = self.title_font.render('YILAN OYUNU', True, self.TITLE_COLOR)
@@ -140,18 +149,17 @@ class Menu:
         
         # Başlık arka planı
         padding = 40
-        title_bg = pygame.Surface((title.get_width() + padding * 2, title.get_height() + padding))
-        title_bg.fill(self.TITLE_BG_COLOR)
-        title_bg_rect = title_bg.get_rect(center=(self.width//2, self.title_y))
+        title_bg_rect = pygame.Rect(0, 0, title.get_width() + padding * 2, title.get_height() + padding)
+        title_bg_rect.center = (self.width//2, self.title_y)
         
         # Başlık arka plan gölgesi
         shadow_rect = title_bg_rect.copy()
         shadow_rect.y += 4
-        pygame.draw.rect(self.screen, (0, 0, 0, 50), shadow_rect, border_radius=15)
+        pygame.draw.rect(self.background, (0, 0, 0, 50), shadow_rect, border_radius=15)
         
         # Başlık arka planını çiz
-        pygame.draw.rect(self.screen, self.TITLE_BG_COLOR, title_bg_rect, border_radius=15)
-        pygame.draw.rect(self.screen, self.BORDER_COLOR, title_bg_rect, 3, border_radius=15)
+        pygame.draw.rect(self.background, self.TITLE_BG_COLOR, title_bg_rect, border_radius=15)
+        pygame.draw.rect(self.background, self.BORDER_COLOR, title_bg_rect, 3, border_radius=15)
         
         # Başlık gölgesi
         shadow_offset = 2
@@ -159,71 +167,93 @@ class Menu:
         shadow_rect = title_rect.copy()
         shadow_rect.x += shadow_offset
         shadow_rect.y += shadow_offset
-        self.screen.blit(title_shadow, shadow_rect)
+        self.background.blit(title_shadow, shadow_rect)
         
         # Başlığı çiz
-        self.screen.blit(title, title_rect)
+        self.background.blit(title, title_rect)
         
         # Viewport alanını çiz
-        pygame.draw.rect(self.screen, self.TITLE_BG_COLOR, self.viewport, border_radius=10)
-        pygame.draw.rect(self.screen, self.BORDER_COLOR, self.viewport, 2, border_radius=10)
+        pygame.draw.rect(self.background, self.TITLE_BG_COLOR, self.viewport, border_radius=10)
+        pygame.draw.rect(self.background, self.BORDER_COLOR, self.viewport, 2, border_radius=10)
         
         # Scroll bar arka planını çiz
-        pygame.draw.rect(self.screen, self.SCROLL_BG_COLOR, self.scroll_bar_bg, border_radius=5)
-        
-        # Mouse pozisyonunu viewport koordinatlarına çevir
-        mouse_pos = pygame.mouse.get_pos()
-        if self.viewport.collidepoint(mouse_pos):
-            viewport_mouse_x = mouse_pos[0] - self.viewport.x
-            viewport_mouse_y = mouse_pos[1] - self.viewport.y - self.scroll_y
-        else:
-            viewport_mouse_x = -1
-            viewport_mouse_y = -1
-        
-        # Viewport için surface oluştur
-        viewport_surface = pygame.Surface((self.viewport.width, self.viewport.height))
-        viewport_surface.fill(self.TITLE_BG_COLOR)
+        pygame.draw.rect(self.background, self.SCROLL_BG_COLOR, self.scroll_bar_bg, border_radius=5)
         
         # Maksimum scroll değerini hesapla
         last_button = list(self.buttons.values())[-1]
         content_height = last_button.bottom + self.button_spacing
         self.max_scroll = max(0, content_height - self.viewport.height)
         
-        # Butonları viewport surface'ine çiz
+        # Butonların normal/hover görünümleri (gölge dahil)
+        self.button_layers = {}
+        for text in self.buttons:
+            if text == 'Çıkış':
+                colors = (self.EXIT_BUTTON_COLOR, self.EXIT_BUTTON_HOVER_COLOR)
+            else:
+                colors = (self.BUTTON_COLOR, self.BUTTON_HOVER_COLOR)
+            self.button_layers[text] = tuple(self.render_button(text, color) for color in colors)
+        
+        # Tüm butonları içeren kaydırılabilir içerik yüzeyi
+        self.content = pygame.Surface((self.viewport.width, max(content_height, self.viewport.height)))
+        self.content.fill(self.TITLE_BG_COLOR)
         for text, button in self.buttons.items():
-            # Butonun scroll edilmiş pozisyonu
-            scrolled_button = button.copy()
-            scrolled_button.y += self.scroll_y
-            
-            # Viewport içinde görünür alan kontrolü
-            if scrolled_button.bottom > 0 and scrolled_button.top < self.viewport.height:
-                # Buton renklerini belirle
-                if text == 'Çıkış':
-                    default_color = self.EXIT_BUTTON_COLOR
-                    hover_color = self.EXIT_BUTTON_HOVER_COLOR
-                else:
-                    default_color = self.BUTTON_COLOR
-                    hover_color = self.BUTTON_HOVER_COLOR
-                
-                # Hover efekti için kontrol
-                color = hover_color if button.collidepoint(viewport_mouse_x, viewport_mouse_y) else default_color
-                
-                # Buton gölgesi
-                shadow_rect = scrolled_button.copy()
-                shadow_rect.y += 3
-                pygame.draw.rect(viewport_surface, (0, 0, 0, 50), shadow_rect, border_radius=10)
-                
-                # Buton arka planı
-                pygame.draw.rect(viewport_surface, color, scrolled_button, border_radius=10)
-                pygame.draw.rect(viewport_surface, self.BORDER_COLOR, scrolled_button, 2, border_radius=10)
-                
-                # Buton metni
-                text_surface = self.font.render(text, True, self.TEXT_COLOR)
-                text_rect = text_surface.get_rect(center=scrolled_button.center)
-                viewport_surface.blit(text_surface, text_rect)
-        
-        # Viewport surface'ini ekrana çiz
-        self.screen.blit(viewport_surface, self.viewport)
+            self.content.blit(self.button_layers[text][0], button.topleft)
+
+    def render_button(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Tek bir butonu gölgesiyle birlikte ayrı bir yüzeye çizer"""
+        surface = pygame.Surface((self.button_width, self.button_height + 3))
+        surface.fill(self.TITLE_BG_COLOR)
+        button = pygame.Rect(0, 0, self.button_width, self.button_height)
+        
+        # Buton gölgesi
+        shadow_rect = button.copy()
+        shadow_rect.y += 3
+        pygame.draw.rect(surface, (0, 0, 0, 50), shadow_rect, border_radius=10)
+        
+        # Buton arka planı
+        pygame.draw.rect(surface, color, button, border_radius=10)
+        pygame.draw.rect(surface, self.BORDER_COLOR, button, 2, border_radius=10)
+        
+        # Buton metni
+        text_surface = self.font.render(text, True, self.TEXT_COLOR)
+        text_rect = text_surface.get_rect(center=button.center)
+        surface.blit(text_surface, text_rect)
+        return surface
+
+    def hovered_button(self) -> Optional[str]:
+        """Fare imlecinin üzerinde olduğu butonun adını döndürür"""
+        mouse_pos = pygame.mouse.get_pos()
+        if not self.viewport.collidepoint(mouse_pos):
+            return None
+        # Mouse pozisyonunu viewport koordinatlarına çevir
+        viewport_mouse_x = mouse_pos[0] - self.viewport.x
+        viewport_mouse_y = mouse_pos[1] - self.viewport.y - self.scroll_y
+        for text, button in self.buttons.items():
+            if button.collidepoint(viewport_mouse_x, viewport_mouse_y):
+                return text
+        return None
+
+    def draw(self) -> None:
+        """Menüyü katmanlardan birleştirir; hover ve scroll değişmediyse hiçbir şey yapmaz"""
+        hovered = self.hovered_button()
+        frame = (hovered, self.scroll_y)
+        if frame == self.last_frame:
+            return
+        self.last_frame = frame
+        
+        self.screen.blit(self.background, (0, 0))
+        
+        # İçeriği scroll ofsetiyle viewport'a çiz
+        self.screen.blit(self.content, self.viewport,
+                         pygame.Rect(0, -self.scroll_y, self.viewport.width, self.viewport.height))
+        
+        # Hover edilen butonun varyantını viewport'a kırparak çiz
+        if hovered is not None:
+            button = self.buttons[hovered]
+            self.screen.set_clip(self.viewport)
+            self.screen.blit(self.button_layers[hovered][1],
+                             (self.viewport.x + button.x, self.viewport.y + button.y + self.scroll_y))
+            self.screen.set_clip(None)
         
         # Scroll bar'ı güncelle ve çiz
         self.update_scroll_bar()
@@ -233,9 +263,13 @@ class Menu:
 
     def run(self) -> str:
         """Menüyü çalıştırır ve seçilen modu döndürür"""
+        clock = pygame.time.Clock()
+        self.last_frame = None  # Ekranı başka bir ekrandan devral
         while True:
             self.draw()
             action = self.handle_input()
             
             if action:
-                return action 
\ No newline at end of file
+                return action
+            
+            clock.tick(60)
@@ -0,0 +1,207 @@
+"""Bölümlerin seed + yön baytları olarak kaydı ve ekransız yeniden simülasyonu.
+
+Kullanım (proje kök dizininden), kayıtları doğrular ve hızı ölçer:
+    python -m src.classic_mode.recording models/recordings.bin
+"""
+import argparse
+import os
+import random
+import struct
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from .snake import Snake
+from .food import Food
+
+# Yön kodları AI aksiyonlarıyla aynıdır: 0 yukarı, 1 aşağı, 2 sol, 3 sağ
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+MODE_CLASSIC = 0
+MODE_AI = 1
+
+# Kayıt başlığı: imza, sürüm, mod, tahta (genişlik, yükseklik, blok), başlangıç hücresi,
+# yem üretecinin seed'i, adım sayısı ve son skor; ardından adım başına bir yön baytı
+HEADER = struct.Struct('<2sBBHHHHHQII')
+MAGIC = b'EP'
+VERSION = 1
+
+class Episode:
+    """Tek bir kaydedilmiş bölüm: başlangıç durumu ve yön baytları"""
+
+    __slots__ = ('mode', 'width', 'height', 'block_size', 'start_pos', 'seed', 'score', 'actions')
+
+    def __init__(self, mode: int, width: int, height: int, block_size: int,
+                 start_pos: Tuple[int, int], seed: int, score: int, actions: bytes):
+        self.mode = mode
+        self.width = width
+        self.height = height
+        self.block_size = block_size
+        self.start_pos = start_pos
+        self.seed = seed
+        self.score = score
+        self.actions = actions
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def pack(self) -> bytes:
+        """Başlık + yön baytları"""
+        return HEADER.pack(MAGIC, VERSION, self.mode, self.width, self.height, self.block_size,
+                           self.start_pos[0], self.start_pos[1], self.seed,
+                           len(self.actions), self.score) + bytes(self.actions)
+
+class EpisodeRecorder:
+    """Oynanan bölümü bellekte toplar ve bitince kayıt dosyasının sonuna ekler.
+
+    Yem konumları `begin` ile dönen seed'lenmiş üreteçten çekildiği için
+    başlangıç hücresi, seed ve her adımdaki yön bölümü tam olarak belirler.
+    Yarıda bırakılan (bitmemiş) bölümler yazılmaz.
+    """
+
+    def __init__(self, path: str, mode: int, enabled: bool = True):
+        self.path = path
+        self.mode = mode
+        self.enabled = enabled
+        self.episode: Optional[Episode] = None
+        self.actions = bytearray()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def begin(self, width: int, height: int, block_size: int,
+              start_pos: Tuple[int, int]) -> random.Random:
+        """Yeni bölümü başlatır ve yem için seed'lenmiş üreteci döndürür"""
+        seed = random.getrandbits(64)
+        self.episode = Episode(self.mode, width, height, block_size, start_pos, seed, 0, b'')
+        self.actions = bytearray()
+        return random.Random(seed)
+
+    def record(self, action: int) -> None:
+        """Adımda kullanılan yön kodunu ekler"""
+        self.actions.append(action)
+
+    def record_direction(self, direction: List[int]) -> None:
+        """Piksel cinsinden yön vektörünü kod olarak ekler"""
+        b = self.episode.block_size
+        self.actions.append(DIRECTIONS.index((direction[0] // b, direction[1] // b)))
+
+    def finish(self, score: int) -> None:
+        """Bölümü skoruyla birlikte dosyaya ekler"""
+        episode, self.episode = self.episode, None
+        if not self.enabled or episode is None or not self.actions:
+            return
+        episode.score = score
+        episode.actions = bytes(self.actions)
+        with open(self.path, 'ab') as f:
+            f.write(episode.pack())
+
+class EpisodeArchive:
+    """Kayıt dosyasını okur; bölümlere indeksle erişilir"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self.data = f.read()
+        self.offsets = []
+        offset = 0
+        while offset + HEADER.size <= len(self.data):
+            fields = HEADER.unpack_from(self.data, offset)
+            if fields[0] != MAGIC:
+                raise ValueError(f"Bozuk kayıt dosyası: {path} (konum {offset})")
+            end = offset + HEADER.size + fields[9]
+            if end > len(self.data):
+                break  # Yarım yazılmış son kayıt
+            self.offsets.append(offset)
+            offset = end
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index: int) -> Episode:
+        offset = self.offsets[index]
+        (_, _, mode, width, height, block_size, start_x, start_y,
+         seed, steps, score) = HEADER.unpack_from(self.data, offset)
+        start = offset + HEADER.size
+        return Episode(mode, width, height, block_size, (start_x, start_y), seed, score,
+                       self.data[start:start + steps])
+
+    def __iter__(self) -> Iterator[Episode]:
+        for i in range(len(self)):
+            yield self[i]
+
+class EpisodeSimulator:
+    """Kaydı oyunlarla aynı kurallarla ekransız yeniden oynatır.
+
+    `seek` geriye gidilirse bölümü baştan kurar ve hedef adıma kadar ileri
+    sarar; yeniden simülasyon çizimsiz olduğu için bu çok hızlıdır.
+    """
+
+    def __init__(self, episode: Episode):
+        self.episode = episode
+        self.reset()
+
+    def reset(self) -> None:
+        """Bölümün başlangıç durumunu kurar"""
+        episode = self.episode
+        self.snake = Snake(episode.start_pos, episode.block_size)
+        self.food = Food(episode.width, episode.height, episode.block_size, self.snake.body,
+                         rng=random.Random(episode.seed))
+        self.step_index = 0
+        self.score = 0
+        self.done = False
+        self.won = False
+
+    def step(self) -> bool:
+        """Sonraki kayıtlı adımı uygular; bölüm bittiyse False döner"""
+        if self.done or self.step_index >= len(self.episode.actions):
+            return False
+        dx, dy = DIRECTIONS[self.episode.actions[self.step_index]]
+        b = self.episode.block_size
+        self.snake.direction = [dx * b, dy * b]
+        self.snake.update()
+        self.step_index += 1
+
+        if self.snake.check_collision(self.episode.width, self.episode.height):
+            self.done = True
+        elif self.snake.body[0] == self.food.position:
+            self.score += 1
+            self.snake.grow_snake()
+            if not self.food.respawn(self.snake.body):
+                self.won = True
+                self.done = True
+        return True
+
+    def seek(self, step_index: int) -> None:
+        """Verilen adım sayısı uygulanmış duruma gider"""
+        step_index = max(0, min(step_index, len(self.episode.actions)))
+        if step_index < self.step_index:
+            self.reset()
+        while self.step_index < step_index and self.step():
+            pass
+
+    def run(self) -> int:
+        """Bölümü sonuna kadar oynatır ve skoru döndürür"""
+        while self.step():
+            pass
+        return self.score
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Kayıtlı bölümleri ekransız yeniden simüle eder")
+    parser.add_argument('path', type=str, help="Kayıt dosyası (ör. models/recordings.bin)")
+    args = parser.parse_args(argv)
+
+    archive = EpisodeArchive(args.path)
+    start = time.perf_counter()
+    steps = 0
+    mismatches = 0
+    for i, episode in enumerate(archive):
+        simulator = EpisodeSimulator(episode)
+        if simulator.run() != episode.score or not simulator.done:
+            mismatches += 1
+            print(f"Bölüm {i}: kayıtlı skor {episode.score}, simülasyon {simulator.score}")
+        steps += simulator.step_index
+    elapsed = time.perf_counter() - start
+    print(f"{len(archive)} bölüm, {steps} adım, {elapsed:.2f} sn "
+          f"({steps / max(elapsed, 1e-9):.0f} adım/sn), {mismatches} uyuşmazlık")
+
+if __name__ == '__main__':
+    main()
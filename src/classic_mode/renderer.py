@@ -0,0 +1,133 @@
+import pygame
+from typing import Callable, Dict, List, Optional, Tuple
+from .text_cache import render_text
+
+# (metin, konum) çiftleri; konum `get_rect` anahtar kelimeleri, ör. {'topleft': (20, 20)}
+HudItems = List[Tuple[str, Dict[str, Tuple[int, int]]]]
+
+class DirtyRenderer:
+    """Oyun ekranını yalnızca değişen bölgeleri yeniden çizerek günceller.
+
+    Yılan gövdesinin dinleyicisi olarak iki kare arasında dolan/boşalan
+    hücreleri toplar; eski ve yeni baş, eski ve yeni yem ile metni değişen
+    HUD satırlarını da ekleyip yalnızca bu dikdörtgenleri
+    `pygame.display.update(rects)` ile ekrana verir. Duraklatma/oyun sonu
+    gibi katmanlar açıkken, ekran boyutu değiştiğinde veya `invalidate`
+    çağrıldığında tüm ekran çizilir.
+    """
+
+    def __init__(self, screen: pygame.Surface, block_size: int,
+                 background_color: Tuple[int, int, int], text_color: Tuple[int, int, int],
+                 snake_color: Tuple[int, int, int], food_color: Tuple[int, int, int],
+                 enabled: bool = True):
+        self.screen = screen
+        self.block_size = block_size
+        self.background_color = background_color
+        self.text_color = text_color
+        self.snake_color = snake_color
+        self.food_color = food_color
+        self.enabled = enabled  # False ise her kare tamamen çizilir
+        self.font_size = 36
+
+        self.snake = None
+        self.food = None
+        self.changed_cells = set()  # Son kareden beri dolan/boşalan hücreler
+        self.last_head = None
+        self.last_food = None
+        self.last_size = None
+        self.had_overlay = False
+        self.full_redraw = True
+        # HUD satırı başına (metin, yüzey, dikdörtgen)
+        self.hud: List[Tuple[str, pygame.Surface, pygame.Rect]] = []
+
+    def track(self, snake, food) -> None:
+        """Yeni yılan ve yemi izlemeye başlar (bir sonraki kare tamamen çizilir)"""
+        self.snake = snake
+        self.food = food
+        snake.body.add_listener(self)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Bir sonraki karenin tamamen çizilmesini ister"""
+        self.full_redraw = True
+
+    def cell_occupied(self, cell: Tuple[int, int]) -> None:
+        self.changed_cells.add(cell)
+
+    def cell_vacated(self, cell: Tuple[int, int]) -> None:
+        self.changed_cells.add(cell)
+
+    def cell_rect(self, cell: Tuple[int, int]) -> pygame.Rect:
+        return pygame.Rect(cell[0], cell[1], self.block_size, self.block_size)
+
+    def render_hud(self, items: HudItems) -> None:
+        """HUD satırlarının yüzeylerini (metin önbelleğinden) ve konumlarını günceller"""
+        hud = []
+        for text, anchor in items:
+            surface = render_text(text, self.font_size, self.text_color)
+            hud.append((text, surface, surface.get_rect(**anchor)))
+        self.hud = hud
+
+    def present(self, hud_items: HudItems, overlay: Optional[Callable[[], None]] = None) -> None:
+        """Kareyi çizer ve ekrana verir; `overlay` verilirse tüm ekran çizilir"""
+        size = self.screen.get_size()
+        if (not self.enabled or self.full_redraw or overlay is not None or self.had_overlay or
+                size != self.last_size):
+            self.present_full(hud_items, overlay)
+        else:
+            self.present_changes(hud_items)
+
+        self.changed_cells.clear()
+        self.last_head = self.snake.body[0]
+        self.last_food = self.food.position
+        self.last_size = size
+        self.had_overlay = overlay is not None
+        self.full_redraw = False
+
+    def present_full(self, hud_items: HudItems, overlay: Optional[Callable[[], None]]) -> None:
+        """Tüm ekranı çizer"""
+        self.screen.fill(self.background_color)
+        self.snake.draw(self.screen, self.snake_color)
+        self.food.draw(self.screen, self.food_color)
+        self.render_hud(hud_items)
+        for _, surface, rect in self.hud:
+            self.screen.blit(surface, rect)
+        if overlay is not None:
+            overlay()
+        pygame.display.flip()
+
+    def present_changes(self, hud_items: HudItems) -> None:
+        """Yalnızca değişen hücreleri ve HUD satırlarını çizer"""
+        cells = self.changed_cells | {self.last_head, self.snake.body[0],
+                                      self.last_food, self.food.position}
+        dirty = [self.cell_rect(cell) for cell in cells]
+
+        old_hud = self.hud
+        self.render_hud(hud_items)
+        for i, (text, _, rect) in enumerate(self.hud):
+            if i >= len(old_hud) or old_hud[i][0] != text:
+                dirty.append(rect)
+                if i < len(old_hud):
+                    dirty.append(old_hud[i][2])
+        for _, _, rect in old_hud[len(self.hud):]:
+            dirty.append(rect)
+
+        # Her kirli dikdörtgeni kırparak baştan çiz: zemin, hücreler, yem, HUD
+        size = self.block_size
+        head = self.snake.body[0]
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.screen.fill(self.background_color)
+            for x in range(rect.left // size * size, rect.right, size):
+                for y in range(rect.top // size * size, rect.bottom, size):
+                    if (x, y) in self.snake.body:
+                        self.snake.draw_segment(self.screen, (x, y), self.snake_color, (x, y) == head)
+            if rect.colliderect(self.cell_rect(self.food.position)):
+                self.food.draw(self.screen, self.food_color)
+            # HUD metinleri yılanın ve yemin üstünde kalır
+            for _, surface, hud_rect in self.hud:
+                if hud_rect.colliderect(rect):
+                    self.screen.blit(surface, hud_rect)
+        self.screen.set_clip(None)
+
+        pygame.display.update(dirty)
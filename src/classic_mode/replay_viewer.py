@@ -0,0 +1,153 @@
+"""Kayıtlı bölümleri istenen hızda oynatan ve istenen adıma saran görüntüleyici.
+
+Kullanım (proje kök dizininden):
+    python -m src.classic_mode.replay_viewer models/recordings.bin --episode -1 --speed 20
+
+Kontroller: SPACE oynat/durdur, Yukarı/Aşağı hız x2 / ÷2, Sol/Sağ bir adım,
+PageUp/PageDown 100 adım, Home/End başa/sona, N/B sonraki/önceki bölüm,
+ESC veya Q çıkış.
+"""
+import argparse
+import time
+from typing import List, Optional
+
+import pygame
+
+from .recording import EpisodeArchive, EpisodeSimulator, MODE_AI
+from .renderer import DirtyRenderer
+
+class ReplayViewer:
+    def __init__(self, archive: EpisodeArchive, index: int = -1, speed: float = 10,
+                 step: int = 0):
+        self.archive = archive
+        self.speed = speed  # Saniyedeki adım
+        self.min_speed = 1
+        self.max_speed = 10000
+        self.playing = True
+        self.render_fps = 60
+        self.step_accumulator = 0.0
+
+        # Modern renk paleti (oyun ekranlarıyla aynı)
+        self.BACKGROUND_COLOR = (17, 24, 39)  # Koyu lacivert
+        self.TEXT_COLOR = (243, 244, 246)  # Açık gri
+        self.SNAKE_COLOR = (52, 211, 153)  # Açık yeşil
+        self.FOOD_COLOR = (248, 113, 113)  # Açık kırmızı
+
+        self.load_episode(index % len(archive))
+        self.simulator.seek(step)
+
+    def load_episode(self, index: int) -> None:
+        """Bölümü açar ve pencereyi tahta boyutuna göre kurar"""
+        self.index = index
+        episode = self.archive[index]
+        self.simulator = EpisodeSimulator(episode)
+        self.screen = pygame.display.set_mode((episode.width, episode.height))
+        pygame.display.set_caption("Yılan Oyunu - Kayıt İzleyici")
+        self.renderer = DirtyRenderer(self.screen, episode.block_size, self.BACKGROUND_COLOR,
+                                      self.TEXT_COLOR, self.SNAKE_COLOR, self.FOOD_COLOR)
+        self.step_accumulator = 0.0
+
+    def seek(self, step: int) -> None:
+        """Verilen adıma gider (geri sarmada bölüm baştan simüle edilir)"""
+        self.simulator.seek(step)
+        self.step_accumulator = 0.0
+
+    def handle_input(self) -> bool:
+        """Kullanıcı girdilerini işler; çıkılacaksa False döner"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                self.renderer.invalidate()  # Pencere yeniden çizilmeli
+
+            if event.type == pygame.KEYDOWN:
+                current = self.simulator.step_index
+                if event.key in (pygame.K_ESCAPE, pygame.K_q):
+                    return False
+                elif event.key == pygame.K_SPACE:
+                    self.playing = not self.playing
+                elif event.key == pygame.K_UP:
+                    self.speed = min(self.speed * 2, self.max_speed)
+                elif event.key == pygame.K_DOWN:
+                    self.speed = max(self.speed / 2, self.min_speed)
+                elif event.key == pygame.K_RIGHT:
+                    self.seek(current + 1)
+                elif event.key == pygame.K_LEFT:
+                    self.seek(current - 1)
+                elif event.key == pygame.K_PAGEDOWN:
+                    self.seek(current + 100)
+                elif event.key == pygame.K_PAGEUP:
+                    self.seek(current - 100)
+                elif event.key == pygame.K_HOME:
+                    self.seek(0)
+                elif event.key == pygame.K_END:
+                    self.seek(len(self.simulator.episode))
+                elif event.key == pygame.K_n:
+                    self.load_episode((self.index + 1) % len(self.archive))
+                elif event.key == pygame.K_b:
+                    self.load_episode((self.index - 1) % len(self.archive))
+        return True
+
+    def update(self, elapsed: float) -> None:
+        """Oynatılıyorsa geçen süreye düşen adımları uygular"""
+        if not self.playing or self.simulator.done:
+            self.step_accumulator = 0.0
+            return
+        self.step_accumulator += elapsed * self.speed
+        steps = int(self.step_accumulator)
+        self.step_accumulator -= steps
+        self.simulator.seek(self.simulator.step_index + steps)
+
+    def draw(self) -> None:
+        """Kareyi değişen bölgeleri güncelleyerek çizer"""
+        simulator = self.simulator
+        if self.renderer.snake is not simulator.snake:
+            self.renderer.track(simulator.snake, simulator.food)  # Geri sarmada bölüm yeniden kuruldu
+
+        episode = simulator.episode
+        status = 'Bitti' if simulator.done else ('Oynatılıyor' if self.playing else 'Durduruldu')
+        info_texts = [
+            f'Bölüm: {self.index + 1}/{len(self.archive)} ({"AI" if episode.mode == MODE_AI else "Klasik"})',
+            f'Adım: {simulator.step_index}/{len(episode)}',
+            f'Skor: {simulator.score}/{episode.score}',
+            f'Hız: {self.speed:g} adım/sn',
+            f'Durum: {status}'
+        ]
+        hud_items = [(text, {'topleft': (20, 20 + i * 30)}) for i, text in enumerate(info_texts)]
+        self.renderer.present(hud_items)
+
+    def run(self) -> None:
+        """Görüntüleyici döngüsü"""
+        clock = pygame.time.Clock()
+        last_time = time.perf_counter()
+        while self.handle_input():
+            now = time.perf_counter()
+            self.update(now - last_time)
+            last_time = now
+            self.draw()
+            clock.tick(self.render_fps)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Kayıtlı bölümleri oynatır")
+    parser.add_argument('path', type=str, help="Kayıt dosyası (ör. models/recordings.bin)")
+    parser.add_argument('--episode', type=int, default=-1, help="Bölüm indeksi (negatifse sondan)")
+    parser.add_argument('--best', action='store_true', help="En yüksek skorlu bölümü aç")
+    parser.add_argument('--speed', type=float, default=10, help="Saniyedeki adım")
+    parser.add_argument('--step', type=int, default=0, help="Başlangıç adımı")
+    args = parser.parse_args(argv)
+
+    archive = EpisodeArchive(args.path)
+    if len(archive) == 0:
+        print(f"Kayıt bulunamadı: {args.path}")
+        return
+    index = args.episode
+    if args.best:
+        index = max(range(len(archive)), key=lambda i: archive[i].score)
+
+    pygame.init()
+    ReplayViewer(archive, index, args.speed, args.step).run()
+    pygame.quit()
+
+if __name__ == '__main__':
+    main()
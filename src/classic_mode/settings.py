@@ -1,10 +1,11 @@
 import pygame
-import json
 import os
 from typing import Dict
+from .settings_store import SettingsStore, DEFAULT_SETTINGS
+from .text_cache import render_text
 
 class Settings:
-    def __init__(self, width: int = 800, height: int = 600):
+    def __init__(self, width: int = 800, height: int = 600, settings_store: SettingsStore = None):
         self.width = width
         self.height = height
         self.screen = pygame.display.set_mode((width, height))
@@ -18,19 +19,13 @@ class Settings:
         self.BUTTON_COLOR = (16, 185, 129)  # Yeşil
         self.BUTTON_HOVER_COLOR = (5, 150, 105)  # Koyu yeşil
         
-        # Ayarlar dosyası
+        # Ayarlar dosyası ve paylaşılan ayar servisi
         self.settings_file = "data/settings.json"
         os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
+        self.settings_store = settings_store or SettingsStore(self.settings_file)
         
         # Varsayılan ayarlar
-        self.default_settings = {
-            'eat_sound_volume': 0.5,
-            'crash_sound_volume': 0.3,
-            'move_sound_volume': 0.1,
-            'classic_sound_enabled': True,
-            'ai_sound_enabled': True,
-            'classic_fps': 10  # Klasik mod için varsayılan FPS
-        }
+        self.default_settings = dict(DEFAULT_SETTINGS)
         
         # Ayarları yükle
         self.settings = self.load_settings()
@@ -43,29 +38,31 @@ class Settings:
         
         # Font
         self.font = pygame.font.Font(None, 36)
+        
+        # Yerleşim
+        self.y_start = 100  # Başlangıç y pozisyonunu yukarı çektik
+        self.y_spacing = 70  # Elemanlar arası boşluğu azalttık
+        self.button_spacing = 60
+        button_y_start = self.y_start + self.y_spacing * 4
+        self.classic_sound_button = pygame.Rect(self.width//2 - 150, button_y_start, 300, 40)
+        self.ai_sound_button = pygame.Rect(self.width//2 - 150, button_y_start + self.button_spacing, 300, 40)
+        self.back_button = pygame.Rect(self.width//2 - 100, button_y_start + self.button_spacing * 2, 200, 40)
+        
+        # Başlık ve geri dön butonundan oluşan sabit arka plan katmanı
+        self.build_background()
 
     def load_settings(self) -> Dict:
         """Ayarları yükle"""
-        settings = self.default_settings.copy()
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, 'r') as f:
-                    saved_settings = json.load(f)
-                    # Mevcut ayarları güncelle, eksik olanları varsayılan değerlerle bırak
-                    settings.update(saved_settings)
-            except:
-                pass
-        return settings
+        return self.settings_store.all()
 
     def save_settings(self) -> None:
-        """Ayarları kaydet"""
-        with open(self.settings_file, 'w') as f:
-            json.dump(self.settings, f)
+        """Ayarları kaydet ve aboneleri bilgilendir"""
+        self.settings_store.update(self.settings)
 
     def draw_slider(self, x: int, y: int, value: float, label: str) -> pygame.Rect:
         """Slider çizer ve dikdörtgenini döndürür"""
         # Etiketi çiz
-        text = self.font.render(label, True, self.TEXT_COLOR)
+        text = render_text(label, 36, self.TEXT_COLOR)
         text_rect = text.get_rect(x=x, y=y)
         self.screen.blit(text, text_rect)
         
@@ -90,9 +87,9 @@ class Settings:
         if label == "Klasik Mod FPS":
             fps_value = int(value * 55 + 5)  # 5-60 FPS aralığı
             fps_value = max(5, min(60, fps_value))  # FPS değerini sınırla
-            value_text = self.font.render(f"{fps_value}", True, self.TEXT_COLOR)
+            value_text = render_text(f"{fps_value}", 36, self.TEXT_COLOR)
         else:
-            value_text = self.font.render(f"{int(value * 100)}%", True, self.TEXT_COLOR)
+            value_text = render_text(f"{int(value * 100)}%", 36, self.TEXT_COLOR)
         value_text_rect = value_text.get_rect(x=x + self.slider_width + 20, centery=y + 30 + self.slider_height//2)
         self.screen.blit(value_text, value_text_rect)
         
@@ -117,70 +114,71 @@ class Settings:
             
             self.settings[name] = value
 
+    def build_background(self) -> None:
+        """Değişmeyen başlık ve geri dön butonunu bir kez çizer"""
+        self.background = pygame.Surface((self.width, self.height))
+        self.background.fill(self.BACKGROUND_COLOR)
+        
+        # Başlık
+        title = self.font.render("Ses Ayarları", True, self.TEXT_COLOR)
+        title_rect = title.get_rect(center=(self.width/2, 50))
+        self.background.blit(title, title_rect)
+        
+        # Geri dön butonu
+        pygame.draw.rect(self.background, self.BUTTON_COLOR, self.back_button)
+        text = self.font.render("Geri Dön", True, self.TEXT_COLOR)
+        text_rect = text.get_rect(center=self.back_button.center)
+        self.background.blit(text, text_rect)
+
+    def draw_toggle(self, button: pygame.Rect, text: str) -> None:
+        """Açma/kapama butonunu çizer"""
+        pygame.draw.rect(self.screen, self.BUTTON_COLOR, button)
+        text_surface = render_text(text, 36, self.TEXT_COLOR)
+        text_rect = text_surface.get_rect(center=button.center)
+        self.screen.blit(text_surface, text_rect)
+
+    def draw(self) -> Dict[str, pygame.Rect]:
+        """Ayarlar ekranını çizer ve slider dikdörtgenlerini döndürür"""
+        slider_rects = {}
+        self.screen.blit(self.background, (0, 0))
+        
+        # Sliderları çiz
+        x = self.width//2 - self.slider_width//2
+        slider_rects['eat_sound_volume'] = self.draw_slider(
+            x, self.y_start, self.settings['eat_sound_volume'], "Yem Sesi")
+        
+        slider_rects['crash_sound_volume'] = self.draw_slider(
+            x, self.y_start + self.y_spacing, self.settings['crash_sound_volume'], "Çarpışma Sesi")
+        
+        slider_rects['move_sound_volume'] = self.draw_slider(
+            x, self.y_start + self.y_spacing * 2, self.settings['move_sound_volume'], "Hareket Sesi")
+        
+        # Klasik Mod FPS ayarı
+        fps_value = (self.settings.get('classic_fps', 10) - 5) / 55  # 5-60 FPS aralığını 0-1'e dönüştür
+        slider_rects['classic_fps'] = self.draw_slider(
+            x, self.y_start + self.y_spacing * 3, fps_value, "Klasik Mod FPS")
+        
+        # Klasik ve AI Mod ses açma/kapama butonları
+        self.draw_toggle(self.classic_sound_button,
+                         f"Klasik Mod Ses: {'Açık' if self.settings['classic_sound_enabled'] else 'Kapalı'}")
+        self.draw_toggle(self.ai_sound_button,
+                         f"AI Mod Ses: {'Açık' if self.settings['ai_sound_enabled'] else 'Kapalı'}")
+        
+        pygame.display.flip()
+        return slider_rects
+
     def run(self) -> str:
-        """Ayarlar menüsünü çalıştırır"""
+        """Ayarlar menüsünü çalıştırır (yalnızca ayarlar değiştiğinde yeniden çizer)"""
         clock = pygame.time.Clock()
         running = True
+        self.settings = self.load_settings()
+        drawn_settings = None
+        slider_rects = {}
         
         while running:
-            slider_rects = {}
-            self.screen.fill(self.BACKGROUND_COLOR)
-            
-            # Başlık
-            title = self.font.render("Ses Ayarları", True, self.TEXT_COLOR)
-            title_rect = title.get_rect(center=(self.width/2, 50))
-            self.screen.blit(title, title_rect)
-            
-            # Sliderları çiz
-            y_start = 100  # Başlangıç y pozisyonunu yukarı çektik
-            y_spacing = 70  # Elemanlar arası boşluğu azalttık
-            
-            slider_rects['eat_sound_volume'] = self.draw_slider(
-                self.width//2 - self.slider_width//2, y_start, 
-                self.settings['eat_sound_volume'], "Yem Sesi")
-            
-            slider_rects['crash_sound_volume'] = self.draw_slider(
-                self.width//2 - self.slider_width//2, y_start + y_spacing, 
-                self.settings['crash_sound_volume'], "Çarpışma Sesi")
-            
-            slider_rects['move_sound_volume'] = self.draw_slider(
-                self.width//2 - self.slider_width//2, y_start + y_spacing * 2, 
-                self.settings['move_sound_volume'], "Hareket Sesi")
-            
-            # Klasik Mod FPS ayarı
-            fps_value = (self.settings.get('classic_fps', 10) - 5) / 55  # 5-60 FPS aralığını 0-1'e dönüştür
-            slider_rects['classic_fps'] = self.draw_slider(
-                self.width//2 - self.slider_width//2, y_start + y_spacing * 3,
-                fps_value, "Klasik Mod FPS")
-            
-            # Butonlar için y pozisyonları
-            button_y_start = y_start + y_spacing * 4
-            button_spacing = 60
-            
-            # Klasik Mod ses açma/kapama butonu
-            classic_sound_text = f"Klasik Mod Ses: {'Açık' if self.settings['classic_sound_enabled'] else 'Kapalı'}"
-            classic_sound_button = pygame.Rect(self.width//2 - 150, button_y_start, 300, 40)
-            pygame.draw.rect(self.screen, self.BUTTON_COLOR, classic_sound_button)
-            text = self.font.render(classic_sound_text, True, self.TEXT_COLOR)
-            text_rect = text.get_rect(center=classic_sound_button.center)
-            self.screen.blit(text, text_rect)
-            
-            # AI Mod ses açma/kapama butonu
-            ai_sound_text = f"AI Mod Ses: {'Açık' if self.settings['ai_sound_enabled'] else 'Kapalı'}"
-            ai_sound_button = pygame.Rect(self.width//2 - 150, button_y_start + button_spacing, 300, 40)
-            pygame.draw.rect(self.screen, self.BUTTON_COLOR, ai_sound_button)
-            text = self.font.render(ai_sound_text, True, self.TEXT_COLOR)
-            text_rect = text.get_rect(center=ai_sound_button.center)
-            self.screen.blit(text, text_rect)
-            
-            # Geri dön butonu
-            back_button = pygame.Rect(self.width//2 - 100, button_y_start + button_spacing * 2, 200, 40)
-            pygame.draw.rect(self.screen, self.BUTTON_COLOR, back_button)
-            text = self.font.render("Geri Dön", True, self.TEXT_COLOR)
-            text_rect = text.get_rect(center=back_button.center)
-            self.screen.blit(text, text_rect)
-            
-            pygame.display.flip()
+            if self.settings != drawn_settings:
+                slider_rects = self.draw()
+                drawn_settings = dict(self.settings)
             
             # Event handling
             for event in pygame.event.get():
@@ -188,13 +186,16 @@ class Settings:
                     self.save_settings()
                     return "QUIT"
                 
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE):
+                    drawn_settings = None  # Pencere yeniden çizilmeli
+                
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Sol tık
-                        if classic_sound_button.collidepoint(event.pos):
+                        if self.classic_sound_button.collidepoint(event.pos):
                             self.settings['classic_sound_enabled'] = not self.settings['classic_sound_enabled']
-                        elif ai_sound_button.collidepoint(event.pos):
+                        elif self.ai_sound_button.collidepoint(event.pos):
                             self.settings['ai_sound_enabled'] = not self.settings['ai_sound_enabled']
-                        elif back_button.collidepoint(event.pos):
+                        elif self.back_button.collidepoint(event.pos):
                             self.save_settings()
                             return "MENU"
                         else:
@@ -223,4 +224,4 @@ class Settings:
             
             clock.tick(60)
         
-        return None 
\ No newline at end of file
+        return None
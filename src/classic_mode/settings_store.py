@@ -0,0 +1,94 @@
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Varsayılan ayarlar
+DEFAULT_SETTINGS = {
+    'eat_sound_volume': 0.5,
+    'crash_sound_volume': 0.3,
+    'move_sound_volume': 0.1,
+    'classic_sound_enabled': True,
+    'ai_sound_enabled': True,
+    'classic_fps': 10  # Klasik mod için varsayılan FPS
+}
+
+class SettingsStore:
+    """Uygulama içinde paylaşılan ayar servisi.
+
+    Ayarlar bir kez dosyadan okunur ve bellekte tutulur. `update` değerleri
+    değiştirip dosyaya yazar; `poll` dosyanın dışarıdan değişip
+    değişmediğini en fazla `poll_interval` saniyede bir mtime ile kontrol
+    eder. Aboneler yalnızca değerler gerçekten değiştiğinde çağrılır.
+    """
+
+    def __init__(self, path: str = "data/settings.json",
+                 defaults: Optional[Dict[str, Any]] = None, poll_interval: float = 1.0):
+        self.path = path
+        self.defaults = dict(DEFAULT_SETTINGS if defaults is None else defaults)
+        self.poll_interval = poll_interval
+        self._values = dict(self.defaults)
+        self._mtime = None
+        self._last_poll = time.monotonic()
+        self._subscribers: List[Callable[[Dict[str, Any]], None]] = []
+        self.reload()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def all(self) -> Dict[str, Any]:
+        """Ayarların bir kopyasını döndürür"""
+        return dict(self._values)
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Ayarlar değiştiğinde tüm ayarlarla çağrılacak fonksiyonu ekler"""
+        self._subscribers.append(callback)
+
+    def _set(self, values: Dict[str, Any]) -> None:
+        """Yeni değerleri uygular ve değiştiyse aboneleri bilgilendirir"""
+        if values == self._values:
+            return
+        self._values = values
+        for callback in self._subscribers:
+            callback(self.all())
+
+    def _stat_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload(self) -> None:
+        """Ayarları dosyadan yeniden okur (eksikler varsayılanla doldurulur)"""
+        values = dict(self.defaults)
+        self._mtime = self._stat_mtime()
+        try:
+            with open(self.path, 'r') as f:
+                values.update(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            pass
+        self._set(values)
+
+    def update(self, values: Dict[str, Any], save: bool = True) -> None:
+        """Ayarları günceller ve (istenirse) dosyaya kaydeder"""
+        new_values = dict(self._values)
+        new_values.update(values)
+        if save:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(new_values, f)
+            os.replace(tmp_path, self.path)
+            self._mtime = self._stat_mtime()
+        self._set(new_values)
+
+    def poll(self) -> None:
+        """Dosya dışarıdan değiştiyse ayarları yeniden yükler (düşük frekansta)"""
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = now
+        if self._stat_mtime() != self._mtime:
+            self.reload()
@@ -1,11 +1,87 @@
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+from collections import deque
+from itertools import islice
 import pygame
 import random
 
+class SnakeBody:
+    """Yılan gövdesi: baştan kuyruğa deque ve hücre başına doluluk sayacı.
+
+    Baş/kuyruk ekleme-çıkarma ve `hücre in gövde` kontrolü O(1)'dir.
+    İndeksleme, döngü ve `len` liste gibi çalışır; dilimleme liste döndürür.
+    Bir hücre boşken dolduğunda veya tamamen boşaldığında eklenen
+    dinleyicilerin `cell_occupied` / `cell_vacated` metotları çağrılır.
+    """
+
+    def __init__(self, cells: Iterable[Tuple[int, int]] = ()):
+        self._cells = deque()
+        self._counts: Dict[Tuple[int, int], int] = {}
+        self._listeners = []
+        for cell in cells:
+            self.append(cell)
+
+    def add_listener(self, listener) -> None:
+        """Doluluk değişikliklerini dinleyecek nesneyi ekler"""
+        self._listeners.append(listener)
+
+    def _occupy(self, cell: Tuple[int, int]) -> None:
+        count = self._counts.get(cell, 0)
+        self._counts[cell] = count + 1
+        if count == 0:
+            for listener in self._listeners:
+                listener.cell_occupied(cell)
+
+    def appendleft(self, cell: Tuple[int, int]) -> None:
+        """Başa yeni hücre ekler"""
+        self._cells.appendleft(cell)
+        self._occupy(cell)
+
+    def append(self, cell: Tuple[int, int]) -> None:
+        """Kuyruğa yeni hücre ekler"""
+        self._cells.append(cell)
+        self._occupy(cell)
+
+    def pop(self) -> Tuple[int, int]:
+        """Kuyruk hücresini çıkarır ve döndürür"""
+        cell = self._cells.pop()
+        count = self._counts[cell] - 1
+        if count:
+            self._counts[cell] = count
+        else:
+            del self._counts[cell]
+            for listener in self._listeners:
+                listener.cell_vacated(cell)
+        return cell
+
+    def count(self, cell: Tuple[int, int]) -> int:
+        """Hücrenin gövdede kaç kez bulunduğunu döndürür"""
+        return self._counts.get(cell, 0)
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return cell in self._counts
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self._cells)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[int, int], List[Tuple[int, int]]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._cells))
+            return list(islice(self._cells, start, stop, step))
+        return self._cells[index]
+
+    def __eq__(self, other) -> bool:
+        return list(self._cells) == list(other)
+
+    def __repr__(self) -> str:
+        return f"SnakeBody({list(self._cells)!r})"
+
 class Snake:
     def __init__(self, start_pos: Tuple[int, int], block_size: int = 20):
         self.block_size = block_size
-        self.body = [start_pos]  # Yılanın vücut parçalarının pozisyonları
+        self.body = SnakeBody([start_pos])  # Yılanın vücut parçalarının pozisyonları
         self.direction = [block_size, 0]  # Başlangıçta sağa doğru hareket
         self.grow = False
 
@@ -16,7 +92,7 @@ class Snake:
             self.body[0][1] + self.direction[1]
         )
         
-        self.body.insert(0, new_head)
+        self.body.appendleft(new_head)
         if not self.grow:
             self.body.pop()
         self.grow = False
@@ -40,30 +116,39 @@ class Snake:
         if head[0] < 0 or head[0] >= width or head[1] < 0 or head[1] >= height:
             return True
             
-        # Kendi vücuduyla çarpışma kontrolü
-        if head in self.body[1:]:
+        # Kendi vücuduyla çarpışma kontrolü (baş gövdede ikinci kez varsa)
+        if self.body.count(head) > 1:
             return True
             
         return False
 
+    def occupies(self, position: Tuple[int, int]) -> bool:
+        """Verilen hücrede yılanın bir parçası olup olmadığını döndürür"""
+        return position in self.body
+
+    def draw_segment(self, screen: pygame.Surface, segment: Tuple[int, int],
+                     color: Tuple[int, int, int], is_head: bool = False) -> None:
+        """Tek bir gövde parçasını çizer"""
+        # Baş kısmı için daha koyu bir renk kullan
+        segment_color = (
+            max(0, color[0] - 20),
+            max(0, color[1] - 20),
+            max(0, color[2] - 20)
+        ) if is_head else color
+        
+        pygame.draw.rect(
+            screen,
+            segment_color,
+            pygame.Rect(
+                segment[0],
+                segment[1],
+                self.block_size - 2,  # Bloklar arası boşluk için -2
+                self.block_size - 2
+            ),
+            border_radius=3  # Yuvarlatılmış köşeler
+        )
+
     def draw(self, screen: pygame.Surface, color: Tuple[int, int, int] = (0, 255, 0)) -> None:
         """Yılanı ekrana çizer"""
         for i, segment in enumerate(self.body):
-            # Baş kısmı için daha koyu bir renk kullan
-            segment_color = (
-                max(0, color[0] - 20),
-                max(0, color[1] - 20),
-                max(0, color[2] - 20)
-            ) if i == 0 else color
-            
-            pygame.draw.rect(
-                screen,
-                segment_color,
-                pygame.Rect(
-                    segment[0],
-                    segment[1],
-                    self.block_size - 2,  # Bloklar arası boşluk için -2
-                    self.block_size - 2
-                ),
-                border_radius=3  # Yuvarlatılmış köşeler
-            ) 
\ No newline at end of file
+            self.draw_segment(screen, segment, color, i == 0)
@@ -0,0 +1,100 @@
+import pygame
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Optional
+
+# Ses adı -> (frekans Hz, süre sn, genlik 0-1)
+TONES = {
+    'eat': (1000, 0.1, 1.0),    # Yem yeme sesi (yüksek tonlu bip)
+    'crash': (500, 0.2, 1.0),   # Çarpışma sesi (düşük tonlu bip)
+    'move': (800, 0.05, 0.5)    # Hareket sesi (çok kısa, daha kısık bip)
+}
+
+@lru_cache(maxsize=None)
+def tone_samples(frequency: int, duration: float, amplitude: float, samplerate: int) -> np.ndarray:
+    """-1..1 aralığında sinüs dalgası örnekleri"""
+    t = np.arange(int(samplerate * duration)) / samplerate
+    return np.sin(2 * np.pi * frequency * t) * amplitude
+
+def to_mixer_format(samples: np.ndarray, sample_format: int, channels: int) -> np.ndarray:
+    """Örnekleri mikserin örnek biçimine ve kanal sayısına dönüştürür"""
+    if sample_format == -16:
+        data = (samples * 32767).astype(np.int16)
+    elif sample_format == 16:
+        data = ((samples + 1) * 32767).astype(np.uint16)
+    elif sample_format == -8:
+        data = (samples * 127).astype(np.int8)
+    elif sample_format == 8:
+        data = ((samples + 1) * 127).astype(np.uint8)
+    elif sample_format == -32:
+        data = (samples * 2147483647).astype(np.int32)
+    else:  # 32: kayan noktalı
+        data = samples.astype(np.float32)
+    if channels > 1:
+        data = np.repeat(data[:, None], channels, axis=1)
+    return np.ascontiguousarray(data)
+
+class SoundBank:
+    """Tüm ekranların paylaştığı ses kaynakları.
+
+    Tonlar diske yazılıp okunmadan bellekte `pygame.sndarray` ile bir kez
+    sentezlenir. Ses seviyeleri her ekranın kendi `SoundPlayer`'ında tutulur
+    ve çalma sırasında kanal seviyesi olarak uygulanır; böylece paylaşılan
+    `Sound` nesneleri değiştirilmez.
+    """
+
+    def __init__(self):
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.available = self.init_mixer()
+
+    def init_mixer(self) -> bool:
+        """Mikseri (henüz açılmadıysa) bir kez başlatır"""
+        if pygame.mixer.get_init():
+            return True
+        try:
+            pygame.mixer.init()
+            return True
+        except pygame.error as e:
+            print(f"Ses sistemi başlatılamadı: {e}")
+            return False
+
+    def get(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """Adı verilen sesi döndürür (ilk istekte sentezlenir)"""
+        if not self.available:
+            return None
+        sound = self.sounds.get(name)
+        if sound is None:
+            samplerate, sample_format, channels = pygame.mixer.get_init()
+            samples = tone_samples(*TONES[name], samplerate)
+            sound = pygame.sndarray.make_sound(to_mixer_format(samples, sample_format, channels))
+            self.sounds[name] = sound
+        return sound
+
+    def player(self, volumes: Optional[Dict[str, float]] = None) -> 'SoundPlayer':
+        """Kendi ses seviyeleri olan bir oynatıcı oluşturur"""
+        return SoundPlayer(self, volumes)
+
+class SoundPlayer:
+    """Bir ekranın paylaşılan seslere kendi ses seviyeleriyle erişimi"""
+
+    def __init__(self, bank: SoundBank, volumes: Optional[Dict[str, float]] = None):
+        self.bank = bank
+        self.volumes = {name: 1.0 for name in TONES}
+        self.volumes.update(volumes or {})
+        # Sesleri ilk çalmada takılma olmasın diye önceden hazırla
+        for name in TONES:
+            bank.get(name)
+
+    def set_volume(self, name: str, volume: float) -> None:
+        self.volumes[name] = volume
+
+    def play(self, name: str) -> None:
+        """Sesi bu oynatıcının seviyesiyle boş bir kanalda çalar"""
+        sound = self.bank.get(name)
+        if sound is None:
+            return
+        channel = pygame.mixer.find_channel()
+        if channel is None:
+            return  # Tüm kanallar meşgul
+        channel.set_volume(self.volumes[name])
+        channel.play(sound)
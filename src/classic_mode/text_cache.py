@@ -0,0 +1,32 @@
+import pygame
+from functools import lru_cache
+from typing import Tuple
+
+# Paylaşılan font, metin ve katman yüzeyi önbellekleri.
+# Döndürülen yüzeyler paylaşıldığı için çağıranlar üzerlerine çizmemelidir.
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> pygame.font.Font:
+    """Verilen boyuttaki varsayılan fontu döndürür (her boyut bir kez oluşturulur)"""
+    return pygame.font.Font(None, size)
+
+@lru_cache(maxsize=512)
+def render_text(text: str, size: int, color: Tuple[int, int, int],
+                antialias: bool = True) -> pygame.Surface:
+    """Metni çizer; aynı (metin, boyut, renk) için en son kullanılan yüzeyleri saklar"""
+    return get_font(size).render(text, antialias, color)
+
+@lru_cache(maxsize=8)
+def overlay_surface(size: Tuple[int, int], alpha: int,
+                    color: Tuple[int, int, int] = (0, 0, 0)) -> pygame.Surface:
+    """Yarı saydam tam ekran katman yüzeyini döndürür"""
+    surface = pygame.Surface(size)
+    surface.set_alpha(alpha)
+    surface.fill(color)
+    return surface
+
+def clear_caches() -> None:
+    """Tüm önbellekleri boşaltır (pygame yeniden başlatıldığında çağrılmalı)"""
+    get_font.cache_clear()
+    render_text.cache_clear()
+    overlay_surface.cache_clear()
@@ -1,46 +1,88 @@
+import time
+startup_time = time.perf_counter()  # Açılış süresi ölçümü için
+
+import argparse
+import threading
 import pygame
 from classic_mode.menu import Menu
-from classic_mode.game import Game
-from classic_mode.settings import Settings
-from classic_mode.controls import Controls
-from ai_mode.game import AIGame
+from classic_mode.settings_store import SettingsStore
+
+def warmup_ai() -> None:
+    """AI modülünü (ve torch'u) menü gösterilirken arka planda içe aktarır"""
+    try:
+        import ai_mode.game  # noqa: F401
+    except Exception as e:
+        print(f"AI modu önceden yüklenemedi: {e}")
 
-def main():
+def main(warmup: bool = True):
     pygame.init()
-    
+
     # Pencere boyutları
     width = 800
     height = 600
-    
-    # Menü ve oyun nesneleri
+
+    # Tüm ekranların paylaştığı ayar servisi
+    settings_store = SettingsStore("data/settings.json")
+
+    # Oyun ekranlarının paylaştığı ses bankası (ilk oyun ekranında oluşturulur)
+    shared = {}
+
+    def sound_bank():
+        if 'sound_bank' not in shared:
+            from classic_mode.sound_bank import SoundBank
+            shared['sound_bank'] = SoundBank()
+        return shared['sound_bank']
+
+    def create_game():
+        from classic_mode.game import Game
+        return Game(width, height, settings_store, sound_bank())
+
+    def create_ai_game():
+        # torch yalnızca AI moduna ilk girişte (veya arka plan ısınmasında) yüklenir
+        from ai_mode.game import AIGame
+        return AIGame(width, height, settings_store, sound_bank())
+
+    def create_settings():
+        from classic_mode.settings import Settings
+        return Settings(width, height, settings_store)
+
+    def create_controls():
+        from classic_mode.controls import Controls
+        return Controls(width, height)
+
+    # Ekranlar ilk kez açıldıklarında oluşturulur
+    factories = {
+        'Klasik Mod': create_game,
+        'AI Mod': create_ai_game,
+        'Ayarlar': create_settings,
+        'Kontroller': create_controls
+    }
+    screens = {}
+
     menu = Menu(width, height)
-    game = Game(width, height)
-    ai_game = AIGame(width, height)
-    settings = Settings(width, height)
-    controls = Controls(width, height)
-    
+    menu.draw()
+    print(f"Açılış süresi: {time.perf_counter() - startup_time:.2f} sn")
+
+    if warmup:
+        threading.Thread(target=warmup_ai, name="ai-warmup", daemon=True).start()
+
     current_screen = 'MENU'
-    
+
     while True:
         if current_screen == 'MENU':
             current_screen = menu.run()
-        elif current_screen == 'Klasik Mod':
-            current_screen = game.run()
-        elif current_screen == 'AI Mod':
-            current_screen = ai_game.run()
-        elif current_screen == 'Ayarlar':
-            current_screen = settings.run()
-            if current_screen == 'MENU':
-                # Ayarları yükle
-                game_settings = settings.settings
-                game.load_settings(game_settings)
-                ai_game.load_settings(game_settings)
-        elif current_screen == 'Kontroller':
-            current_screen = controls.run()
+        elif current_screen in factories:
+            if current_screen not in screens:
+                screens[current_screen] = factories[current_screen]()
+            current_screen = screens[current_screen].run()
         elif current_screen == 'QUIT':
             break
-    
+
     pygame.quit()
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Yılan Oyunu")
+    parser.add_argument('--no-warmup', action='store_true',
+                        help="AI modunu menüdeyken arka planda önceden yükleme")
+    args = parser.parse_args()
+    main(warmup=not args.no_warmup)
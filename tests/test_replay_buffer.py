@@ -0,0 +1,110 @@
+import numpy as np
+
+from src.ai_mode.replay_buffer import NStepAccumulator, PrioritizedReplayBuffer, SumTree
+
+def test_sum_tree_find_is_proportional_to_priorities():
+    tree = SumTree(6)  # İkinin kuvveti olmayan kapasite: boş yapraklar da var
+    priorities = np.array([1.0, 2.0, 0.0, 3.0, 4.0, 0.0])
+    tree.update(np.arange(6), priorities)
+
+    rng = np.random.default_rng(0)
+    leaves = tree.find(rng.random(200000) * tree.total)
+    counts = np.bincount(leaves, minlength=tree.leaf_offset)
+
+    assert counts[6:].sum() == 0  # Kapasite dışındaki yapraklar seçilmez
+    assert counts[2] == 0 and counts[5] == 0  # Sıfır öncelik hiç seçilmez
+    np.testing.assert_allclose(counts[:6] / len(leaves), priorities / priorities.sum(), atol=0.005)
+
+def test_sum_tree_duplicate_indices_keep_sums_consistent():
+    tree = SumTree(8)
+    tree.update(np.arange(8), np.ones(8))
+    # Aynı yaprak tek çağrıda iki kez: son değer geçerli olmalı
+    tree.update(np.array([3, 3, 5, 3]), np.array([10.0, 7.0, 2.0, 4.0]))
+
+    leaves = tree.get(np.arange(8))
+    assert leaves[3] == 4.0 and leaves[5] == 2.0
+    assert tree.total == leaves.sum()
+    internal = np.arange(1, tree.leaf_offset)
+    np.testing.assert_array_equal(tree.tree[internal],
+                                  tree.tree[2 * internal] + tree.tree[2 * internal + 1])
+
+def test_prioritized_sampling_stays_in_filled_region():
+    buffer = PrioritizedReplayBuffer(10, 2, seed=0)
+    for _ in range(3):
+        buffer.add(np.zeros(2), 0, 0.0, np.zeros(2), False, 0.95)
+    # Kökteki kayan nokta kayması: toplamın ucundaki değerler boş yapraklara iner
+    buffer.tree.tree[1] += 0.5
+    assert buffer.tree.find(np.array([buffer.tree.total]))[0] >= buffer.size
+    for _ in range(200):
+        assert buffer.sample_indices(32).max() < buffer.size
+
+def naive_n_step(states, actions, rewards, dones, n, gamma):
+    """Tahta tahta, adım adım n adımlık geçişler (karşılaştırma için basit tanım)"""
+    transitions = []
+    steps, boards = actions.shape
+    for b in range(boards):
+        episode_start = 0
+        for t in range(steps):
+            if dones[t, b]:
+                starts, done = range(max(episode_start, t - n + 1), t + 1), 1.0
+            elif t - n + 1 >= episode_start:
+                starts, done = [t - n + 1], 0.0
+            else:
+                starts = []
+            for s in starts:
+                ret = sum(gamma ** (k - s) * rewards[k, b] for k in range(s, t + 1))
+                transitions.append((b, s, tuple(states[s, b]), actions[s, b], ret,
+                                    tuple(states[t + 1, b]), done, gamma ** (t + 1 - s)))
+            if dones[t, b]:
+                episode_start = t + 1
+    return transitions
+
+def run_accumulator(states, actions, rewards, dones, n, gamma):
+    accumulator = NStepAccumulator(actions.shape[1], n, gamma, states.shape[2])
+    transitions = []
+    for t in range(len(actions)):
+        out = accumulator.add(states[t], actions[t], rewards[t], states[t + 1], dones[t])
+        for i in range(len(out[1])):
+            transitions.append((tuple(out[0][i]), out[1][i], out[2][i], tuple(out[3][i]),
+                                out[4][i], out[5][i]))
+    return transitions
+
+def test_n_step_accumulator_matches_naive_loop():
+    rng = np.random.default_rng(0)
+    steps, boards, gamma = 60, 4, 0.9
+    # Durumlar (adım, tahta) çiftini kodlar, böylece her geçişin başlangıcı tanınır
+    states = np.stack([np.stack([np.full(2, 100 * t + b) for b in range(boards)])
+                       for t in range(steps + 1)]).astype(np.float32)
+    actions = rng.integers(0, 4, (steps, boards))
+    rewards = rng.choice(np.array([-10.0, -0.1, 0.1, 10.0], dtype=np.float32), (steps, boards))
+    dones = rng.random((steps, boards)) < 0.1
+    dones[1, 0] = True  # Pencere dolmadan biten bölüm
+    dones[6:9, 1] = True  # Art arda biten tek adımlık bölümler
+    dones[:, 3] = False  # Hiç bitmeyen tahta
+
+    for n in (1, 3, 5):
+        got = run_accumulator(states, actions, rewards, dones, n, gamma)
+        expected = naive_n_step(states, actions, rewards, dones, n, gamma)
+        assert len(got) == len(expected)
+        got.sort(key=lambda x: x[0])
+        expected.sort(key=lambda x: x[2])
+        for g, e in zip(got, expected):
+            assert g[0] == e[2] and g[1] == e[3] and g[3] == e[5] and g[4] == e[6]
+            assert np.isclose(g[2], e[4], atol=1e-4)
+            assert np.isclose(g[5], e[7])
+
+def test_n_step_accumulator_truncates_open_starts_on_done():
+    accumulator = NStepAccumulator(1, 3, 0.5, 1)
+    s = [np.array([[float(i)]], dtype=np.float32) for i in range(3)]
+    first = accumulator.add(s[0], np.array([0]), np.array([1.0]), s[1], np.array([False]))
+    assert len(first[1]) == 0  # Pencere henüz dolmadı
+
+    states, actions, returns, next_states, dones, discounts = accumulator.add(
+        s[1], np.array([1]), np.array([2.0]), s[2], np.array([True]))
+    order = np.argsort(states[:, 0])
+    np.testing.assert_array_equal(states[order, 0], [0.0, 1.0])
+    np.testing.assert_allclose(returns[order], [1.0 + 0.5 * 2.0, 2.0])
+    np.testing.assert_array_equal(next_states[:, 0], [2.0, 2.0])
+    np.testing.assert_array_equal(dones, [1.0, 1.0])
+    np.testing.assert_allclose(discounts[order], [0.25, 0.5])
+    assert accumulator.pending[0] == 0  # Yeni bölüm boş pencereyle başlar